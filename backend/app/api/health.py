@@ -0,0 +1,43 @@
+# backend/app/api/health.py
+import asyncio
+import os
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from app.services import db, warmup
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+HEALTH_DB_TIMEOUT = float(os.getenv("HEALTH_DB_TIMEOUT", "2"))
+
+
+@router.get("/live")
+def live():
+    """The process is up and serving; touches no models or databases."""
+    return {"status": "alive"}
+
+
+@router.get("/ready")
+async def ready():
+    """
+    Ready to take traffic: Mongo answers a ping and, with WARMUP_ON_STARTUP,
+    the warm-up has finished, the spaCy model loaded and the skill index
+    built. 503 otherwise.
+    Without warm-up, models load on first use and are only reported.
+    """
+    body = warmup.state()
+    problems = []
+    if warmup.WARMUP_ON_STARTUP:
+        if body["warmup"]["status"] != "done":
+            problems.append("warming up")
+        elif not body["models"]["nlp"]:
+            problems.append("spaCy model failed to load")
+        if not body["models"]["skill_index"]:
+            problems.append("building skill index")
+    try:
+        await asyncio.wait_for(db.ping(), HEALTH_DB_TIMEOUT)
+    except Exception as e:
+        problems.append(f"mongo unreachable: {e or type(e).__name__}")
+
+    if problems:
+        return JSONResponse(status_code=503, content={"status": "not_ready", "problems": problems, **body})
+    return {"status": "ready", **body}
@@ -1,48 +1,115 @@
-
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
-from app.services.job_fetcher import fetch_jobs_serpapi
-from app.services.skill_extractor import extract_skills_from_text   # <-- add this
+from functools import partial
+from fastapi import APIRouter, HTTPException, Query, Response
+from typing import List, Literal, Optional
+from pymongo import DESCENDING
+from app.models.job_model import BulkFetchRequest
+from app.services.job_fetcher import fetch_jobs_serpapi, fetch_many
+from app.services.job_store import list_filter, list_projection, store_jobs
 from app.services.db import db
+from app.services.task_queue import task_queue
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
 
+async def _fetch_and_store(query: str, location: str, limit: int):
+    try:
+        jobs = await fetch_jobs_serpapi(query, location, limit)
+        if not jobs:
+            raise HTTPException(status_code=404, detail="No jobs found")
+
+        stored = await store_jobs(jobs)
+
+        return {"fetched": len(jobs), **stored}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/fetch")
-def fetch_and_store_jobs(
+async def fetch_and_store_jobs(
+    response: Response,
     query: str = Query(..., description="Job keyword, e.g. 'Data Scientist'"),
     location: str = Query("India", description="Job location"),
-    limit: int = Query(10, description="Number of jobs to fetch")
+    limit: int = Query(10, description="Number of jobs to fetch"),
+    async_mode: bool = Query(False, description="Queue the fetch and return a task id; poll GET /tasks/{task_id}"),
 ):
-    try:
-        jobs = fetch_jobs_serpapi(query, location, limit)
-        if not jobs:
-            raise HTTPException(status_code=404, detail="No jobs found")
+    if async_mode:
+        task = task_queue.submit(
+            "jobs.fetch", partial(_fetch_and_store, query, location, limit),
+            dedupe_key=("jobs.fetch", query.strip().lower(), location.strip().lower(), limit),
+        )
+        response.status_code = 202
+        return {"task_id": task["task_id"], "status": task["status"]}
+    return await _fetch_and_store(query, location, limit)
+
 
-        # Add extracted skills to each job
-        for job in jobs:
-             desc = job.get("description", "")
-             highlights = " ".join(sum(job.get("job_highlights", []), [])) if job.get("job_highlights") else ""
-             combined_text = desc + " " + highlights
-             job["skills"] = extract_skills_from_text(combined_text)  # <-- skills extracted here
-             job["skills_extracted"] = True if job["skills"] else False
+@router.post("/fetch/bulk")
+async def fetch_and_store_jobs_bulk(payload: BulkFetchRequest):
+    """
+    Fetch several (query, location) searches concurrently, paging each up to
+    `limit` jobs. Every results page is skill-extracted and upserted as soon
+    as it arrives rather than after all searches finish.
+    """
+    try:
+        searches = {}
+        for s in payload.searches:
+            searches[(s.query, s.location)] = {
+                "query": s.query, "location": s.location, "fetched": 0, "inserted": 0, "updated": 0, "skipped": 0,
+            }
 
-        result = db.jobs.insert_many(jobs)
+        inserted_ids, updated_ids = [], []
+        async for page in fetch_many(searches.keys(), payload.limit):
+            summary = searches[(page["query"], page["location"])]
+            if "error" in page:
+                summary["error"] = page["error"]
+                continue
+            stored = await store_jobs(page["jobs"])
+            summary["fetched"] += len(page["jobs"])
+            for key in ("inserted", "updated", "skipped"):
+                summary[key] += stored[key]
+            inserted_ids.extend(stored["inserted_ids"])
+            updated_ids.extend(stored["updated_ids"])
 
+        totals = {key: sum(s[key] for s in searches.values()) for key in ("fetched", "inserted", "updated", "skipped")}
         return {
-            "fetched": len(jobs),
-            "inserted_ids": [str(i) for i in result.inserted_ids]
+            **totals,
+            "searches": list(searches.values()),
+            "inserted_ids": inserted_ids,
+            "updated_ids": updated_ids,
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+def _csv(value: Optional[str]) -> List[str]:
+    return [v.strip() for v in (value or "").split(",") if v.strip()]
+
+
 @router.get("/list")
-def list_jobs(limit: int = Query(20, ge=1, le=100, description="Max jobs to return")):
+async def list_jobs(
+    limit: int = Query(20, ge=1, le=100, description="Max jobs to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skills: Optional[str] = Query(None, description="Comma-separated skills, e.g. 'python,docker'"),
+    skill_match: Literal["all", "any"] = Query("all", description="Require all skills or any of them"),
+    location: Optional[str] = Query(None, description="Location prefix, e.g. 'Bengaluru'"),
+    company: Optional[str] = Query(None, description="Company name prefix"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. 'title,company,skills'"),
+):
+    """Newest jobs first, paged with an _id cursor; pass next_cursor back to get the next page."""
     try:
-        jobs_cursor = db.jobs.find().limit(limit)
-        jobs = []
-        for job in jobs_cursor:
-            job["_id"] = str(job["_id"])
-            jobs.append(job)
-        return {"jobs": jobs}
+        query = list_filter(cursor, _csv(skills), skill_match, location, company)
+        projection = list_projection(_csv(fields))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        # one extra document tells us whether there is a next page
+        docs = await db.jobs.find(query, projection).sort("_id", DESCENDING).limit(limit + 1).to_list(limit + 1)
+        has_more = len(docs) > limit
+        docs = docs[:limit]
+        for doc in docs:
+            doc["_id"] = str(doc["_id"])
+        return {"jobs": docs, "next_cursor": docs[-1]["_id"] if has_more else None}
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
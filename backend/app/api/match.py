@@ -1,13 +1,36 @@
-from fastapi import APIRouter, HTTPException
-from app.services.matcher import match_resume_to_job
+from typing import Literal
+from fastapi import APIRouter, HTTPException, Query
+from bson.errors import InvalidId
+from app.services.match_store import get_match, to_response
+from app.services.matcher import top_jobs_for_resume
 
 router = APIRouter(prefix="/match", tags=["Matching"])
 
 
+# Declared before /{resume_id}/{job_id} so "top" isn't captured as a job id
+@router.get("/{resume_id}/top")
+async def top_jobs(resume_id: str, k: int = Query(10, ge=1, le=100, description="Number of jobs to return")):
+    try:
+        return await top_jobs_for_resume(resume_id, k)
+    except InvalidId:
+        raise HTTPException(status_code=400, detail="Invalid resume_id")
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/{resume_id}/{job_id}")
-def match_resume_job(resume_id: str, job_id: str):
+async def match_resume_job(
+    resume_id: str,
+    job_id: str,
+    mode: Literal["exact", "semantic"] = Query("exact", description="exact string match or embedding similarity"),
+):
     try:
-        result = match_resume_to_job(resume_id, job_id)
-        return result
+        return to_response(await get_match(resume_id, job_id, mode))
+    except InvalidId:
+        raise HTTPException(status_code=400, detail="Invalid resume_id or job_id")
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
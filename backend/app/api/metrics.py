@@ -0,0 +1,51 @@
+# backend/app/api/metrics.py
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.services import extraction_cache, llm_cache, metrics, news_service, roadmap_agent
+from app.services.task_queue import task_queue
+
+router = APIRouter(tags=["Metrics"])
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _cache_samples():
+    """Hit ratios and counters of the LLM, extraction and news caches (same numbers as their /stats routes)."""
+    for cache, stats in (("llm", llm_cache.stats()), ("extraction", extraction_cache.stats()),
+                         ("news", news_service.stats())):
+        labels = {"cache": cache}
+        yield "cache_hit_ratio", "gauge", "Cache hits / lookups since start", labels, stats["hit_ratio"]
+        for tier in ("memory_hits", "mongo_hits", "stale_hits"):
+            if tier in stats:
+                yield ("cache_hits_total", "counter", "Cache hits by tier", {**labels, "tier": tier[:-5]},
+                       stats[tier])
+        yield "cache_misses_total", "counter", "Cache lookups that found nothing", labels, stats["misses"]
+        yield "cache_memory_entries", "gauge", "Entries in the in-process cache tier", labels, stats["memory"]["size"]
+
+
+def _queue_samples():
+    stats = task_queue.stats()
+    for state in ("queued", "running"):
+        yield "task_queue_tasks", "gauge", "Tasks waiting or running", {"state": state}, stats[state]
+    for outcome in ("submitted", "deduplicated", "done", "failed"):
+        yield "task_queue_total", "counter", "Tasks by outcome since start", {"outcome": outcome}, stats[outcome]
+
+
+def _singleflight_samples():
+    stats = roadmap_agent._flights.stats()
+    yield "llm_singleflight_calls_total", "counter", "LLM cache lookups started", {}, stats["calls"]
+    yield "llm_singleflight_shared_total", "counter", "Requests that joined an in-flight call", {}, stats["shared"]
+    stats = roadmap_agent._stream_flights.stats()
+    yield "llm_stream_singleflight_calls_total", "counter", "Streamed LLM calls started", {}, stats["calls"]
+    yield ("llm_stream_singleflight_shared_total", "counter", "Streams that joined an in-flight streamed call", {},
+           stats["shared"])
+
+
+for _collector in (_cache_samples, _queue_samples, _singleflight_samples):
+    metrics.register_collector(_collector)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics_endpoint():
+    """Prometheus text format: request and stage latency histograms, cache hit ratios, LLM tokens, queue depth."""
+    return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
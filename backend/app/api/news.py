@@ -1,9 +1,27 @@
-from fastapi import APIRouter, Query
-from app.services.news_service import fetch_career_news
+from fastapi import APIRouter, HTTPException, Query, Response
+from app.services import news_service
 
 router = APIRouter(prefix="/news", tags=["News"])
 
 @router.get("/")
-def get_career_news(query: str = Query("internship jobs", description="Search keyword"),
-                    limit: int = Query(5, ge=1, le=20, description="Number of results")):
-    return fetch_career_news(query, limit)
+async def get_career_news(response: Response,
+                          query: str = Query("internship jobs", description="Search keyword"),
+                          limit: int = Query(5, ge=1, le=20, description="Number of results")):
+    """
+    Career news for a keyword, served from a short-lived cache. `X-Cache` is
+    HIT, MISS or STALE (upstream slow or down, older results served) and
+    `X-Cache-Age` the seconds since the items were fetched.
+    """
+    try:
+        items, meta = await news_service.get_news(query, limit)
+    except news_service.NewsUnavailable as e:
+        raise HTTPException(status_code=502, detail=f"News service unavailable: {e}")
+    response.headers["X-Cache"] = meta["cache"].upper()
+    response.headers["X-Cache-Age"] = str(meta["age"])
+    return items
+
+
+@router.get("/stats")
+def news_cache_stats():
+    """Hit / stale / miss counters of the news cache and the queries kept warm in the background."""
+    return news_service.stats()
@@ -1,51 +1,127 @@
 # backend/app/api/resume.py
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from app.services.db import db
-from app.services.parser import extract_text_from_file
-from app.services.skill_extractor import extract_skills_from_text  # <-- add this
-
 import os
-from bson import ObjectId
+import tempfile
+import zipfile
+from typing import Optional
 
-router = APIRouter(prefix="/resume", tags=["Resume"])
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query
+from pymongo import ReturnDocument
+from app.services.db import db
+from app.services import bulk_ingest, match_store
+from app.services.executor import run_blocking
+from app.services.extraction_cache import extract_file_cached
+from app.services.parser import text_version
+from app.services.skill_extractor import EXTRACTOR_VERSION
+from app.services.skill_vocab import skill_vocab
+from app.services.uploads import FileTooLarge, save_upload, store_temp_file
 
+router = APIRouter(prefix="/resume", tags=["Resume"])
 
-UPLOAD_DIR = "/app/app/uploads"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+# Default page cap for resume text extraction (0 = read every page)
+RESUME_MAX_PAGES = int(os.getenv("RESUME_MAX_PAGES", "0"))
 
 
 @router.post("/upload")
-async def upload_resume(file: UploadFile = File(...)):
+async def upload_resume(
+    file: UploadFile = File(...),
+    max_pages: Optional[int] = Query(None, ge=1, description="Only extract text from the first N pages"),
+):
     try:
-        file_path = os.path.join(UPLOAD_DIR, file.filename)
-
-        # Save file locally inside container
-        with open(file_path, "wb") as f:
-            f.write(await file.read())
+        # Stream the upload to disk in chunks under its content hash
+        file_path, digest, size = await save_upload(file)
 
-        # Extract text from resume
-        text = extract_text_from_file(file_path)
+        # Extract text and skills (skipped for files we've already parsed);
+        # parsing and spaCy run in the worker pool, not on the event loop
+        max_pages = max_pages or RESUME_MAX_PAGES or None
+        text, skills = await extract_file_cached(file_path, digest, max_pages)
 
         if not text:
             raise HTTPException(status_code=400, detail="Could not extract text from resume")
 
-        # Extract skills automatically
-        skills = extract_skills_from_text(text)
-
         # Save to MongoDB
         resume_doc = {
             "filename": file.filename,
+            "file_path": file_path,
+            "content_hash": digest,
+            "size": size,
             "text": text,
+            "text_version": text_version(),
+            "max_pages": max_pages,
             "skills": skills,
             "skills_extracted": True if skills else False,
+            "skill_ids": await skill_vocab.encode(skills),
+            "extractor_version": EXTRACTOR_VERSION,
         }
-        result = db.resumes.insert_one(resume_doc)
+        # Upsert on the content hash like bulk ingestion does, so uploading
+        # the same file twice updates one resume rather than adding another
+        doc = await db.resumes.find_one_and_update(
+            {"content_hash": digest},
+            {"$set": resume_doc},
+            projection={"_id": 1},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        match_store.schedule_resume_refresh([doc["_id"]])
 
         return {
-            "resume_id": str(result.inserted_id),
+            "resume_id": str(doc["_id"]),
             "filename": file.filename,
             "skills": skills,
             "count": len(skills),
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/bulk", status_code=202)
+async def bulk_upload(
+    file: Optional[UploadFile] = File(None, description="Zip archive of PDF/DOCX resumes"),
+    path: Optional[str] = Query(None, description="Directory under BULK_INGEST_ROOT to ingest instead of a zip"),
+    max_pages: Optional[int] = Query(None, ge=1, description="Only extract text from the first N pages"),
+):
+    """Start ingesting a batch of resumes in the background; poll GET /resume/bulk/{job_id}."""
+    try:
+        max_pages = max_pages or RESUME_MAX_PAGES or None
+        if file is not None:
+            if not (file.filename or "").lower().endswith(".zip"):
+                raise HTTPException(status_code=400, detail="Bulk upload expects a .zip archive")
+            try:
+                # a private copy: the job deletes it when done, so it can't be
+                # shared with a concurrent upload of the same archive
+                zip_path, _ = await run_blocking(
+                    store_temp_file, file.file, file.filename, tempfile.gettempdir(), bulk_ingest.MAX_BULK_UPLOAD_BYTES
+                )
+            except FileTooLarge as e:
+                raise HTTPException(status_code=413, detail=str(e))
+            if not zipfile.is_zipfile(zip_path):
+                os.remove(zip_path)
+                raise HTTPException(status_code=400, detail="Uploaded file is not a valid zip archive")
+            job = bulk_ingest.start_job(zip_path, max_pages, cleanup=True)
+        elif path:
+            root = bulk_ingest.BULK_INGEST_ROOT
+            if not root:
+                raise HTTPException(status_code=400, detail="Directory ingestion is disabled (BULK_INGEST_ROOT not set)")
+            root = os.path.realpath(root)
+            directory = os.path.realpath(os.path.join(root, path))
+            if os.path.commonpath([root, directory]) != root or not os.path.isdir(directory):
+                raise HTTPException(status_code=400, detail="Path must be a directory under BULK_INGEST_ROOT")
+            job = bulk_ingest.start_job(directory, max_pages)
+        else:
+            raise HTTPException(status_code=400, detail="Provide a zip file or a directory path")
+
+        return {"job_id": job["job_id"], "status": job["status"]}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/bulk/{job_id}")
+def bulk_status(job_id: str):
+    """Progress, per-file errors and resume ids of a bulk ingestion job."""
+    job = bulk_ingest.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Bulk job not found")
+    return job
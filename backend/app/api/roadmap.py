@@ -1,85 +1,144 @@
-from fastapi import APIRouter, HTTPException
+import json
+import logging
+from collections import Counter
+from functools import partial
+from typing import Literal
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from bson import ObjectId
 from app.services.db import db
-from app.services.roadmap_agent import generate_ai_roadmap, generate_skill_roadmap_agent
-from app.services.matcher import match_resume_to_job
+from app.services import llm_cache
+from app.services.roadmap_agent import (
+    AI_ROADMAP_FALLBACK,
+    SKILL_BATCH_MAX,
+    generate_ai_roadmap,
+    generate_skill_roadmap_agent,
+    generate_skill_roadmaps,
+    skill_roadmap_fallback,
+    stream_ai_roadmap,
+    stream_skill_roadmap,
+)
+from app.services.match_store import get_match
+from app.services.task_queue import PRIORITY_HIGH, task_queue
 
 router = APIRouter(prefix="/roadmap", tags=["Roadmap"])
+logger = logging.getLogger(__name__)
 
-def normalize_skills(skills):
-    """Flatten nested lists & clean strings"""
-    flat = []
-    for s in skills:
-        if isinstance(s, list):
-            flat.extend(normalize_skills(s))  # recursive flatten
-        elif isinstance(s, str):
-            clean_s = s.strip().lower()
-            if clean_s:
-                flat.append(clean_s)
-    return flat
+async def _roadmap_inputs(resume_id: str, job_id: str, mode: str):
+    """Stored (or freshly computed) match for resume + job; raises HTTPException for bad ids / missing data."""
+    logger.debug("Roadmap inputs for resume_id=%s job_id=%s", resume_id, job_id)
 
-@router.get("/ai/{resume_id}/{job_id}")
-def get_ai_roadmap(resume_id: str, job_id: str):
+    # Validate ids up front
+    if not ObjectId.is_valid(resume_id) or not ObjectId.is_valid(job_id):
+        raise HTTPException(status_code=400, detail="Invalid resume_id or job_id")
+
+    # One indexed lookup when the pair is materialized
     try:
-        print("📌 Incoming resume_id:", resume_id)
-        print("📌 Incoming job_id:", job_id)
+        match = await get_match(resume_id, job_id, mode)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Resume or Job not found")
 
-        # Convert to ObjectId safely
-        try:
-            resume_oid = ObjectId(resume_id)
-            job_oid = ObjectId(job_id)
-        except Exception:
-            raise HTTPException(status_code=400, detail="Invalid resume_id or job_id")
+    if not match["resume_skills"] or not match["job_skills"]:
+        raise HTTPException(status_code=400, detail="Skills must not be empty")
 
-        # Fetch documents from MongoDB
-        resume = db.resumes.find_one({"_id": resume_oid})
-        job = db.jobs.find_one({"_id": job_oid})
+    return {
+        "resume_id": resume_id,
+        "job_id": job_id,
+        "job_title": match["job_title"],
+        "match_percentage": match["score"],
+        "mode": mode,
+        "matched_skills": match["matched"],
+        "missing_skills": match["missing"],
+    }
 
-        print("📌 Resume found:", resume)
-        print("📌 Job found:", job)
 
-        if not resume or not job:
-            raise HTTPException(status_code=404, detail="Resume or Job not found")
+def _sse(event: str, data) -> str:
+    """One Server-Sent Events frame."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
 
-        # Normalize skills
-        resume_skills = normalize_skills(resume.get("skills", []))
-        job_skills = normalize_skills(job.get("skills", []))
 
-        if not resume_skills or not job_skills:
-            raise HTTPException(status_code=400, detail="Skills must not be empty")
+def _sse_response(events) -> StreamingResponse:
+    # no-transform / X-Accel-Buffering stop proxies from buffering the stream
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache, no-transform", "X-Accel-Buffering": "no"},
+    )
 
-        # Match skills
-        result = match_resume_to_job(resume_skills, job_skills)
 
-        matched_skills = [str(s) for s in result["matched_skills"]]
-        missing_skills = [str(s) for s in result["missing_skills"]]
+@router.get("/ai/{resume_id}/{job_id}")
+async def get_ai_roadmap(
+    resume_id: str,
+    job_id: str,
+    mode: Literal["exact", "semantic"] = Query("exact", description="exact string match or embedding similarity"),
+):
+    try:
+        info = await _roadmap_inputs(resume_id, job_id, mode)
 
         # Generate AI roadmap
-        ai_plan = generate_ai_roadmap(
-            job_title=job.get("title", "Unknown Role"),
-            existing_skills=matched_skills,
-            missing_skills=missing_skills
+        ai_plan = await generate_ai_roadmap(
+            job_title=info["job_title"],
+            existing_skills=info["matched_skills"],
+            missing_skills=info["missing_skills"]
         )
 
-        return {
-            "resume_id": resume_id,
-            "job_id": job_id,
-            "job_title": job.get("title", "Unknown Role"),
-            "match_percentage": result.get("match_percentage", 0),
-            "matched_skills": matched_skills,
-            "missing_skills": missing_skills,
-            "ai_roadmap": ai_plan
-        }
-    
+        return {**info, "ai_roadmap": ai_plan}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("AI roadmap request failed: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/ai/{resume_id}/{job_id}/stream")
+async def stream_ai_roadmap_sse(
+    resume_id: str,
+    job_id: str,
+    mode: Literal["exact", "semantic"] = Query("exact", description="exact string match or embedding similarity"),
+):
+    """
+    Server-Sent Events version of /ai/{resume_id}/{job_id}: a `meta` event with
+    the match result, `delta` events with roadmap text as the model writes it,
+    then `done` with the full roadmap (or `error`).
+    """
+    try:
+        info = await _roadmap_inputs(resume_id, job_id, mode)
     except HTTPException:
         raise
     except Exception as e:
-        print("🔥 ERROR:", e)
+        logger.exception("AI roadmap request failed: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def events():
+        yield _sse("meta", info)
+        try:
+            async for event, data in stream_ai_roadmap(
+                info["job_title"], info["matched_skills"], info["missing_skills"]
+            ):
+                yield _sse(event, {"text": data} if event == "delta" else {"ai_roadmap": data})
+        except Exception as e:
+            logger.error("stream_ai_roadmap failed: %s", e)
+            yield _sse("error", {"detail": AI_ROADMAP_FALLBACK})
+
+    return _sse_response(events())
+
+
+async def _skill_roadmap(skill: str):
+    try:
+        detail = await generate_skill_roadmap_agent(skill)
+        return {"skill": skill, "detail": detail}
+    except Exception as e:
+        logger.exception("Skill roadmap generation failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/skill")
-def generate_skill_roadmap(payload: dict):
+async def generate_skill_roadmap(
+    payload: dict,
+    response: Response,
+    async_mode: bool = Query(False, description="Queue the generation and return a task id; poll GET /tasks/{task_id}"),
+):
     """Generate a detailed roadmap for a specific skill using AI.
     Expects JSON: { resume_id, job_id, skill }
     Returns structured JSON with sections: videos, day_plan, blogs, notes, summary
@@ -94,16 +153,85 @@ def generate_skill_roadmap(payload: dict):
     # Minimal validation for resume/job presence (optional)
     try:
         if resume_id:
-            _ = db.resumes.find_one({"_id": ObjectId(resume_id)})
+            _ = await db.resumes.find_one({"_id": ObjectId(resume_id)})
         if job_id:
-            _ = db.jobs.find_one({"_id": ObjectId(job_id)})
+            _ = await db.jobs.find_one({"_id": ObjectId(job_id)})
     except Exception:
         # Ignore missing resources; roadmap can still be generated based only on skill
         pass
 
+    if async_mode:
+        # someone is waiting on a roadmap, so it jumps ahead of batch work
+        task = task_queue.submit(
+            "roadmap.skill", partial(_skill_roadmap, skill), priority=PRIORITY_HIGH,
+            dedupe_key=("roadmap.skill", skill.strip().lower()),
+        )
+        response.status_code = 202
+        return {"task_id": task["task_id"], "status": task["status"]}
+    return await _skill_roadmap(skill)
+
+
+async def _skill_roadmaps(skills):
     try:
-        detail = generate_skill_roadmap_agent(skill)
-        return {"skill": skill, "detail": detail}
+        results = await generate_skill_roadmaps(skills)
+        return {"results": results, "counts": dict(Counter(r["status"] for r in results))}
     except Exception as e:
-        print("🔥 ERROR generating skill roadmap:", e)
+        logger.exception("Batched skill roadmap generation failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/skills")
+async def generate_skill_roadmaps_batch(
+    payload: dict,
+    response: Response,
+    async_mode: bool = Query(False, description="Queue the generation and return a task id; poll GET /tasks/{task_id}"),
+):
+    """Roadmaps for several skills in one request (e.g. every missing skill of a match).
+    Expects JSON: { skills: [...] }
+    Returns one {skill, status, detail} per distinct skill, in request order:
+    status is "cached", "generated", "failed" (detail is the fallback roadmap)
+    or "timeout" (no detail yet; ask again shortly, it is still being generated).
+    """
+    skills = payload.get("skills")
+    if not isinstance(skills, list) or not skills or not all(isinstance(s, str) and s.strip() for s in skills):
+        raise HTTPException(status_code=400, detail="'skills' must be a non-empty list of skill names")
+    if len(skills) > SKILL_BATCH_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {SKILL_BATCH_MAX} skills per request")
+
+    if async_mode:
+        task = task_queue.submit(
+            "roadmap.skills", partial(_skill_roadmaps, skills), priority=PRIORITY_HIGH,
+            dedupe_key=("roadmap.skills", tuple(sorted({" ".join(s.lower().split()) for s in skills}))),
+        )
+        response.status_code = 202
+        return {"task_id": task["task_id"], "status": task["status"]}
+    return await _skill_roadmaps(skills)
+
+
+@router.post("/skill/stream")
+async def stream_skill_roadmap_sse(payload: dict):
+    """
+    Server-Sent Events version of /skill: a `meta` event straight away, one
+    `section` event per top-level key (summary, videos, day_plan, ...) as soon
+    as the model finishes it, then `done` with the complete roadmap (or `error`).
+    """
+    skill = payload.get("skill")
+    if not skill:
+        raise HTTPException(status_code=400, detail="Missing 'skill' in request body")
+
+    async def events():
+        yield _sse("meta", {"skill": skill})
+        try:
+            async for event, data in stream_skill_roadmap(skill):
+                yield _sse(event, data if event == "section" else {"skill": skill, "detail": data})
+        except Exception as e:
+            logger.error("Skill roadmap stream failed: %s", e)
+            yield _sse("error", {"detail": skill_roadmap_fallback()["summary"]})
+
+    return _sse_response(events())
+
+
+@router.get("/cache/stats")
+def llm_cache_stats():
+    """Hit/miss counters of the LLM response cache."""
+    return llm_cache.stats()
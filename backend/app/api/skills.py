@@ -1,17 +1,22 @@
 # backend/app/api/skills.py
-from fastapi import APIRouter, HTTPException
+from functools import partial
+from typing import Literal, Optional
+from fastapi import APIRouter, HTTPException, Query, Response
 from bson import ObjectId
 from app.services.db import db
-from app.services.skill_extractor import extract_skills_from_text
+from app.services.skill_extractor import EXTRACTOR_VERSION
+from app.services.skill_vocab import skill_vocab
+from app.services import extraction_cache, match_store, reextract
+from app.services.extraction_cache import extract_skills_cached
+from app.services.task_queue import PRIORITY_LOW, task_queue
 
 router = APIRouter(prefix="/skills", tags=["Skills"])
 
 
-@router.post("/extract/{resume_id}")
-def extract_skills(resume_id: str):
+async def _extract_resume_skills(resume_id: str):
     try:
         # fetch resume
-        resume = db.resumes.find_one({"_id": ObjectId(resume_id)})
+        resume = await db.resumes.find_one({"_id": ObjectId(resume_id)})
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
 
@@ -19,14 +24,72 @@ def extract_skills(resume_id: str):
         if not text:
             raise HTTPException(status_code=400, detail="Resume has no extracted text")
 
-        skills = extract_skills_from_text(text)
+        skills = await extract_skills_cached(text)
 
         # update resume doc
-        db.resumes.update_one(
+        await db.resumes.update_one(
             {"_id": ObjectId(resume_id)},
-            {"$set": {"skills": skills, "skills_extracted": True}}
+            {"$set": {"skills": skills, "skill_ids": await skill_vocab.encode(skills), "skills_extracted": True,
+                      "extractor_version": EXTRACTOR_VERSION}}
         )
+        # stored matches for this resume are stale now
+        match_store.schedule_resume_refresh([resume_id])
 
         return {"resume_id": resume_id, "skills": skills, "count": len(skills)}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/extract/{resume_id}")
+async def extract_skills(
+    resume_id: str,
+    response: Response,
+    async_mode: bool = Query(False, description="Queue the extraction and return a task id; poll GET /tasks/{task_id}"),
+):
+    if async_mode:
+        task = task_queue.submit(
+            "skills.extract", partial(_extract_resume_skills, resume_id), dedupe_key=("skills.extract", resume_id)
+        )
+        response.status_code = 202
+        return {"task_id": task["task_id"], "status": task["status"]}
+    return await _extract_resume_skills(resume_id)
+
+
+@router.post("/reextract", status_code=202)
+async def reextract_stale(
+    collection: Literal["all", "resumes", "jobs"] = Query("all", description="Which stored documents to re-extract"),
+    limit: Optional[int] = Query(None, ge=1, description="Stop after about this many documents per collection"),
+    restart: bool = Query(False, description="Ignore the checkpoint and start from the first document"),
+):
+    """
+    Queue re-extraction of resumes/jobs extracted by an older extractor
+    version, behind interactive work. Resumes from the last checkpoint;
+    poll GET /tasks/{task_id} or GET /skills/reextract/status.
+    """
+    collections = reextract.COLLECTIONS if collection == "all" else (collection,)
+    progress = {}
+    task = task_queue.submit(
+        reextract.TASK_NAME,
+        partial(reextract.run_all, collections, progress=progress, limit=limit, restart=restart),
+        priority=PRIORITY_LOW,
+        dedupe_key=(reextract.TASK_NAME, collection),
+        progress=progress,
+    )
+    return {"task_id": task["task_id"], "status": task["status"], "extractor_version": EXTRACTOR_VERSION}
+
+
+@router.get("/reextract/status")
+async def reextract_status():
+    """Documents still on an older extractor version and the migration checkpoint, per collection."""
+    try:
+        return await reextract.status()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/cache/stats")
+def extraction_cache_stats():
+    """Hit/miss counters of the extraction cache."""
+    return extraction_cache.stats()
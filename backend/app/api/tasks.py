@@ -0,0 +1,20 @@
+# backend/app/api/tasks.py
+from fastapi import APIRouter, HTTPException
+from app.services.task_queue import task_queue
+
+router = APIRouter(prefix="/tasks", tags=["Tasks"])
+
+
+@router.get("/stats")
+def task_queue_stats():
+    """Worker count, queue depth and completion counters of the task queue."""
+    return task_queue.stats()
+
+
+@router.get("/{task_id}")
+def task_status(task_id: str):
+    """Status (queued, running, done, failed) and, once finished, the result or error of a queued task."""
+    task = task_queue.get(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found or expired")
+    return task
@@ -0,0 +1,133 @@
+# backend/app/cli.py
+"""
+Command-line entry point for maintenance jobs. From backend/:
+
+    python -m app.cli ingest ./resumes.zip
+    python -m app.cli ingest /data/cohort-2024/ --max-pages 3
+    python -m app.cli fingerprint-jobs --delete-duplicates
+    python -m app.cli backfill-matches
+    python -m app.cli reextract --collection resumes --limit 10000
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+from app.services import bulk_ingest, db, executor, logging_config, reextract
+from app.services.task_queue import task_queue
+
+
+def _ingest(args) -> int:
+    def progress(job):
+        print(f"  {job['processed']}/{job['total']} processed, {job['failed']} failed", file=sys.stderr)
+
+    async def run():
+        await bulk_ingest.ensure_indexes()
+        job = bulk_ingest.new_job(args.path)
+        await bulk_ingest.run_job(job, args.path, args.max_pages, args.batch_size, progress)
+        # let the queued match materialization finish before the loop closes
+        await task_queue.drain()
+        await task_queue.stop()
+        return job
+
+    job = asyncio.run(run())
+    summary = {k: v for k, v in job.items() if k != "resume_ids" or args.ids}
+    print(json.dumps(summary, indent=2))
+    return 0 if job["status"] == "done" and not job["failed"] else 1
+
+
+def _fingerprint_jobs(args) -> int:
+    from app.services import job_store
+
+    async def run():
+        await job_store.ensure_indexes()
+        return await job_store.backfill_fingerprints(args.delete_duplicates)
+
+    print(json.dumps(asyncio.run(run()), indent=2))
+    return 0
+
+
+def _backfill_matches(args) -> int:
+    from app.services import match_store
+
+    def progress(summary):
+        print(f"  {summary['resumes']} resumes, {summary['matches']} matches", file=sys.stderr)
+
+    async def run():
+        await match_store.ensure_indexes()
+        return await match_store.backfill(on_progress=progress)
+
+    print(json.dumps(asyncio.run(run()), indent=2))
+    return 0
+
+
+def _reextract(args) -> int:
+    def progress(state):
+        print(f"  {state['collection']}: {state['scanned']} scanned, {state['changed']} changed", file=sys.stderr)
+
+    async def run():
+        collections = reextract.COLLECTIONS if args.collection == "all" else (args.collection,)
+        summary = {}
+        for collection in collections:
+            summary[collection] = await reextract.run(
+                collection, batch_size=args.batch_size, rate=args.rate, processes=args.processes,
+                limit=args.limit, restart=args.restart, on_progress=progress,
+            )
+        # let the queued match refreshes finish before the loop closes
+        await task_queue.drain()
+        await task_queue.stop()
+        return summary
+
+    try:
+        summary = asyncio.run(run())
+    except KeyboardInterrupt:
+        print("interrupted; checkpoint saved, run again to resume", file=sys.stderr)
+        return 130
+    print(json.dumps(summary, indent=2))
+    return 0 if all(s["status"] in ("done", "paused") for s in summary.values()) else 1
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="AI Career Mentor maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="Bulk-ingest resumes from a zip archive or directory")
+    ingest.add_argument("path", help="zip file or directory of PDF/DOCX resumes")
+    ingest.add_argument("--max-pages", type=int, default=None, help="only extract the first N pages of each PDF")
+    ingest.add_argument("--batch-size", type=int, default=bulk_ingest.BULK_BATCH_SIZE,
+                        help="files per parse/extract/write round")
+    ingest.add_argument("--ids", action="store_true", help="include the resume ids in the summary")
+    ingest.set_defaults(handler=_ingest)
+
+    fingerprint = commands.add_parser("fingerprint-jobs", help="Fingerprint jobs stored before deduplication")
+    fingerprint.add_argument("--delete-duplicates", action="store_true",
+                             help="delete later copies of postings that are already stored")
+    fingerprint.set_defaults(handler=_fingerprint_jobs)
+
+    backfill = commands.add_parser("backfill-matches",
+                                   help="Materialize resume x job matches for every resume with skills")
+    backfill.set_defaults(handler=_backfill_matches)
+
+    reext = commands.add_parser("reextract",
+                                help="Re-extract skills stored by an older extractor version (resumable)")
+    reext.add_argument("--collection", choices=("all", *reextract.COLLECTIONS), default="all")
+    reext.add_argument("--limit", type=int, default=None,
+                       help="stop after about N documents per collection; run again to continue")
+    reext.add_argument("--restart", action="store_true", help="ignore the checkpoint and start from the top")
+    reext.add_argument("--batch-size", type=int, default=reextract.REEXTRACT_BATCH)
+    reext.add_argument("--rate", type=float, default=reextract.REEXTRACT_RATE, help="documents per second (0 = unthrottled)")
+    reext.add_argument("--processes", type=int, default=reextract.REEXTRACT_PROCESSES,
+                       help="process-pool chunks per batch (0 = extract in a thread)")
+    reext.set_defaults(handler=_reextract)
+
+    args = parser.parse_args(argv)
+    logging_config.configure()
+    try:
+        return args.handler(args)
+    finally:
+        executor.shutdown()
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,55 @@
-from fastapi import FastAPI
-from app.api import resume, skills, jobs, match,roadmap,news 
+import logging
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from app.api import resume, skills, jobs, match,roadmap,news,tasks,health,metrics as metrics_api
 from fastapi.middleware.cors import CORSMiddleware
-app = FastAPI(title="AI Career Mentor API")
+# spaCy, the OpenAI and Motor clients and the sentence encoder load on first
+# use (tests/test_imports.py keeps it that way). numpy, pymongo/bson, pdfminer
+# and httpx are imported eagerly on purpose: ~0.15s each, and the skill index
+# build, the news refresher and the first upload need them right away.
+from app.services import (
+    bulk_ingest, db, executor, extraction_cache, job_fetcher, job_store, llm_cache, logging_config, match_store,
+    metrics, news_service, semantic_matcher, skill_index, skill_vocab, uploads, warmup,
+)
+from app.services.task_queue import task_queue
+
+logging_config.configure()
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if warmup.WARMUP_ON_STARTUP:
+        # runs alongside index creation; /health/ready reports when it's done
+        warmup.start()
+    try:
+        await db.ping()
+        await extraction_cache.ensure_indexes()
+        await skill_index.ensure_indexes()
+        await job_store.ensure_indexes()
+        await bulk_ingest.ensure_indexes()
+        await llm_cache.ensure_indexes()
+        await match_store.ensure_indexes()
+        await skill_vocab.ensure_indexes()
+    except Exception as e:
+        # the API still works without indexes; don't block startup on Mongo
+        logger.warning("Could not create indexes: %s", e)
+    task_queue.start()
+    news_service.start()
+    semantic_matcher.start()
+    skill_index.start()
+    yield
+    await skill_index.stop()
+    await semantic_matcher.stop()
+    await news_service.stop()
+    await task_queue.stop()
+    await job_fetcher.close()
+    executor.shutdown()
+    db.close()
+
+
+app = FastAPI(title="AI Career Mentor API", lifespan=lifespan)
 
 app.include_router(resume.router)
 app.include_router(skills.router)
@@ -9,6 +57,35 @@ app.include_router(jobs.router)
 app.include_router(match.router)
 app.include_router(roadmap.router)
 app.include_router(news.router)
+app.include_router(tasks.router)
+app.include_router(health.router)
+app.include_router(metrics_api.router)
+
+# refuse oversized uploads before Starlette spools them to disk
+app.add_middleware(uploads.BodySizeLimit, limits={
+    "/resume/upload": uploads.MAX_UPLOAD_BYTES + uploads.MULTIPART_OVERHEAD,
+    "/resume/bulk": bulk_ingest.MAX_BULK_UPLOAD_BYTES + uploads.MULTIPART_OVERHEAD,
+})
+
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """Latency per route template (not raw path, so ids don't explode the label set) up to the response headers."""
+    if not metrics.METRICS_ENABLED:
+        return await call_next(request)
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        metrics.REQUEST_LATENCY.observe(
+            time.perf_counter() - start,
+            method=request.method, route=getattr(route, "path", "unmatched"), status=status,
+        )
+
 origins = [
     "https://ai-caree-mentor-frontend.onrender.com",  # your frontend Render URL
 ]
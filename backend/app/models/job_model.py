@@ -0,0 +1,13 @@
+# backend/app/models/job_model.py
+from pydantic import BaseModel, Field
+from typing import List
+
+
+class JobSearch(BaseModel):
+    query: str
+    location: str = "India"
+
+
+class BulkFetchRequest(BaseModel):
+    searches: List[JobSearch] = Field(..., min_length=1, max_length=50)
+    limit: int = Field(10, ge=1, le=500, description="Max jobs per search")
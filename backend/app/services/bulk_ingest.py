@@ -0,0 +1,242 @@
+# backend/app/services/bulk_ingest.py
+import asyncio
+import logging
+import os
+import uuid
+import zipfile
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pymongo import UpdateOne
+
+from app.services import extraction_cache, match_store
+from app.services.db import db
+from app.services.executor import run_blocking, run_in_process
+from app.services.metrics import timed
+from app.services.parser import extract_text_from_file, text_version
+from app.services.skill_extractor import EXTRACTOR_VERSION
+from app.services.skill_vocab import skill_vocab
+from app.services.task_queue import PRIORITY_LOW, task_queue
+from app.services.uploads import MAX_UPLOAD_BYTES, UPLOAD_DIR, FileTooLarge, is_allowed, store_file
+
+# Files parsed, skill-extracted and written to Mongo per round
+BULK_BATCH_SIZE = int(os.getenv("BULK_BATCH_SIZE", "64"))
+# Size cap for a zip uploaded to POST /resume/bulk
+MAX_BULK_UPLOAD_BYTES = int(os.getenv("MAX_BULK_UPLOAD_BYTES", str(500 * 1024 * 1024)))
+# Server directory the API may ingest from (directory ingestion over HTTP is off when unset)
+BULK_INGEST_ROOT = os.getenv("BULK_INGEST_ROOT", "")
+
+TASK_NAME = "bulk_ingest"
+logger = logging.getLogger(__name__)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+async def ensure_indexes() -> None:
+    # bulk ingestion upserts on the content hash
+    await db.resumes.create_index("content_hash")
+
+
+def new_job(source: str) -> Dict:
+    job = {
+        "job_id": uuid.uuid4().hex,
+        "source": source,
+        "status": "queued",
+        "total": 0,
+        "processed": 0,
+        "succeeded": 0,
+        "failed": 0,
+        "duplicates": 0,
+        "errors": [],
+        "resume_ids": [],
+        "created_at": _now(),
+        "finished_at": None,
+    }
+    return job
+
+
+def get_job(job_id: str) -> Optional[Dict]:
+    # jobs run on the task queue under their job id; the job dict is the task's progress
+    task = task_queue.get(job_id)
+    if not task or task["name"] != TASK_NAME:
+        return None
+    return task["progress"]
+
+
+def _error(job: Dict, filename: str, error) -> None:
+    job["errors"].append({"file": filename, "error": str(error)})
+    job["failed"] += 1
+
+
+def collect_zip(zip_path: str, job: Dict, upload_dir: str = UPLOAD_DIR) -> List[Dict]:
+    """
+    Copy every PDF/DOCX member of a zip into the upload dir under its content
+    hash. Member names are only used for their extension and for reporting,
+    never as paths, so archives with `../` entries can't write outside it.
+    """
+    files = []
+    with zipfile.ZipFile(zip_path) as zf:
+        for info in zf.infolist():
+            name = info.filename
+            if info.is_dir() or name.startswith("__MACOSX/") or not is_allowed(name):
+                continue
+            try:
+                with zf.open(info) as src:
+                    path, digest, size = store_file(src, name, upload_dir, MAX_UPLOAD_BYTES)
+                files.append({"filename": os.path.basename(name), "file_path": path,
+                              "content_hash": digest, "size": size})
+            except (FileTooLarge, zipfile.BadZipFile, OSError) as e:
+                _error(job, name, e)
+    return files
+
+
+def collect_dir(dir_path: str, job: Dict, upload_dir: str = UPLOAD_DIR) -> List[Dict]:
+    """Copy every PDF/DOCX under a directory (recursively) into the upload dir."""
+    files = []
+    for root, _, names in os.walk(dir_path):
+        for name in sorted(names):
+            if not is_allowed(name):
+                continue
+            source = os.path.join(root, name)
+            try:
+                with open(source, "rb") as src:
+                    path, digest, size = store_file(src, name, upload_dir, MAX_UPLOAD_BYTES)
+                files.append({"filename": name, "file_path": path, "content_hash": digest, "size": size})
+            except (FileTooLarge, OSError) as e:
+                _error(job, os.path.relpath(source, dir_path), e)
+    return files
+
+
+def _dedupe(files: List[Dict], job: Dict) -> List[Dict]:
+    unique = {}
+    for f in files:
+        if f["content_hash"] in unique:
+            job["duplicates"] += 1
+        else:
+            unique[f["content_hash"]] = f
+    return list(unique.values())
+
+
+async def _parse_batch(files: List[Dict], max_pages: Optional[int]) -> List[Tuple[Optional[str], Optional[str]]]:
+    """(text, error) per file: cached text where we have it, the rest parsed in the process pool."""
+    keys = [extraction_cache.file_cache_key(f["content_hash"], max_pages) for f in files]
+    cached = await extraction_cache.get_many(set(keys))
+
+    async def parse(f, key):
+        entry = cached.get(key)
+        if entry is not None and entry.get("text") is not None:
+            return entry["text"], None
+        try:
+            # timed from the parent: the pool's processes have their own (unscraped) metrics
+            with timed("file_parse"):
+                text = await run_in_process(extract_text_from_file, f["file_path"], max_pages)
+        except Exception as e:
+            return None, str(e)
+        if not text:
+            return None, "Could not extract text from resume"
+        return text, None
+
+    return await asyncio.gather(*(parse(f, key) for f, key in zip(files, keys)))
+
+
+async def _ingest_batch(files: List[Dict], job: Dict, max_pages: Optional[int]) -> None:
+    parsed = await _parse_batch(files, max_pages)
+    ok = []
+    for f, (text, error) in zip(files, parsed):
+        if error:
+            _error(job, f["filename"], error)
+        else:
+            ok.append((f, text))
+
+    if ok:
+        skills_lists = await extraction_cache.extract_skills_batch_cached([text for _, text in ok])
+        await extraction_cache.put_many({
+            extraction_cache.file_cache_key(f["content_hash"], max_pages): {"text": text, "skills": skills}
+            for (f, text), skills in zip(ok, skills_lists)
+        })
+        ids_lists = await skill_vocab.encode_many(skills_lists)
+        # upsert on the content hash so re-ingesting a cohort doesn't duplicate resumes
+        ops = [
+            UpdateOne(
+                {"content_hash": f["content_hash"]},
+                {"$set": {
+                    "filename": f["filename"],
+                    "file_path": f["file_path"],
+                    "content_hash": f["content_hash"],
+                    "size": f["size"],
+                    "text": text,
+                    "text_version": text_version(),
+                    "max_pages": max_pages,
+                    "skills": skills,
+                    "skill_ids": skill_ids,
+                    "skills_extracted": True if skills else False,
+                    "extractor_version": EXTRACTOR_VERSION,
+                }},
+                upsert=True,
+            )
+            for (f, text), skills, skill_ids in zip(ok, skills_lists, ids_lists)
+        ]
+        result = await db.resumes.bulk_write(ops, ordered=False)
+        # new resumes come back in upserted_ids; the ones that already existed
+        # are looked up by the same filter, taking one document per hash
+        ids = dict(result.upserted_ids)
+        matched = {f["content_hash"]: i for i, (f, _) in enumerate(ok) if i not in ids}
+        if matched:
+            cursor = db.resumes.find({"content_hash": {"$in": list(matched)}}, {"content_hash": 1}).sort("_id", 1)
+            async for doc in cursor:
+                ids.setdefault(matched[doc["content_hash"]], doc["_id"])
+        ids = [ids[i] for i in sorted(ids)]
+        job["resume_ids"].extend(str(i) for i in ids)
+        match_store.schedule_resume_refresh(ids)
+        job["succeeded"] += len(ok)
+
+    job["processed"] += len(files)
+
+
+async def run_job(job: Dict, source: str, max_pages: Optional[int] = None,
+                  batch_size: int = BULK_BATCH_SIZE,
+                  on_progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """
+    Ingest every resume in a zip file or directory: files are parsed across
+    the process pool, skills extracted with batched spaCy passes and resumes
+    written with one bulk upsert per batch. Progress and per-file errors are
+    recorded on `job` as it runs.
+    """
+    job["status"] = "running"
+    try:
+        collect = collect_dir if os.path.isdir(source) else collect_zip
+        files = _dedupe(await run_blocking(collect, source, job), job)
+        job["total"] = len(files) + job["failed"]
+        job["processed"] = job["failed"]
+        for start in range(0, len(files), batch_size):
+            await _ingest_batch(files[start:start + batch_size], job, max_pages)
+            if on_progress:
+                on_progress(job)
+        job["status"] = "done"
+    except Exception as e:
+        job["status"] = "failed"
+        job["error"] = str(e)
+        logger.exception("Bulk ingestion %s failed: %s", job["job_id"], e)
+    finally:
+        job["finished_at"] = _now()
+    return job
+
+
+def start_job(source: str, max_pages: Optional[int] = None, cleanup: bool = False) -> Dict:
+    """Queue run_job on the task queue (behind interactive work) and return the job record right away."""
+    job = new_job(os.path.basename(source))
+
+    async def runner():
+        try:
+            await run_job(job, source, max_pages)
+        finally:
+            if cleanup:
+                await run_blocking(os.remove, source)
+        if job["status"] == "failed":
+            raise RuntimeError(job["error"])
+        return {key: job[key] for key in ("total", "succeeded", "failed", "duplicates")}
+
+    task_queue.submit(TASK_NAME, runner, priority=PRIORITY_LOW, task_id=job["job_id"], progress=job)
+    return job
@@ -1,8 +1,65 @@
-from pymongo import MongoClient
 import os
+import threading
 
 MONGO_URI = os.getenv("MONGO_URI", "mongodb://career_mentor_mongo:27017")
 MONGO_DB = os.getenv("MONGO_DB", "career_mentor")
 
-client = MongoClient(MONGO_URI)
-db = client[MONGO_DB]
+# Connection pool sizing; the driver opens connections lazily up to the max
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+MONGO_TIMEOUT_MS = int(os.getenv("MONGO_TIMEOUT_MS", "5000"))
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """The shared Motor client, created on first use (thread-safe)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                # imported lazily so processes that never touch Mongo don't pay for the driver
+                from motor.motor_asyncio import AsyncIOMotorClient
+
+                from app.services.metrics import mongo_command_listener
+                _client = AsyncIOMotorClient(
+                    MONGO_URI,
+                    event_listeners=[mongo_command_listener()],
+                    maxPoolSize=MONGO_MAX_POOL_SIZE,
+                    minPoolSize=MONGO_MIN_POOL_SIZE,
+                    serverSelectionTimeoutMS=MONGO_TIMEOUT_MS,
+                )
+    return _client
+
+
+def get_db():
+    return get_client()[MONGO_DB]
+
+
+def client_loaded() -> bool:
+    return _client is not None
+
+
+class _LazyDatabase:
+    """`db.jobs`, `db["llm_cache"]`, ... resolved against get_db() on each access."""
+
+    def __getattr__(self, name):
+        return getattr(get_db(), name)
+
+    def __getitem__(self, name):
+        return get_db()[name]
+
+
+db = _LazyDatabase()
+
+
+async def ping() -> None:
+    await get_client().admin.command("ping")
+
+
+def close() -> None:
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
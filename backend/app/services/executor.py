@@ -0,0 +1,52 @@
+# backend/app/services/executor.py
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Worker threads for blocking work (PDF parsing, spaCy, sync HTTP clients) so
+# it never runs on the event loop. Bounded so a burst of uploads queues up
+# instead of oversubscribing the CPU.
+BLOCKING_WORKERS = int(os.getenv("BLOCKING_WORKERS", str(min(8, (os.cpu_count() or 1) + 2))))
+
+# Worker processes for CPU-heavy batch work (bulk PDF parsing) that would
+# serialize on the GIL in threads. Started on first use.
+PROCESS_WORKERS = int(os.getenv("PROCESS_WORKERS", str(os.cpu_count() or 1)))
+
+_executor = ThreadPoolExecutor(max_workers=BLOCKING_WORKERS, thread_name_prefix="blocking")
+_process_pool = None
+_process_lock = threading.Lock()
+
+
+async def run_blocking(fn, *args, **kwargs):
+    """Run a blocking / CPU-bound callable in the worker pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    with _process_lock:
+        if _process_pool is None:
+            # spawn, not fork: the parent holds Mongo/HTTP client threads and the spaCy model
+            _process_pool = ProcessPoolExecutor(
+                max_workers=PROCESS_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _process_pool
+
+
+async def run_in_process(fn, *args, **kwargs):
+    """Run a picklable module-level callable in the process pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_process_pool(), functools.partial(fn, *args, **kwargs))
+
+
+def shutdown() -> None:
+    global _process_pool
+    _executor.shutdown(wait=False, cancel_futures=True)
+    with _process_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
@@ -0,0 +1,222 @@
+# backend/app/services/extraction_cache.py
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from pymongo import UpdateOne
+
+from app.services.cache import TTLCache
+from app.services.db import db
+from app.services.executor import PROCESS_WORKERS, run_blocking, run_in_process
+from app.services.metrics import timed
+from app.services import parser
+from app.services.skill_extractor import (
+    EXTRACTOR_VERSION,
+    extract_skills_batch,
+    extract_skills_from_text,
+)
+
+# In-process tier: entry count and lifetime; the Mongo tier expires via a TTL index
+EXTRACTION_CACHE_SIZE = int(os.getenv("EXTRACTION_CACHE_SIZE", "2048"))
+EXTRACTION_CACHE_TTL = int(os.getenv("EXTRACTION_CACHE_TTL", str(30 * 24 * 3600)))
+
+COLLECTION = "extraction_cache"
+logger = logging.getLogger(__name__)
+
+_memory = TTLCache(maxsize=EXTRACTION_CACHE_SIZE, ttl=EXTRACTION_CACHE_TTL)
+_counters = {"memory_hits": 0, "mongo_hits": 0, "misses": 0, "mongo_errors": 0}
+_counters_lock = threading.Lock()
+
+
+def _count(name: str, n: int = 1) -> None:
+    with _counters_lock:
+        _counters[name] += n
+
+
+def content_hash(data: Union[bytes, str]) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def cache_key(kind: str, digest: str) -> str:
+    """`kind` is "file" (raw upload bytes) or "text" (already extracted text)."""
+    return f"{kind}:{EXTRACTOR_VERSION}:{digest}"
+
+
+def file_cache_key(digest: str, max_pages: Optional[int] = None) -> str:
+    # a page-limited extraction or another text mode produces different text, so it gets its own key
+    digest = f"{digest}:{parser.text_version()}"
+    return cache_key("file", f"{digest}:p{max_pages}" if max_pages else digest)
+
+
+async def ensure_indexes() -> None:
+    await db[COLLECTION].create_index("created_at", expireAfterSeconds=EXTRACTION_CACHE_TTL)
+
+
+async def get_many(keys: Iterable[str]) -> Dict[str, dict]:
+    """Look keys up in memory first, then fetch the rest from Mongo in one query."""
+    found = {}
+    missing = []
+    for key in keys:
+        entry = _memory.get(key)
+        if entry is not None:
+            found[key] = entry
+        else:
+            missing.append(key)
+    if found:
+        _count("memory_hits", len(found))
+
+    if missing:
+        try:
+            cursor = db[COLLECTION].find({"_id": {"$in": missing}}, {"text": 1, "skills": 1})
+            async for doc in cursor:
+                entry = {"text": doc.get("text"), "skills": doc.get("skills", [])}
+                _memory.set(doc["_id"], entry)
+                found[doc["_id"]] = entry
+                _count("mongo_hits")
+        except Exception as e:
+            # the cache must never break extraction; fall through to recomputing
+            _count("mongo_errors")
+            logger.warning("Extraction cache read failed: %s", e)
+
+    _count("misses", sum(1 for k in missing if k not in found))
+    return found
+
+
+async def get(key: str) -> Optional[dict]:
+    return (await get_many([key])).get(key)
+
+
+async def put_many(entries: Dict[str, dict]) -> None:
+    if not entries:
+        return
+    now = datetime.now(timezone.utc)
+    ops = []
+    for key, entry in entries.items():
+        _memory.set(key, entry)
+        ops.append(UpdateOne(
+            {"_id": key},
+            {"$set": {**entry, "version": EXTRACTOR_VERSION, "created_at": now}},
+            upsert=True,
+        ))
+    try:
+        await db[COLLECTION].bulk_write(ops, ordered=False)
+    except Exception as e:
+        _count("mongo_errors")
+        logger.warning("Extraction cache write failed: %s", e)
+
+
+async def put(key: str, skills: List[str], text: Optional[str] = None) -> None:
+    entry = {"skills": skills}
+    if text is not None:
+        entry["text"] = text
+    await put_many({key: entry})
+
+
+async def extract_skills_cached(text: str) -> List[str]:
+    """extract_skills_from_text, skipped when the same text was seen before."""
+    key = cache_key("text", content_hash(text))
+    entry = await get(key)
+    if entry is not None:
+        return entry["skills"]
+    skills = await run_blocking(extract_skills_from_text, text)
+    await put(key, skills)
+    return skills
+
+
+async def extract_skills_batch_cached(texts: List[str], processes: int = 0, **batch_kwargs) -> List[List[str]]:
+    """
+    extract_skills_batch that only runs spaCy on texts not already cached.
+    With `processes`, the uncached texts are split into that many chunks run
+    in the process pool instead of one batch in a worker thread.
+    """
+    texts = [t or "" for t in texts]
+    keys = [cache_key("text", content_hash(t)) for t in texts]
+    cached = await get_many(set(keys))
+
+    todo = {}
+    for key, text in zip(keys, texts):
+        if key not in cached and key not in todo:
+            todo[key] = text
+
+    if todo:
+        pending = list(todo.values())
+        if processes > 1 and len(pending) > 1:
+            size = -(-len(pending) // processes)
+            chunks = await asyncio.gather(*(
+                run_in_process(extract_skills_batch, pending[i:i + size], **batch_kwargs)
+                for i in range(0, len(pending), size)
+            ))
+            fresh = [skills for chunk in chunks for skills in chunk]
+        elif processes:
+            fresh = await run_in_process(extract_skills_batch, pending, **batch_kwargs)
+        else:
+            fresh = await run_blocking(extract_skills_batch, pending, **batch_kwargs)
+        new_entries = {key: {"skills": skills} for key, skills in zip(todo, fresh)}
+        await put_many(new_entries)
+        cached.update(new_entries)
+
+    return [cached[key]["skills"] for key in keys]
+
+
+async def extract_file_cached(file_path: str, digest: Optional[str] = None,
+                              max_pages: Optional[int] = None) -> Tuple[str, List[str]]:
+    """
+    Text and skills for an uploaded file, keyed on the file's content hash.
+    Pass `digest` when it was already computed (e.g. while streaming the
+    upload) to avoid re-reading the file.
+    """
+    if digest is None:
+        digest = await run_blocking(hash_file, file_path)
+    key = file_cache_key(digest, max_pages)
+    entry = await get(key)
+    if entry is not None and entry.get("text") is not None:
+        return entry["text"], entry["skills"]
+
+    with timed("file_parse"):
+        text = await parse_file(file_path, max_pages)
+    skills = await run_blocking(extract_skills_from_text, text) if text else []
+    if text:
+        await put(key, skills, text=text)
+    return text, skills
+
+
+def hash_file(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+async def parse_file(file_path: str, max_pages: Optional[int] = None) -> str:
+    """
+    Text of an uploaded file. Long PDFs are split into page ranges parsed in
+    parallel in the process pool; everything else is parsed in a thread.
+    """
+    # splitting only pays off with more than one worker process to spread the ranges over
+    ranges = await run_blocking(parser.pdf_page_ranges, file_path, max_pages) if PROCESS_WORKERS > 1 else []
+    if not ranges:
+        return await run_blocking(parser.extract_text_from_file, file_path, max_pages)
+    pages = await asyncio.gather(*(
+        run_in_process(parser.extract_pdf_pages, file_path, first, last) for first, last in ranges
+    ))
+    return "".join(pages)
+
+
+def stats() -> Dict[str, object]:
+    with _counters_lock:
+        counters = dict(_counters)
+    lookups = counters["memory_hits"] + counters["mongo_hits"] + counters["misses"]
+    hits = counters["memory_hits"] + counters["mongo_hits"]
+    return {
+        "extractor_version": EXTRACTOR_VERSION,
+        **counters,
+        "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+        "memory": _memory.stats(),
+    }
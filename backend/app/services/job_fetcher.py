@@ -1,37 +1,158 @@
+import asyncio
+import logging
 import os
-from serpapi import GoogleSearch
-from typing import List, Dict
+import random
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from app.services.metrics import timed
+from app.services.rate_limit import TokenBucket
 
 SERPAPI_KEY = os.getenv("SERPAPI_KEY")  # add this to your .env
+# Override to point at a local mock server in tests / benchmarks
+SERPAPI_BASE_URL = os.getenv("SERPAPI_BASE_URL", "https://serpapi.com")
+SERPAPI_TIMEOUT = float(os.getenv("SERPAPI_TIMEOUT", "30"))
+# Shared connection pool size and requests/second allowed across all fetches
+SERPAPI_MAX_CONNECTIONS = int(os.getenv("SERPAPI_MAX_CONNECTIONS", "10"))
+SERPAPI_RATE = float(os.getenv("SERPAPI_RATE", "5"))
+SERPAPI_BURST = float(os.getenv("SERPAPI_BURST", "5"))
+SERPAPI_MAX_RETRIES = int(os.getenv("SERPAPI_MAX_RETRIES", "3"))
+SERPAPI_BACKOFF = float(os.getenv("SERPAPI_BACKOFF", "0.5"))
 
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+rate_limiter = TokenBucket(SERPAPI_RATE, SERPAPI_BURST)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=SERPAPI_BASE_URL,
+            timeout=SERPAPI_TIMEOUT,
+            limits=httpx.Limits(max_connections=SERPAPI_MAX_CONNECTIONS,
+                                max_keepalive_connections=SERPAPI_MAX_CONNECTIONS),
+        )
+    return _client
+
+
+async def close() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _normalize(job: Dict) -> Dict:
+    return {
+        "title": job.get("title"),
+        "company": job.get("company_name"),
+        "location": job.get("location"),
+        "via": job.get("via"),
+        "description": job.get("description"),
+        "job_highlights": job.get("job_highlights", []),
+        "extensions": job.get("extensions", []),
+        "link": (job.get("apply_options") or [{}])[0].get("link"),
+        "source": "serpapi",
+    }
 
-def fetch_jobs_serpapi(query: str, location: str, limit: int = 10) -> List[Dict]:
-    """Fetch jobs using SerpAPI (Google Jobs engine)."""
-    jobs = []
 
-    search = GoogleSearch({
+def _retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+    # exponential backoff with jitter so concurrent retries don't line up
+    return SERPAPI_BACKOFF * (2 ** attempt) * (0.5 + random.random())
+
+
+async def _get_page(params: Dict) -> Dict:
+    """One SerpAPI request, rate limited and retried on 429/5xx/connection errors."""
+    client = get_http_client()
+    for attempt in range(SERPAPI_MAX_RETRIES + 1):
+        await rate_limiter.acquire()
+        response = None
+        try:
+            with timed("serpapi_fetch"):
+                response = await client.get("/search.json", params=params)
+            if response.status_code not in RETRY_STATUSES:
+                data = response.json()
+                # "no results" comes back as an error message; treat it as an empty page
+                if response.status_code >= 400 and not str(data.get("error", "")).startswith("Google hasn't returned"):
+                    raise RuntimeError(f"SerpAPI error {response.status_code}: {data.get('error', response.text)}")
+                return data
+        except (httpx.TransportError, ValueError) as e:
+            if attempt == SERPAPI_MAX_RETRIES:
+                raise
+            logger.warning("SerpAPI request failed (%s), retrying", e)
+        if attempt == SERPAPI_MAX_RETRIES:
+            raise RuntimeError(f"SerpAPI error {response.status_code} after {attempt + 1} attempts")
+        await asyncio.sleep(_retry_delay(attempt, response))
+
+
+async def iter_job_pages(query: str, location: str, limit: int = 10) -> AsyncIterator[List[Dict]]:
+    """Yield normalized jobs one results page at a time until `limit` jobs or the last page."""
+    params = {
         "engine": "google_jobs",
         "q": query,
         "location": location,
         "hl": "en",
         "api_key": SERPAPI_KEY,
-    })
-
-    results = search.get_dict()
-    if "jobs_results" not in results:
-        return []
-
-    for job in results["jobs_results"][:limit]:
-        jobs.append({
-            "title": job.get("title"),
-            "company": job.get("company_name"),
-            "location": job.get("location"),
-            "via": job.get("via"),
-            "description": job.get("description"),
-            "job_highlights": job.get("job_highlights", []),
-            "extensions": job.get("extensions", []),
-            "link": job.get("apply_options", [{}])[0].get("link"),
-            "source": "serpapi",
-        })
+    }
+    remaining = limit
+    while remaining > 0:
+        results = await _get_page(params)
+        page = results.get("jobs_results") or []
+        if not page:
+            return
+        jobs = [_normalize(job) for job in page[:remaining]]
+        remaining -= len(jobs)
+        yield jobs
+        next_token = (results.get("serpapi_pagination") or {}).get("next_page_token")
+        if not next_token:
+            return
+        params = {**params, "next_page_token": next_token}
+
 
+async def fetch_jobs_serpapi(query: str, location: str, limit: int = 10) -> List[Dict]:
+    """Fetch up to `limit` jobs using SerpAPI (Google Jobs engine), following pagination."""
+    jobs = []
+    async for page in iter_job_pages(query, location, limit):
+        jobs.extend(page)
     return jobs
+
+
+async def fetch_many(searches: Iterable[Tuple[str, str]], limit: int = 10) -> AsyncIterator[Dict]:
+    """
+    Run several (query, location) searches concurrently, each paging up to
+    `limit` jobs, and yield pages as they arrive, from whichever search
+    finishes first: {"query", "location", "jobs"} or {"query", "location",
+    "error"} if a search fails. Requests share one connection pool and rate limiter.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    searches = list(dict.fromkeys(searches))
+
+    async def run(query, location):
+        try:
+            async for page in iter_job_pages(query, location, limit):
+                await queue.put({"query": query, "location": location, "jobs": page})
+        except Exception as e:
+            await queue.put({"query": query, "location": location, "error": str(e)})
+        finally:
+            await queue.put(None)
+
+    tasks = [asyncio.create_task(run(q, l)) for q, l in searches]
+    try:
+        pending = len(tasks)
+        while pending:
+            item = await queue.get()
+            if item is None:
+                pending -= 1
+            else:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
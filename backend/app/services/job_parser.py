@@ -1,18 +1,21 @@
 # backend/app/services/job_parser.py
-import re
+from app.services.skill_taxonomy import taxonomy
+
 
 def extract_skills_from_job(description: str) -> list:
-    # A simple predefined skill set (expand this as needed)
-    skill_keywords = [
-        "python", "java", "c++", "sql", "mongodb", "flask", "django",
-        "react", "node.js", "tensorflow", "keras", "pytorch",
-        "aws", "gcp", "azure", "docker", "kubernetes",
-        "nlp", "computer vision", "machine learning", "deep learning"
-    ]
-    
-    # Normalize description
-    text = description.lower()
-    
-    # Extract skills
-    found = [skill for skill in skill_keywords if skill in text]
-    return list(set(found))
+    """Canonical skills mentioned in a job description, matched against the skill taxonomy."""
+    return taxonomy.find(description or "")
+
+
+def job_text(job: dict) -> str:
+    """Description plus flattened highlight items, the text skills are extracted from."""
+    desc = job.get("description") or ""
+    highlights = job.get("job_highlights") or []
+    items = []
+    for h in highlights:
+        # SerpAPI returns [{"title": ..., "items": [...]}]; older docs stored plain lists
+        if isinstance(h, dict):
+            items.extend(h.get("items", []))
+        elif isinstance(h, list):
+            items.extend(h)
+    return desc + " " + " ".join(str(i) for i in items)
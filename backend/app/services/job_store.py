@@ -0,0 +1,232 @@
+# backend/app/services/job_store.py
+import hashlib
+import re
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from bson import ObjectId
+from pymongo import DESCENDING, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from app.services.db import db
+from app.services.executor import run_blocking
+from app.services.extraction_cache import extract_skills_batch_cached
+from app.services.job_parser import job_text
+from app.services import match_store
+from app.services.skill_extractor import EXTRACTOR_VERSION
+from app.services.skill_index import skill_index
+from app.services.skill_vocab import skill_vocab
+
+_PUNCT = re.compile(r"[^\w\s]")
+DUPLICATE_KEY = 11000
+
+# Fields /jobs/list may project; internal bookkeeping fields are left out
+LIST_FIELDS = (
+    "title", "company", "location", "via", "description", "job_highlights", "extensions",
+    "link", "source", "skills", "skills_extracted", "first_seen_at", "last_seen_at",
+)
+
+
+def normalize_field(value) -> str:
+    """Lowercase, drop punctuation and collapse whitespace: "Acme, Inc." -> "acme inc"."""
+    return " ".join(_PUNCT.sub(" ", str(value or "").lower()).split())
+
+
+def job_fingerprint(job: Dict) -> str:
+    """Stable identity of a posting: normalized title, company and location."""
+    key = "|".join(normalize_field(job.get(f)) for f in ("title", "company", "location"))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def description_hash(job: Dict) -> str:
+    """Hash of the text skills are extracted from; a change means re-extraction."""
+    return hashlib.sha256(" ".join(job_text(job).split()).encode("utf-8")).hexdigest()
+
+
+async def ensure_indexes() -> None:
+    # partial so documents stored before fingerprinting (no field) don't collide on null
+    await db.jobs.create_index(
+        "fingerprint", unique=True, partialFilterExpression={"fingerprint": {"$exists": True}}
+    )
+    # /jobs/list filters, each ending in _id so filtered pages are walked in
+    # index order without an in-memory sort
+    await db.jobs.create_index([("skills", 1), ("_id", DESCENDING)])
+    await db.jobs.create_index([("location_norm", 1), ("_id", DESCENDING)])
+    await db.jobs.create_index([("company_norm", 1), ("_id", DESCENDING)])
+
+
+def list_filter(cursor: Optional[str] = None, skills: Optional[List[str]] = None, skill_match: str = "all",
+                location: Optional[str] = None, company: Optional[str] = None) -> Dict:
+    """
+    Mongo filter for one /jobs/list page, newest first. `cursor` is the last
+    _id of the previous page (keyset pagination: every page is an index seek,
+    however deep). Location and company match as normalized prefixes, which
+    can use the index. Raises ValueError for a malformed cursor.
+    """
+    query = {}
+    if cursor:
+        if not ObjectId.is_valid(cursor):
+            raise ValueError("Invalid cursor")
+        query["_id"] = {"$lt": ObjectId(cursor)}
+    skills = [s.strip().lower() for s in skills or [] if s.strip()]
+    if skills:
+        query["skills"] = {"$all" if skill_match == "all" else "$in": skills}
+    for field, value in (("location_norm", location), ("company_norm", company)):
+        value = normalize_field(value)
+        if value:
+            query[field] = {"$regex": "^" + re.escape(value)}
+    return query
+
+
+def list_projection(fields: Optional[List[str]]) -> Optional[Dict]:
+    """Projection for the requested fields (None = whole document); ValueError for unknown ones."""
+    if not fields:
+        return None
+    unknown = [f for f in fields if f not in LIST_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(LIST_FIELDS)}")
+    return {f: 1 for f in fields}
+
+
+async def store_jobs(jobs: List[Dict]) -> Dict:
+    """
+    Upsert a batch of fetched postings keyed on their fingerprint. Postings
+    already stored with the same description are skipped (only last_seen_at
+    is bumped); new postings and changed descriptions get one batched skill
+    extraction pass, are written with a single bulk_write and (re)added to
+    the skill index. Returns inserted/updated/skipped counts and ids.
+    """
+    summary = {"inserted": 0, "updated": 0, "skipped": 0, "inserted_ids": [], "updated_ids": []}
+    if not jobs:
+        return summary
+
+    batch = {}
+    for job in jobs:
+        fingerprint = job_fingerprint(job)
+        if fingerprint in batch:
+            summary["skipped"] += 1  # same posting twice in one batch
+            continue
+        job["fingerprint"] = fingerprint
+        job["description_hash"] = description_hash(job)
+        job["title_norm"] = normalize_field(job.get("title"))
+        job["company_norm"] = normalize_field(job.get("company"))
+        job["location_norm"] = normalize_field(job.get("location"))
+        batch[fingerprint] = job
+
+    existing = {}
+    async for doc in db.jobs.find({"fingerprint": {"$in": list(batch)}},
+                                  {"fingerprint": 1, "description_hash": 1, "extractor_version": 1}):
+        existing[doc["fingerprint"]] = doc
+
+    now = datetime.now(timezone.utc)
+    changed, unchanged = [], []
+    for fp, job in batch.items():
+        # same text but skills from an older extractor: re-extract while we're here
+        if (fp in existing and existing[fp].get("description_hash") == job["description_hash"]
+                and existing[fp].get("extractor_version") == EXTRACTOR_VERSION):
+            unchanged.append(fp)
+        else:
+            changed.append(job)
+
+    skills_lists = await extract_skills_batch_cached([job_text(job) for job in changed])
+    ops = []
+    ids_lists = await skill_vocab.encode_many(skills_lists)
+    for job, skills, skill_ids in zip(changed, skills_lists, ids_lists):
+        job["skills"] = skills
+        job["skill_ids"] = skill_ids
+        job["skills_extracted"] = True if skills else False
+        job["extractor_version"] = EXTRACTOR_VERSION
+        job["skills_updated_at"] = now
+        ops.append(UpdateOne(
+            {"fingerprint": job["fingerprint"]},
+            {"$set": {**job, "last_seen_at": now}, "$setOnInsert": {"first_seen_at": now}},
+            upsert=True,
+        ))
+    seen_ops = [UpdateOne({"fingerprint": fp}, {"$set": {"last_seen_at": now}}) for fp in unchanged]
+    summary["skipped"] += len(unchanged)
+
+    upserted = {}
+    if ops or seen_ops:
+        try:
+            result = await db.jobs.bulk_write(ops + seen_ops, ordered=False)
+            upserted = result.upserted_ids
+        except BulkWriteError as e:
+            # a concurrent fetch inserted the same posting between our find and
+            # upsert; retrying those ops now matches the existing document
+            upserted = {u["index"]: u["_id"] for u in e.details.get("upserted", [])}
+            retry = [ops[err["index"]] for err in e.details.get("writeErrors", [])
+                     if err.get("code") == DUPLICATE_KEY and err["index"] < len(ops)]
+            if len(retry) != len(e.details.get("writeErrors", [])):
+                raise
+            await db.jobs.bulk_write(retry, ordered=False)
+
+    # ids of updated postings (and any that lost an insert race) for the skill index
+    updated_fps = [job["fingerprint"] for i, job in enumerate(changed) if i not in upserted]
+    updated_ids = {}
+    if updated_fps:
+        async for doc in db.jobs.find({"fingerprint": {"$in": updated_fps}}, {"fingerprint": 1}):
+            updated_ids[doc["fingerprint"]] = doc["_id"]
+
+    index_updates = []
+    for i, job in enumerate(changed):
+        if i in upserted:
+            summary["inserted"] += 1
+            summary["inserted_ids"].append(str(upserted[i]))
+            index_updates.append((upserted[i], job["skills"]))
+        elif job["fingerprint"] in updated_ids:
+            summary["updated"] += 1
+            summary["updated_ids"].append(str(updated_ids[job["fingerprint"]]))
+            index_updates.append((updated_ids[job["fingerprint"]], job["skills"]))
+    if index_updates:
+        await run_blocking(skill_index.add_jobs, index_updates)
+    # new postings and changed skills: (re)materialize their resume matches
+    match_store.schedule_job_refresh(summary["inserted_ids"] + summary["updated_ids"])
+    return summary
+
+
+async def backfill_fingerprints(delete_duplicates: bool = False, batch_size: int = 1000) -> Dict:
+    """
+    Fingerprint jobs stored before fingerprinting. The oldest copy of each
+    posting keeps the fingerprint; later copies are counted as duplicates and
+    deleted when `delete_duplicates` is set (otherwise left unfingerprinted).
+    """
+    summary = {"fingerprinted": 0, "duplicates": 0, "deleted": 0}
+    seen = set()
+    ops, doomed = [], []
+
+    async def flush():
+        if ops:
+            await db.jobs.bulk_write(ops, ordered=False)
+        if doomed:
+            result = await db.jobs.delete_many({"_id": {"$in": doomed}})
+            summary["deleted"] += result.deleted_count
+            for job_id in doomed:
+                skill_index.remove_job(job_id)
+            await match_store.remove_jobs(doomed)
+        ops.clear()
+        doomed.clear()
+
+    async for doc in db.jobs.find({"fingerprint": {"$exists": True}}, {"fingerprint": 1}):
+        seen.add(doc["fingerprint"])
+
+    query = {"fingerprint": {"$exists": False}}
+    async for job in db.jobs.find(query).sort("_id", 1):
+        fp = job_fingerprint(job)
+        if fp in seen:
+            summary["duplicates"] += 1
+            if delete_duplicates:
+                doomed.append(job["_id"])
+        else:
+            seen.add(fp)
+            ops.append(UpdateOne({"_id": job["_id"]}, {"$set": {
+                "fingerprint": fp,
+                "description_hash": description_hash(job),
+                "title_norm": normalize_field(job.get("title")),
+                "company_norm": normalize_field(job.get("company")),
+                "location_norm": normalize_field(job.get("location")),
+            }}))
+            summary["fingerprinted"] += 1
+        if len(ops) + len(doomed) >= batch_size:
+            await flush()
+    await flush()
+    return summary
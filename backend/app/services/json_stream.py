@@ -0,0 +1,68 @@
+# backend/app/services/json_stream.py
+import json
+from typing import Any, List, Tuple
+
+
+class JSONObjectStream:
+    """
+    Incremental parser for a JSON object arriving in arbitrary text chunks
+    (e.g. streamed LLM tokens). `feed()` returns the top-level (key, value)
+    members that completed in that chunk, so callers can act on each section
+    as soon as it closes instead of waiting for the whole object.
+
+    Text before the opening brace (```json fences, chatter) and after the
+    closing brace is ignored. A member that isn't valid JSON is skipped;
+    callers should still parse the full text at the end as the source of truth.
+    """
+
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member: List[str] = []
+        self.done = False
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        members = []
+        for ch in chunk:
+            if self.done:
+                break
+            if self._depth == 0:
+                if ch == "{":
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "]}":
+                self._depth -= 1
+                if self._depth == 0:
+                    # closing brace of the object ends the last member
+                    members.extend(self._flush())
+                    self.done = True
+                    continue
+            elif ch == "," and self._depth == 1:
+                members.extend(self._flush())
+                continue
+
+            self._member.append(ch)
+        return members
+
+    def _flush(self) -> List[Tuple[str, Any]]:
+        text = "".join(self._member).strip()
+        self._member = []
+        if not text:
+            return []
+        try:
+            return list(json.loads("{" + text + "}").items())
+        except ValueError:
+            return []
@@ -0,0 +1,186 @@
+# backend/app/services/llm_cache.py
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.services.cache import TTLCache
+from app.services.db import db
+
+# Responses younger than LLM_CACHE_TTL are served as-is
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+# With stale-while-revalidate on, older responses are still served for this long
+# while a background call refreshes them; Mongo drops entries after TTL + this window
+LLM_CACHE_STALE_TTL = int(os.getenv("LLM_CACHE_STALE_TTL", str(7 * 24 * 3600)))
+LLM_CACHE_SWR = os.getenv("LLM_CACHE_SWR", "false").lower() in ("1", "true", "yes")
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "1024"))
+
+COLLECTION = "llm_cache"
+logger = logging.getLogger(__name__)
+
+_memory = TTLCache(maxsize=LLM_CACHE_SIZE, ttl=LLM_CACHE_TTL + LLM_CACHE_STALE_TTL)
+_counters = {
+    "memory_hits": 0, "mongo_hits": 0, "stale_hits": 0, "misses": 0,
+    "refreshes": 0, "refresh_errors": 0, "mongo_errors": 0,
+}
+_counters_lock = threading.Lock()
+_refreshing = set()   # keys with a background refresh in flight
+_tasks = set()        # strong refs to refresh tasks
+_MISS = object()
+
+
+def _count(name: str, n: int = 1) -> None:
+    with _counters_lock:
+        _counters[name] += n
+
+
+def normalize(value: Any) -> Any:
+    """
+    Canonical form of prompt inputs: strings are trimmed, lowercased and
+    whitespace-collapsed; lists/sets become sorted, de-duplicated lists.
+    """
+    if isinstance(value, str):
+        return " ".join(value.split()).lower()
+    if isinstance(value, (list, tuple, set)):
+        items = (normalize(v) for v in value if not isinstance(v, str) or v.strip())
+        unique = {json.dumps(v, sort_keys=True, default=str): v for v in items}
+        return [unique[k] for k in sorted(unique)]
+    if isinstance(value, dict):
+        return {k: normalize(v) for k, v in sorted(value.items())}
+    return value
+
+
+def make_key(kind: str, inputs: Dict[str, Any], **params) -> str:
+    """`kind` names the prompt; `params` are the model settings (model, temperature, ...)."""
+    payload = json.dumps({"inputs": normalize(inputs), "params": params}, sort_keys=True, default=str)
+    return f"{kind}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+async def ensure_indexes() -> None:
+    await db[COLLECTION].create_index("created_at", expireAfterSeconds=LLM_CACHE_TTL + LLM_CACHE_STALE_TTL)
+
+
+async def _lookup(key: str) -> Tuple[Optional[dict], str]:
+    """(entry, tier) where tier is "memory" or "mongo"; entry is None when not cached."""
+    entry = _memory.get(key)
+    if entry is not None:
+        return entry, "memory"
+    try:
+        doc = await db[COLLECTION].find_one({"_id": key}, {"value": 1, "created_at": 1})
+    except Exception as e:
+        # the cache must never break generation; fall through to calling the model
+        _count("mongo_errors")
+        logger.warning("LLM cache read failed: %s", e)
+        return None, "mongo"
+    if doc is None:
+        return None, "mongo"
+    created = doc["created_at"]
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+    entry = {"value": doc["value"], "created_at": created.timestamp()}
+    _memory.set(key, entry)
+    return entry, "mongo"
+
+
+async def _store(key: str, value: Any, meta: Dict[str, Any]) -> None:
+    now = datetime.now(timezone.utc)
+    _memory.set(key, {"value": value, "created_at": now.timestamp()})
+    try:
+        await db[COLLECTION].update_one(
+            {"_id": key},
+            {"$set": {"value": value, "created_at": now, **meta}},
+            upsert=True,
+        )
+    except Exception as e:
+        _count("mongo_errors")
+        logger.warning("LLM cache write failed: %s", e)
+
+
+async def _refresh(key: str, compute: Callable[[], Awaitable[Any]], meta: Dict[str, Any]) -> None:
+    try:
+        value = await compute()
+        await _store(key, value, meta)
+        _count("refreshes")
+    except Exception as e:
+        _count("refresh_errors")
+        logger.warning("LLM cache refresh failed: %s", e)
+    finally:
+        _refreshing.discard(key)
+
+
+def _schedule_refresh(key: str, compute, meta) -> None:
+    if key in _refreshing:
+        return
+    _refreshing.add(key)
+    task = asyncio.get_running_loop().create_task(_refresh(key, compute, meta))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+
+async def get(key: str, compute: Optional[Callable[[], Awaitable[Any]]] = None, **meta) -> Any:
+    """
+    The cached response for `key`, or None. With stale-while-revalidate on,
+    a stale entry is returned too and, when `compute` is given, refreshed in
+    the background.
+    """
+    value = await _get(key, compute, meta)
+    return None if value is _MISS else value
+
+
+async def _get(key: str, compute, meta) -> Any:
+    entry, tier = await _lookup(key)
+    if entry is not None:
+        age = time.time() - entry["created_at"]
+        if age < LLM_CACHE_TTL:
+            _count(f"{tier}_hits")
+            return entry["value"]
+        if LLM_CACHE_SWR and age < LLM_CACHE_TTL + LLM_CACHE_STALE_TTL:
+            _count("stale_hits")
+            if compute is not None:
+                _schedule_refresh(key, compute, meta)
+            return entry["value"]
+    _count("misses")
+    return _MISS
+
+
+async def put(key: str, value: Any, **meta) -> None:
+    """Cache a successful response (e.g. one assembled from a stream)."""
+    await _store(key, value, meta)
+
+
+async def cached_call(key: str, compute: Callable[[], Awaitable[Any]], **meta) -> Any:
+    """
+    Return the cached response for `key`, or await `compute()` and cache its
+    result. `compute` should raise on failure: exceptions propagate and are
+    never cached. `meta` (kind, model, ...) is stored alongside for inspection.
+    """
+    value = await _get(key, compute, meta)
+    if value is _MISS:
+        value = await compute()
+        await _store(key, value, meta)
+    return value
+
+
+async def invalidate(key: str) -> None:
+    _memory.pop(key)
+    await db[COLLECTION].delete_one({"_id": key})
+
+
+def stats() -> Dict[str, object]:
+    with _counters_lock:
+        counters = dict(_counters)
+    fresh = counters["memory_hits"] + counters["mongo_hits"]
+    lookups = fresh + counters["stale_hits"] + counters["misses"]
+    return {
+        **counters,
+        "hit_ratio": round((fresh + counters["stale_hits"]) / lookups, 4) if lookups else 0.0,
+        "fresh_hit_ratio": round(fresh / lookups, 4) if lookups else 0.0,
+        "swr": LLM_CACHE_SWR,
+        "ttl": LLM_CACHE_TTL,
+        "memory": _memory.stats(),
+    }
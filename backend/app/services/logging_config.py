@@ -0,0 +1,37 @@
+# backend/app/services/logging_config.py
+import json
+import logging
+import os
+
+# WARNING keeps the request path quiet; DEBUG adds the LLM prompt/response dumps
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()   # "text" or "json" (one object per line)
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure() -> None:
+    """Attach one stderr handler to the `app` logger; safe to call more than once."""
+    logger = logging.getLogger("app")
+    logger.setLevel(LOG_LEVEL)
+    if any(getattr(h, "_app_handler", False) for h in logger.handlers):
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(JSONFormatter() if LOG_FORMAT == "json" else logging.Formatter(TEXT_FORMAT))
+    handler._app_handler = True
+    logger.addHandler(handler)
+    # uvicorn configures its own loggers; keep ours from printing twice through the root logger
+    logger.propagate = False
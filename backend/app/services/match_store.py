@@ -0,0 +1,216 @@
+# backend/app/services/match_store.py
+import os
+from datetime import datetime, timezone
+from functools import partial
+from typing import Dict, Iterable, List, Optional
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from app.services import matcher
+from app.services.db import db
+from app.services.executor import run_blocking
+from app.services.semantic_matcher import SEMANTIC_MODEL, SEMANTIC_THRESHOLD
+from app.services.singleflight import SingleFlight
+from app.services.skill_extractor import EXTRACTOR_VERSION
+from app.services.skill_index import skill_index, sync_skill_index
+from app.services.skill_vocab import attach_skill_ids
+from app.services.task_queue import PRIORITY_LOW, task_queue
+
+COLLECTION = "matches"
+# Best jobs (by shared skills) materialized for a resume whenever its skills change
+MATCH_PRECOMPUTE_K = int(os.getenv("MATCH_PRECOMPUTE_K", "50"))
+# Resumes sharing a skill that a new or changed job is materialized against
+MATCH_FANOUT = int(os.getenv("MATCH_FANOUT", "500"))
+MATCH_WRITE_BATCH = int(os.getenv("MATCH_WRITE_BATCH", "500"))
+
+RESUME_FIELDS = {"skills": 1, "skill_ids": 1}
+JOB_FIELDS = {"skills": 1, "skill_ids": 1, "title": 1}
+
+# Concurrent reads of the same missing pair share one lookup and scoring pass
+_flights = SingleFlight()
+
+
+def match_version(mode: str) -> str:
+    """Everything besides the two skill lists that a stored score depends on."""
+    if mode == "semantic":
+        return f"{mode}:{SEMANTIC_MODEL}:{SEMANTIC_THRESHOLD}"
+    return mode
+
+
+async def ensure_indexes() -> None:
+    await db[COLLECTION].create_index([("resume_id", 1), ("job_id", 1), ("mode", 1)], unique=True)
+    # invalidation when a job changes
+    await db[COLLECTION].create_index("job_id")
+    # resumes sharing a skill with a new job
+    await db.resumes.create_index("skills")
+
+
+def _is_current(doc: Optional[Dict]) -> bool:
+    return (doc is not None and doc.get("extractor_version") == EXTRACTOR_VERSION
+            and doc.get("version") == match_version(doc["mode"]))
+
+
+def build_match(resume: Dict, job: Dict, mode: str = "exact") -> Dict:
+    """The stored match document for a resume/job pair (may encode skills in semantic mode)."""
+    resume_skills = matcher.normalize_skills(resume.get("skills", []))
+    job_skills = matcher.normalize_skills(job.get("skills", []))
+    result = matcher.score_skills(resume_skills, job_skills, mode)
+    return _match_doc(resume, job, mode, result, resume_skills, job_skills)
+
+
+def _match_doc(resume: Dict, job: Dict, mode: str, result: Dict,
+               resume_skills: List[str], job_skills: List[str]) -> Dict:
+    doc = {
+        "resume_id": resume["_id"],
+        "job_id": job["_id"],
+        "mode": mode,
+        "score": result.get("match_percent", 0),
+        "matched": [str(s) for s in result["matched_skills"]],
+        "missing": [str(s) for s in result["skill_gap"]],
+        "resume_skills": resume_skills,
+        "job_skills": job_skills,
+        "job_title": job.get("title", "Unknown Role"),
+        "extractor_version": EXTRACTOR_VERSION,
+        "version": match_version(mode),
+    }
+    if "similar_skills" in result:
+        doc["similar_skills"] = result["similar_skills"]
+    return doc
+
+
+def _upsert(doc: Dict) -> UpdateOne:
+    key = {"resume_id": doc["resume_id"], "job_id": doc["job_id"], "mode": doc["mode"]}
+    return UpdateOne(key, {"$set": {**doc, "updated_at": datetime.now(timezone.utc)}}, upsert=True)
+
+
+async def _write(docs: List[Dict]) -> int:
+    for start in range(0, len(docs), MATCH_WRITE_BATCH):
+        await db[COLLECTION].bulk_write([_upsert(d) for d in docs[start:start + MATCH_WRITE_BATCH]], ordered=False)
+    return len(docs)
+
+
+def to_response(doc: Dict) -> Dict:
+    """Shape of the /match/{resume_id}/{job_id} response."""
+    response = {
+        "resume_id": str(doc["resume_id"]),
+        "job_id": str(doc["job_id"]),
+        "resume_skills": doc["resume_skills"],
+        "job_skills": doc["job_skills"],
+        "mode": doc["mode"],
+        "match_percent": doc["score"],
+        "matched_skills": doc["matched"],
+        "skill_gap": doc["missing"],
+    }
+    if "similar_skills" in doc:
+        response["similar_skills"] = doc["similar_skills"]
+    return response
+
+
+async def get_match(resume_id: str, job_id: str, mode: str = "exact") -> Dict:
+    """
+    The match document for a pair: one indexed lookup when it's materialized
+    and current, otherwise computed from the resume and job and stored
+    (read-through). Raises ValueError when either document doesn't exist.
+    """
+    resume_oid, job_oid = ObjectId(resume_id), ObjectId(job_id)
+    return await _flights.do((resume_oid, job_oid, mode), partial(_get_match, resume_oid, job_oid, mode))
+
+
+async def _get_match(resume_oid: ObjectId, job_oid: ObjectId, mode: str) -> Dict:
+    doc = await db[COLLECTION].find_one({"resume_id": resume_oid, "job_id": job_oid, "mode": mode})
+    if _is_current(doc):
+        return doc
+
+    resume = await db.resumes.find_one({"_id": resume_oid}, RESUME_FIELDS)
+    if not resume:
+        raise ValueError("Resume not found")
+    job = await db.jobs.find_one({"_id": job_oid}, JOB_FIELDS)
+    if not job:
+        raise ValueError("Job not found")
+
+    # semantic mode may have to encode unseen skills, keep that off the event loop
+    doc = await run_blocking(build_match, resume, job, mode)
+    await _write([doc])
+    return doc
+
+
+async def refresh_resume(resume_id) -> int:
+    """
+    A resume's skills changed: drop all its stored matches (any mode) and
+    materialize exact matches against its top MATCH_PRECOMPUTE_K jobs.
+    """
+    resume_oid = ObjectId(resume_id)
+    await db[COLLECTION].delete_many({"resume_id": resume_oid})
+    resume = await db.resumes.find_one({"_id": resume_oid}, RESUME_FIELDS)
+    if not resume or not resume.get("skills"):
+        return 0
+
+    resume_skills = matcher.normalize_skills(resume["skills"])
+    await sync_skill_index()
+    ranked = await run_blocking(skill_index.top_k, resume_skills, MATCH_PRECOMPUTE_K)
+    job_ids = [ObjectId(job_id) for job_id, _ in ranked]
+    jobs = await db.jobs.find({"_id": {"$in": job_ids}}, JOB_FIELDS).to_list(len(job_ids))
+    await attach_skill_ids([resume, *jobs])
+    results = matcher.compute_match_many(resume["skill_ids"], [job["skill_ids"] for job in jobs])
+    return await _write([
+        _match_doc(resume, job, "exact", result, resume_skills, matcher.normalize_skills(job.get("skills", [])))
+        for job, result in zip(jobs, results)
+    ])
+
+
+async def refresh_jobs(job_ids: Iterable) -> int:
+    """
+    Jobs were inserted or their skills changed: drop their stored matches
+    and recompute exact matches for the resumes that had one, plus up to
+    MATCH_FANOUT resumes sharing a skill with the job.
+    """
+    written = 0
+    for job_id in job_ids:
+        job_oid = ObjectId(job_id)
+        previous = await db[COLLECTION].distinct("resume_id", {"job_id": job_oid})
+        await db[COLLECTION].delete_many({"job_id": job_oid})
+        job = await db.jobs.find_one({"_id": job_oid}, JOB_FIELDS)
+        if not job:
+            continue
+        skills = matcher.normalize_skills(job.get("skills", []))
+        # every resume that had a match is recomputed; only new candidates are capped
+        resumes = await db.resumes.find({"_id": {"$in": previous}}, RESUME_FIELDS).to_list(None)
+        if skills:
+            candidates = {"skills": {"$in": skills}, "_id": {"$nin": previous}}
+            resumes += await db.resumes.find(candidates, RESUME_FIELDS).limit(MATCH_FANOUT).to_list(None)
+        await attach_skill_ids([job, *resumes])
+        results = matcher.compute_match_many_resumes([r["skill_ids"] for r in resumes], job["skill_ids"])
+        written += await _write([
+            _match_doc(resume, job, "exact", result, matcher.normalize_skills(resume.get("skills", [])), skills)
+            for resume, result in zip(resumes, results)
+        ])
+    return written
+
+
+async def remove_jobs(job_ids: Iterable) -> None:
+    await db[COLLECTION].delete_many({"job_id": {"$in": [ObjectId(j) for j in job_ids]}})
+
+
+def schedule_resume_refresh(resume_ids: Iterable) -> None:
+    """Queue refresh_resume for each resume behind interactive work."""
+    for resume_id in resume_ids:
+        task_queue.submit("matches.resume", partial(refresh_resume, resume_id), priority=PRIORITY_LOW,
+                          dedupe_key=("matches.resume", str(resume_id)))
+
+
+def schedule_job_refresh(job_ids: Iterable) -> None:
+    job_ids = [str(j) for j in job_ids]
+    if job_ids:
+        task_queue.submit("matches.jobs", partial(refresh_jobs, job_ids), priority=PRIORITY_LOW)
+
+
+async def backfill(batch_size: int = 1000, on_progress=None) -> Dict:
+    """Materialize matches for every resume with skills (the incremental hooks keep them fresh afterwards)."""
+    summary = {"resumes": 0, "matches": 0}
+    async for resume in db.resumes.find({"skills": {"$exists": True, "$ne": []}}, {"_id": 1}).batch_size(batch_size):
+        summary["matches"] += await refresh_resume(resume["_id"])
+        summary["resumes"] += 1
+        if on_progress and summary["resumes"] % batch_size == 0:
+            on_progress(summary)
+    return summary
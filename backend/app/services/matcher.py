@@ -1,6 +1,30 @@
-from typing import Dict, List, Tuple
+from itertools import chain
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
 from bson import ObjectId
 from app.services.db import db
+from app.services.executor import run_blocking
+from app.services.skill_index import skill_index, sync_skill_index
+from app.services.semantic_matcher import compute_semantic_match
+from app.services.skill_vocab import SkillVocab, attach_skill_ids, skill_vocab
+
+MATCH_MODES = ("exact", "semantic")
+
+# Fields returned for each job in top-K results (full descriptions are not needed for ranking)
+TOP_JOB_FIELDS = {"title": 1, "company": 1, "location": 1, "link": 1, "skills": 1, "skill_ids": 1}
+
+
+def normalize_skills(skills) -> List[str]:
+    """Flatten nested lists & clean strings"""
+    flat = []
+    for s in skills:
+        if isinstance(s, list):
+            flat.extend(normalize_skills(s))  # recursive flatten
+        elif isinstance(s, str):
+            clean_s = s.strip().lower()
+            if clean_s:
+                flat.append(clean_s)
+    return flat
 
 
 def compute_match(resume_skills: List[str], job_skills: List[str]) -> Dict:
@@ -22,26 +46,117 @@ def compute_match(resume_skills: List[str], job_skills: List[str]) -> Dict:
     }
 
 
-def match_resume_to_job(resume_id: str, job_id: str) -> Dict:
-    # fetch resume
-    resume = db.resumes.find_one({"_id": ObjectId(resume_id)})
+def _hits(probe_ids: Sequence[int], rows: Sequence[Sequence[int]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Flattened `rows`, a mask of which of those ids are in `probe_ids`, and
+    each row's length. The probe becomes a bitmap over the id space, so
+    testing every id of every row is a single gather.
+    """
+    lengths = np.fromiter((len(r) for r in rows), dtype=np.int64, count=len(rows))
+    flat = np.fromiter(chain.from_iterable(rows), dtype=np.int64, count=int(lengths.sum()))
+    probe = np.asarray(probe_ids, dtype=np.int64)
+    size = int(max(probe.max(initial=-1), flat.max(initial=-1))) + 1
+    bitmap = np.zeros(size, dtype=bool)
+    bitmap[probe] = True
+    return flat, bitmap[flat], lengths
+
+
+def match_percents(resume_ids: Sequence[int], jobs_ids: Sequence[Sequence[int]]) -> np.ndarray:
+    """
+    compute_match's match_percent (unrounded) of one resume against many
+    jobs, from sorted distinct skill ids (see skill_vocab), in one pass.
+    """
+    resume_ids = np.unique(np.asarray(resume_ids, dtype=np.int64))
+    if not len(resume_ids) or not len(jobs_ids):
+        return np.zeros(len(jobs_ids))
+    flat, hits, lengths = _hits(resume_ids, jobs_ids)
+    rows = np.repeat(np.arange(len(jobs_ids)), lengths)
+    overlap = np.bincount(rows[hits], minlength=len(jobs_ids))
+    return overlap / len(resume_ids) * 100
+
+
+def _result(matched: List[str], gap: List[str], resume_count: int) -> Dict:
+    percent = round(len(matched) / resume_count * 100, 2) if resume_count else 0.0
+    return {"match_percent": percent, "matched_skills": matched, "skill_gap": gap}
+
+
+def compute_match_many(resume_ids: Sequence[int], jobs_ids: Sequence[Sequence[int]],
+                       vocab: SkillVocab = skill_vocab) -> List[Dict]:
+    """
+    compute_match for one resume against many jobs, from skill ids. Every id
+    must be known to `vocab` (SkillVocab.resolve) to decode the skill lists.
+    """
+    resume_ids = np.unique(np.asarray(resume_ids, dtype=np.int64))
+    flat, hits, lengths = _hits(resume_ids, jobs_ids)
+    # decoding and splitting plain lists beats slicing thousands of tiny arrays
+    names, hits = vocab.decode(flat.tolist()), hits.tolist()
+    results, start = [], 0
+    for length in lengths.tolist():
+        end = start + length
+        matched = [name for name, hit in zip(names[start:end], hits[start:end]) if hit]
+        gap = [name for name, hit in zip(names[start:end], hits[start:end]) if not hit]
+        results.append(_result(matched, gap, len(resume_ids)))
+        start = end
+    return results
+
+
+def compute_match_many_resumes(resumes_ids: Sequence[Sequence[int]], job_ids: Sequence[int],
+                               vocab: SkillVocab = skill_vocab) -> List[Dict]:
+    """compute_match for many resumes against one job, from skill ids (the job's fan-out direction)."""
+    job_ids = np.unique(np.asarray(job_ids, dtype=np.int64))
+    flat, hits, lengths = _hits(job_ids, resumes_ids)
+    results, start = [], 0
+    for length in lengths.tolist():
+        ids, hit = flat[start:start + length], hits[start:start + length]
+        start += length
+        matched = ids[hit]
+        gap = np.setdiff1d(job_ids, matched, assume_unique=True)
+        results.append(_result(vocab.decode(matched.tolist()), vocab.decode(gap.tolist()), length))
+    return results
+
+
+def score_skills(resume_skills: List[str], job_skills: List[str], mode: str = "exact") -> Dict:
+    """Score a resume/job skill pair with exact string matching or embedding similarity."""
+    if mode == "semantic":
+        return compute_semantic_match(resume_skills, job_skills)
+    if mode != "exact":
+        raise ValueError(f"Unknown match mode '{mode}', expected one of {MATCH_MODES}")
+    return compute_match(resume_skills, job_skills)
+
+
+async def top_jobs_for_resume(resume_id: str, k: int = 10) -> Dict:
+    """Best k jobs for a resume by compute_match score, using the inverted skill index."""
+    resume = await db.resumes.find_one({"_id": ObjectId(resume_id)}, {"skills": 1, "skill_ids": 1})
     if not resume:
         raise ValueError("Resume not found")
+    resume_skills = resume.get("skills", [])
 
-    # fetch job
-    job = db.jobs.find_one({"_id": ObjectId(job_id)})
-    if not job:
-        raise ValueError("Job not found")
+    await sync_skill_index()
+    ranked = await run_blocking(skill_index.top_k, resume_skills, k)
 
-    resume_skills = resume.get("skills", [])
-    job_skills = job.get("skills", [])
+    job_ids = [ObjectId(job_id) for job_id, _ in ranked]
+    cursor = db.jobs.find({"_id": {"$in": job_ids}}, TOP_JOB_FIELDS)
+    jobs = {str(j["_id"]): j async for j in cursor}
 
-    result = compute_match(resume_skills, job_skills)
+    found = []
+    for job_id, _ in ranked:
+        if job_id in jobs:
+            found.append(jobs[job_id])
+        else:
+            # deleted since it was indexed
+            skill_index.remove_job(job_id)
+    await attach_skill_ids([resume, *found])
+    matches = compute_match_many(resume["skill_ids"], [job["skill_ids"] for job in found])
 
-    return {
-        "resume_id": str(resume["_id"]),
-        "job_id": str(job["_id"]),
-        "resume_skills": resume_skills,
-        "job_skills": job_skills,
-        **result,
-    }
+    results = []
+    for job, match in zip(found, matches):
+        results.append({
+            "job_id": str(job["_id"]),
+            "title": job.get("title"),
+            "company": job.get("company"),
+            "location": job.get("location"),
+            "link": job.get("link"),
+            **match,
+        })
+
+    return {"resume_id": resume_id, "k": k, "results": results}
@@ -0,0 +1,205 @@
+# backend/app/services/metrics.py
+"""
+Minimal Prometheus-style metrics: counters and histograms with labels,
+collectors for values that live elsewhere (cache counters), and the text
+exposition format served at GET /metrics. No client library needed.
+"""
+import asyncio
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Tuple
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# Seconds; spans sub-millisecond Mongo calls to multi-second LLM completions
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+_registry: List["_Metric"] = []
+_collectors: List[Callable[[], Iterable[Tuple[str, str, str, Dict[str, str], float]]]] = []
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: Tuple, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def _key(self, labels: Dict) -> Tuple:
+        return tuple(labels.get(n, "") for n in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name, help, labelnames=()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+        return self.header() + [f"{self.name}{_labels(self.labelnames, k)} {v}" for k, v in values.items()]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets)
+        self._values: Dict[Tuple, list] = {}  # key -> [bucket counts..., +Inf count, sum]
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[i] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = {k: list(v) for k, v in self._values.items()}
+        lines = self.header()
+        for key, series in values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), series[:-1]):
+                cumulative += count
+                le = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {series[-1]}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template (to response headers)",
+    ("method", "route", "status"),
+)
+STAGE_LATENCY = Histogram("stage_duration_seconds", "Latency of internal processing stages", ("stage",))
+STAGE_ERRORS = Counter("stage_errors_total", "Stages that raised", ("stage",))
+LLM_TOKENS = Counter("llm_tokens_total", "LLM tokens reported by the API", ("model", "type"))
+
+
+def record_stage(stage: str, seconds: float, failed: bool = False) -> None:
+    """Observe a stage duration measured by the caller (e.g. summed over a lazy iterator)."""
+    if not METRICS_ENABLED:
+        return
+    STAGE_LATENCY.observe(seconds, stage=stage)
+    if failed:
+        STAGE_ERRORS.inc(stage=stage)
+
+
+class timed:
+    """
+    Record the duration of a stage in STAGE_LATENCY. Use as a context
+    manager (`with timed("spacy"):`) or a decorator on sync or async
+    functions (`@timed("serpapi_fetch")`).
+    """
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        failed = exc_type is not None and not issubclass(exc_type, asyncio.CancelledError)
+        record_stage(self.stage, time.perf_counter() - self._start, failed)
+        return False
+
+    def __call__(self, fn):
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with timed(self.stage):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timed(self.stage):
+                return fn(*args, **kwargs)
+        return wrapper
+
+
+def record_llm_usage(model: str, usage) -> None:
+    """Count prompt/completion tokens from an OpenAI-style `usage` object (if the API sent one)."""
+    if usage is None or not METRICS_ENABLED:
+        return
+    for kind in ("prompt_tokens", "completion_tokens"):
+        count = getattr(usage, kind, None)
+        if count:
+            LLM_TOKENS.inc(count, model=model, type=kind.split("_")[0])
+
+
+def mongo_command_listener():
+    """Driver-level hook for the Mongo client: every command is a `mongo.<command>` stage."""
+    # imported here so parser / spaCy worker processes don't load the driver
+    from pymongo import monitoring
+
+    class MongoCommandTimer(monitoring.CommandListener):
+        def started(self, event) -> None:
+            pass
+
+        def succeeded(self, event) -> None:
+            record_stage(f"mongo.{event.command_name}", event.duration_micros / 1e6)
+
+        def failed(self, event) -> None:
+            record_stage(f"mongo.{event.command_name}", event.duration_micros / 1e6, failed=True)
+
+    return MongoCommandTimer()
+
+
+def register_collector(fn: Callable[[], Iterable[Tuple[str, str, str, Dict[str, str], float]]]) -> None:
+    """`fn()` yields (name, type, help, labels, value) samples at scrape time."""
+    _collectors.append(fn)
+
+
+def render() -> str:
+    lines: List[str] = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    # samples of one metric must be contiguous, whichever collector produced them
+    grouped: Dict[str, list] = {}
+    for collect in _collectors:
+        try:
+            samples = list(collect())
+        except Exception:
+            continue  # a broken collector must not break the scrape
+        for name, kind, help, labels, value in samples:
+            if name not in grouped:
+                grouped[name] = [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+            grouped[name].append(f"{name}{_labels(tuple(labels), tuple(labels.values()))} {value}")
+    for group in grouped.values():
+        lines.extend(group)
+    return "\n".join(lines) + "\n"
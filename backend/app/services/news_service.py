@@ -1,24 +1,218 @@
+# backend/app/services/news_service.py
+import asyncio
+import logging
 import os
-import requests
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from app.services.cache import TTLCache
+from app.services.metrics import timed
 
 RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY")
+# Overridable so the news route can be pointed at a local stub
+NEWS_API_URL = os.getenv("NEWS_API_URL", "https://google-news13.p.rapidapi.com/technology?lr=en-US")
+NEWS_API_HOST = os.getenv("NEWS_API_HOST", "google-news13.p.rapidapi.com")
+NEWS_TIMEOUT = float(os.getenv("NEWS_TIMEOUT", "5"))
+NEWS_MAX_CONNECTIONS = int(os.getenv("NEWS_MAX_CONNECTIONS", "10"))
+
+# Results are fresh for NEWS_CACHE_TTL, then served as stale (flagged) for up
+# to NEWS_STALE_TTL more while upstream is slow or down
+NEWS_CACHE_TTL = int(os.getenv("NEWS_CACHE_TTL", "600"))
+NEWS_STALE_TTL = int(os.getenv("NEWS_STALE_TTL", str(24 * 3600)))
+NEWS_CACHE_SIZE = int(os.getenv("NEWS_CACHE_SIZE", "256"))
+# Items fetched per query whatever the requested limit, so smaller limits share one entry
+NEWS_PAGE_SIZE = int(os.getenv("NEWS_PAGE_SIZE", "20"))
+# With a stale entry in hand, wait this long for upstream before answering with it
+NEWS_STALE_WAIT = float(os.getenv("NEWS_STALE_WAIT", "1"))
+
+# Background refresh of the most recently requested queries before they expire; 0 disables it
+NEWS_REFRESH_INTERVAL = int(os.getenv("NEWS_REFRESH_INTERVAL", "60"))
+NEWS_HOT_QUERIES = int(os.getenv("NEWS_HOT_QUERIES", "10"))
+NEWS_HOT_WINDOW = int(os.getenv("NEWS_HOT_WINDOW", "3600"))
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+_cache = TTLCache(maxsize=NEWS_CACHE_SIZE, ttl=NEWS_CACHE_TTL + NEWS_STALE_TTL)
+_requested: Dict[str, float] = {}      # query key -> last asked for, oldest first; NEWS_CACHE_SIZE at most
+_fetching: Dict[Tuple[str, int], asyncio.Task] = {}  # one upstream call per query and page size at a time
+_refresher: Optional[asyncio.Task] = None
+_counters = {"memory_hits": 0, "stale_hits": 0, "misses": 0, "errors": 0, "refreshes": 0}
+_counters_lock = threading.Lock()
+
+
+class NewsUnavailable(Exception):
+    """Upstream failed and there is nothing cached to fall back on."""
+
+
+def _count(name: str) -> None:
+    with _counters_lock:
+        _counters[name] += 1
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=NEWS_TIMEOUT,
+            limits=httpx.Limits(max_connections=NEWS_MAX_CONNECTIONS,
+                                max_keepalive_connections=NEWS_MAX_CONNECTIONS),
+            headers={"x-rapidapi-key": RAPIDAPI_KEY or "", "x-rapidapi-host": NEWS_API_HOST},
+        )
+    return _client
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(str(query).split()).lower()
+
+
+async def _fetch(query: str, page_size: int) -> List[Dict]:
+    params = {"q": query, "pageNumber": 1, "pageSize": page_size, "autoCorrect": True}
+    with timed("news_fetch"):
+        response = await get_http_client().get(NEWS_API_URL, params=params)
+        response.raise_for_status()
+        data = response.json()
+    items = data.get("items", [])
+    logger.debug("News API returned %d items for %r", len(items), query)
+    return items
+
+
+async def _refresh(key: str, page_size: int) -> Dict:
+    """Fetch `key` from upstream and cache it; concurrent callers share one request."""
+    task = _fetching.get((key, page_size))
+    if task is None:
+        async def run():
+            try:
+                items = await _fetch(key, page_size)
+                entry = {"items": items, "page_size": page_size, "fetched_at": time.time()}
+                _cache.set(key, entry)
+                return entry
+            finally:
+                _fetching.pop((key, page_size), None)
+
+        task = _fetching[key, page_size] = asyncio.get_running_loop().create_task(run())
+        # callers that fell back to stale data never await the result; don't log it as unretrieved
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    # shielded so a caller that gives up (stale fallback, disconnect) doesn't cancel the fetch
+    return await asyncio.shield(task)
 
-def fetch_career_news(query="internship jobs", limit=5):
-    url = "https://google-news13.p.rapidapi.com/technology?lr=en-US"
-    headers = {
-        "x-rapidapi-key": RAPIDAPI_KEY,
-        "x-rapidapi-host": "google-news13.p.rapidapi.com"
-    }
-    params = {
-        "q": query,
-        "pageNumber": 1,
-        "pageSize": limit,
-        "autoCorrect": True
-    }
 
-    response = requests.get(url, headers=headers, params=params)
-    response.raise_for_status()
-    data = response.json()
-    print("DEBUG: Raw API response:", data)  # <-- debug print
-    # Return the 'items' list directly from the API response
-    return data.get("items", [])
+def _covers(entry: Dict, limit: int) -> bool:
+    """A cached page answers `limit` if it was fetched at least that large, or upstream had no more."""
+    return entry["page_size"] >= limit or len(entry["items"]) < entry["page_size"]
+
+
+def _track(key: str) -> None:
+    # re-inserted so the dict stays ordered by last request; past the cap the
+    # least recently requested query is forgotten (it wouldn't be hot anyway)
+    _requested.pop(key, None)
+    _requested[key] = time.time()
+    if len(_requested) > NEWS_CACHE_SIZE:
+        del _requested[next(iter(_requested))]
+
+
+def _meta(cache: str, entry: Dict) -> Dict:
+    return {"cache": cache, "age": int(time.time() - entry["fetched_at"])}
+
+
+async def get_news(query: str = "internship jobs", limit: int = 5) -> Tuple[List[Dict], Dict]:
+    """
+    Up to `limit` news items for `query` and how they were served:
+    {"cache": "hit" | "miss" | "stale", "age": seconds since fetched}.
+    Stale items, or a cached page smaller than `limit`, come back when
+    upstream errors or takes longer than NEWS_STALE_WAIT; raises
+    NewsUnavailable when there is nothing cached to serve.
+    """
+    key = normalize_query(query)
+    _track(key)
+    entry = _cache.get(key)
+    # a smaller page than this request needs is refetched bigger, but kept to fall back on
+    if entry is not None and _covers(entry, limit) and time.time() - entry["fetched_at"] < NEWS_CACHE_TTL:
+        _count("memory_hits")
+        return entry["items"][:limit], _meta("hit", entry)
+
+    page_size = max(limit, NEWS_PAGE_SIZE)
+    try:
+        if entry is None:
+            fresh = await _refresh(key, page_size)
+        else:
+            fresh = await asyncio.wait_for(_refresh(key, page_size), NEWS_STALE_WAIT)
+    except (httpx.HTTPError, ValueError, asyncio.TimeoutError) as e:
+        if entry is None:
+            _count("errors")
+            raise NewsUnavailable(str(e) or type(e).__name__)
+        logger.warning("News API failed or slow for %r (%s), serving stale results",
+                       key, str(e) or type(e).__name__)
+        _count("stale_hits")
+        return entry["items"][:limit], _meta("stale", entry)
+    _count("misses")
+    return fresh["items"][:limit], _meta("miss", fresh)
+
+
+def hot_queries() -> List[str]:
+    """The NEWS_HOT_QUERIES most recently requested queries within NEWS_HOT_WINDOW."""
+    cutoff = time.time() - NEWS_HOT_WINDOW
+    for key in [k for k, at in _requested.items() if at < cutoff]:
+        del _requested[key]
+    return list(reversed(_requested))[:NEWS_HOT_QUERIES]
+
+
+async def refresh_hot() -> int:
+    """Refetch hot queries that would expire before the next pass; returns how many were refreshed."""
+    refreshed = 0
+    for key in hot_queries():
+        entry = _cache.get(key)
+        if entry is not None and time.time() - entry["fetched_at"] < NEWS_CACHE_TTL - NEWS_REFRESH_INTERVAL:
+            continue
+        try:
+            await _refresh(key, entry["page_size"] if entry else NEWS_PAGE_SIZE)
+            refreshed += 1
+            _count("refreshes")
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning("Background news refresh failed for %r: %s", key, e)
+    return refreshed
+
+
+async def _refresh_loop() -> None:
+    while True:
+        await asyncio.sleep(NEWS_REFRESH_INTERVAL)
+        try:
+            await refresh_hot()
+        except Exception:
+            logger.exception("News refresher pass failed")
+
+
+def start() -> None:
+    global _refresher
+    if NEWS_REFRESH_INTERVAL > 0 and _refresher is None:
+        _refresher = asyncio.get_running_loop().create_task(_refresh_loop())
+
+
+async def stop() -> None:
+    global _client, _refresher
+    if _refresher is not None:
+        _refresher.cancel()
+        try:
+            await _refresher
+        except asyncio.CancelledError:
+            pass
+        _refresher = None
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def stats() -> Dict[str, object]:
+    with _counters_lock:
+        counters = dict(_counters)
+    lookups = counters["memory_hits"] + counters["stale_hits"] + counters["misses"] + counters["errors"]
+    return {
+        **counters,
+        "hit_ratio": round((counters["memory_hits"] + counters["stale_hits"]) / lookups, 4) if lookups else 0.0,
+        "ttl": NEWS_CACHE_TTL,
+        "hot_queries": hot_queries(),
+        "memory": _cache.stats(),
+    }
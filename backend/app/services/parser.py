@@ -1,13 +1,220 @@
 # backend/app/services/parser.py
 import os
-from pdfminer.high_level import extract_text
-import docx2txt
+import re
+import zipfile
+from io import StringIO
+from typing import Iterator, List, Optional, Tuple
+from xml.etree import ElementTree
 
-def extract_text_from_file(file_path: str) -> str:
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfdevice import PDFTextDevice
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdffont import PDFUnicodeNotDefined
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import resolve1
+
+# Bump whenever a code change alters the text extracted from a file; stored
+# skills and cached extractions from the old text are then re-extracted
+PARSER_REVISION = "1"
+
+# "plain" writes characters in content-stream order and breaks lines where the
+# baseline moves: no layout objects or box grouping, several times faster and
+# all skill extraction needs. "layout" runs pdfminer's full layout analysis
+# (reading order across columns, like pdfminer's extract_text).
+PDF_TEXT_MODE = os.getenv("PDF_TEXT_MODE", "plain")
+# Stop reading a PDF at the end of the page where this many characters have
+# been collected (0 = read every page). Skills sections sit near the top of a
+# CV, so long portfolios needn't be read to the end.
+PDF_TEXT_BUDGET = int(os.getenv("PDF_TEXT_BUDGET", "0"))
+# PDFs with at least this many pages are split into PDF_PAGES_PER_TASK-page
+# ranges parsed in parallel in the process pool (0 = never split)
+PDF_PARALLEL_PAGES = int(os.getenv("PDF_PARALLEL_PAGES", "8"))
+PDF_PAGES_PER_TASK = int(os.getenv("PDF_PAGES_PER_TASK", "4"))
+
+PAGE_BREAK = "\f"
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+DOCX_HEADER = re.compile(r"word/header[0-9]*\.xml")
+DOCX_FOOTER = re.compile(r"word/footer[0-9]*\.xml")
+
+
+def text_version() -> str:
+    """The code revision and settings that decide what text comes out of a file, for versions and cache keys."""
+    mode = f"{PDF_TEXT_MODE}:b{PDF_TEXT_BUDGET}" if PDF_TEXT_BUDGET else PDF_TEXT_MODE
+    return f"r{PARSER_REVISION}:{mode}"
+
+
+class PlainTextDevice(PDFTextDevice):
+    """
+    Collects the characters of each page in drawing order. A new line starts
+    when the baseline moves by more than half the font size (a blank line
+    when it moves by more than two lines' worth), and a space is inserted
+    where the pen jumps ahead further than a narrow space.
+    """
+
+    def __init__(self, rsrcmgr: PDFResourceManager):
+        super().__init__(rsrcmgr)
+        self.parts: List[str] = []
+        self._end: Optional[Tuple[float, float]] = None
+
+    def begin_page(self, page, ctm) -> None:
+        super().begin_page(page, ctm)
+        self.parts = []
+        self._end = None
+
+    def render_char(self, matrix, font, fontsize, scaling, rise, cid, ncs, graphicstate) -> float:
+        try:
+            text = font.to_unichr(cid)
+        except PDFUnicodeNotDefined:
+            text = ""
+        advance = font.char_width(cid) * fontsize * scaling
+        a, _, _, d, x, y = matrix
+        size = fontsize * (abs(d) or 1.0)
+        if self._end is not None:
+            end_x, end_y = self._end
+            drop = abs(y - end_y)
+            if drop > size * 0.5:
+                self.parts.append("\n\n" if drop > size * 2.5 else "\n")
+            elif x - end_x > size * 0.15 and not self.parts[-1].isspace():
+                self.parts.append(" ")
+        self.parts.append(text)
+        self._end = (x + advance * a, y)
+        return advance
+
+    def text(self) -> str:
+        return "".join(self.parts) + "\n"
+
+
+def _pages(fp, max_pages: Optional[int] = None, first: int = 0, last: Optional[int] = None):
+    pagenos = set(range(first, last)) if last is not None else None
+    return PDFPage.get_pages(fp, pagenos=pagenos, maxpages=max_pages or 0)
+
+
+def iter_pdf_pages(file_path: str, max_pages: Optional[int] = None,
+                   first: int = 0, last: Optional[int] = None) -> Iterator[str]:
+    """
+    Yield the text of a PDF one page at a time (pages `first` to `last` - 1
+    when given), so only the current page is held in memory and callers can
+    stop early. Every page ends with a form feed, as in pdfminer's output.
+    """
+    rsrcmgr = PDFResourceManager(caching=True)
+    if PDF_TEXT_MODE == "layout":
+        buf = StringIO()
+        device = TextConverter(rsrcmgr, buf, laparams=LAParams())
+    else:
+        device = PlainTextDevice(rsrcmgr)
+    try:
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        with open(file_path, "rb") as fp:
+            for page in _pages(fp, max_pages, first, last):
+                interpreter.process_page(page)
+                if PDF_TEXT_MODE == "layout":
+                    yield buf.getvalue()
+                    buf.seek(0)
+                    buf.truncate(0)
+                else:
+                    yield device.text() + PAGE_BREAK
+    finally:
+        device.close()
+
+
+def join_pages(pages: Iterator[str]) -> str:
+    """Concatenate page texts, stopping after the page that fills PDF_TEXT_BUDGET."""
+    if not PDF_TEXT_BUDGET:
+        return "".join(pages)
+    collected, size = [], 0
+    for page in pages:
+        collected.append(page)
+        size += len(page)
+        if size >= PDF_TEXT_BUDGET:
+            break
+    return "".join(collected)
+
+
+def pdf_page_count(file_path: str) -> int:
+    """Page count from the page tree root, without parsing any page."""
+    with open(file_path, "rb") as fp:
+        document = PDFDocument(PDFParser(fp))
+        pages = resolve1(document.catalog.get("Pages"))
+        return int(resolve1(pages.get("Count", 0))) if pages else 0
+
+
+def pdf_page_ranges(file_path: str, max_pages: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    (first, last) page ranges to parse in parallel, or [] when the document
+    is read in one go (short, not a PDF, page budget set, or the page tree
+    can't be read up front).
+    """
+    if PDF_PARALLEL_PAGES <= 0 or PDF_TEXT_BUDGET or os.path.splitext(file_path)[1].lower() != ".pdf":
+        return []
+    try:
+        count = pdf_page_count(file_path)
+    except Exception:
+        return []
+    if max_pages:
+        count = min(count, max_pages)
+    if count < PDF_PARALLEL_PAGES:
+        return []
+    step = max(1, PDF_PAGES_PER_TASK)
+    return [(first, min(first + step, count)) for first in range(0, count, step)]
+
+
+def extract_pdf_pages(file_path: str, first: int, last: int) -> str:
+    """Text of pages `first` to `last` - 1, one task of a parallel extraction."""
+    return "".join(iter_pdf_pages(file_path, first=first, last=last))
+
+
+def _docx_part_text(stream, chunk_size: int = 64 * 1024) -> List[str]:
+    """
+    Text of one WordprocessingML part, parsed as it is decompressed: runs'
+    text, tabs and breaks, and a blank line where each paragraph starts (the
+    same text docx2txt produces, without building the whole tree first).
+    """
+    P, T, TAB, BR, CR = _W + "p", _W + "t", _W + "tab", _W + "br", _W + "cr"
+    pull = ElementTree.XMLPullParser(events=("start", "end"))
+    out = []
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        pull.feed(chunk)
+        for event, elem in pull.read_events():
+            tag = elem.tag
+            if event == "start":
+                if tag == P:
+                    out.append("\n\n")
+                elif tag == TAB:
+                    out.append("\t")
+                elif tag == BR or tag == CR:
+                    out.append("\n")
+            elif tag == T:
+                if elem.text:
+                    out.append(elem.text)
+            elif tag == P:
+                elem.clear()  # paragraph done; don't keep its runs around
+    pull.close()
+    return out
+
+
+def extract_docx_text(file_path: str) -> str:
+    """Headers, body and footers of a DOCX, in docx2txt's order."""
+    with zipfile.ZipFile(file_path) as zf:
+        names = zf.namelist()
+        parts = ([n for n in names if DOCX_HEADER.match(n)] + ["word/document.xml"]
+                 + [n for n in names if DOCX_FOOTER.match(n)])
+        chunks = []
+        for name in parts:
+            with zf.open(name) as stream:
+                chunks.extend(_docx_part_text(stream))
+    return "".join(chunks).strip()
+
+
+def extract_text_from_file(file_path: str, max_pages: Optional[int] = None) -> str:
+    """Extract text from a PDF or DOCX. For PDFs, `max_pages` stops after the first N pages."""
     ext = os.path.splitext(file_path)[1].lower()
     if ext == ".pdf":
-        return extract_text(file_path)
+        return join_pages(iter_pdf_pages(file_path, max_pages))
     elif ext in [".docx", ".doc"]:
-        return docx2txt.process(file_path)
+        return extract_docx_text(file_path)
     else:
         raise ValueError("Unsupported file format. Only PDF and DOCX are allowed.")
@@ -0,0 +1,38 @@
+# backend/app/services/rate_limit.py
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter: allows bursts of up to `capacity` calls,
+    refilling at `rate` tokens per second. Shared by every coroutine calling
+    the same upstream, so concurrent fetches stay within its quota.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        if self.rate <= 0:
+            return  # unlimited
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        # waiters queue on the lock so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
@@ -0,0 +1,244 @@
+# backend/app/services/reextract.py
+"""
+Background re-extraction of stored skills after EXTRACTOR_VERSION changes
+(new taxonomy, section headers, spaCy model, resume text settings or
+extraction code). Resumes whose stored text came from other text settings
+(parser.text_version()) are re-parsed from their uploaded file first.
+
+Documents whose `extractor_version` differs from the running one are walked
+in `_id` order in batches: texts are re-extracted (extraction cache first,
+misses spread over the process pool), written back with one bulk_write per
+batch and the derived data (skill index, stored matches) refreshed for the
+documents whose skills actually changed. Progress is checkpointed in the
+`migrations` collection after every batch, so an interrupted run resumes
+where it stopped, and the walk is throttled to REEXTRACT_RATE docs/second
+to leave room for live traffic.
+"""
+import asyncio
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from pymongo import UpdateOne
+
+from app.services import match_store
+from app.services.db import db
+from app.services.executor import run_blocking
+from app.services.extraction_cache import extract_file_cached, extract_skills_batch_cached
+from app.services.job_parser import job_text
+from app.services.parser import text_version
+from app.services.rate_limit import TokenBucket
+from app.services.skill_extractor import EXTRACTOR_VERSION
+from app.services.skill_index import skill_index
+from app.services.skill_vocab import skill_vocab
+
+# Documents read, re-extracted and written back per round
+REEXTRACT_BATCH = int(os.getenv("REEXTRACT_BATCH", "64"))
+# Throttle in documents per second (0 = unthrottled)
+REEXTRACT_RATE = float(os.getenv("REEXTRACT_RATE", "50"))
+# Process-pool chunks per batch; kept below PROCESS_WORKERS so uploads still get a worker
+REEXTRACT_PROCESSES = int(os.getenv("REEXTRACT_PROCESSES", "2"))
+
+COLLECTIONS = ("resumes", "jobs")
+CHECKPOINTS = "migrations"
+TASK_NAME = "skills.reextract"
+
+FIELDS = {
+    "resumes": {"text": 1, "skills": 1, "file_path": 1, "content_hash": 1, "text_version": 1, "max_pages": 1},
+    "jobs": {"description": 1, "job_highlights": 1, "skills": 1},
+}
+
+logger = logging.getLogger(__name__)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def checkpoint_id(collection: str) -> str:
+    return f"reextract:{collection}:{EXTRACTOR_VERSION}"
+
+
+def _text(collection: str, doc: Dict) -> str:
+    if collection == "jobs":
+        return job_text(doc).strip()
+    return (doc.get("text") or "").strip()
+
+
+async def _reparsed_text(doc: Dict) -> Optional[str]:
+    """A resume's text re-read from its file under the current text settings, or None."""
+    path = doc.get("file_path")
+    if doc.get("text_version") == text_version() or not path or not await run_blocking(os.path.exists, path):
+        return None
+    try:
+        text, _ = await extract_file_cached(path, doc.get("content_hash"), doc.get("max_pages"))
+        return text.strip()
+    except Exception as e:
+        logger.warning("Could not re-parse %s, keeping its stored text: %s", path, e)
+        return None
+
+
+def stale_query(after=None) -> Dict:
+    query = {"extractor_version": {"$ne": EXTRACTOR_VERSION}}
+    if after is not None:
+        query["_id"] = {"$gt": after}
+    return query
+
+
+async def load_checkpoint(collection: str) -> Optional[Dict]:
+    return await db[CHECKPOINTS].find_one({"_id": checkpoint_id(collection)})
+
+
+async def _save(state: Dict) -> None:
+    state["updated_at"] = _now()
+    await db[CHECKPOINTS].replace_one({"_id": state["_id"]}, state, upsert=True)
+
+
+def _new_state(collection: str) -> Dict:
+    return {
+        "_id": checkpoint_id(collection),
+        "collection": collection,
+        "extractor_version": EXTRACTOR_VERSION,
+        "status": "running",
+        "last_id": None,
+        "scanned": 0,
+        "changed": 0,
+        "unchanged": 0,
+        "no_text": 0,
+        "started_at": _now(),
+        "updated_at": None,
+        "finished_at": None,
+        "error": None,
+    }
+
+
+async def _apply(collection: str, docs: List[Dict], skills_lists: List[List[str]], state: Dict) -> None:
+    ops, changed = [], []
+    now = datetime.now(timezone.utc)
+    ids_lists = iter(await skill_vocab.encode_many([s for s in skills_lists if s is not None]))
+    for doc, skills in zip(docs, skills_lists):
+        if skills is None:
+            # nothing to extract from; stamp it so later passes skip it
+            update = {"extractor_version": EXTRACTOR_VERSION}
+            state["no_text"] += 1
+        else:
+            update = {"skills": skills, "skill_ids": next(ids_lists),
+                      "skills_extracted": True if skills else False, "extractor_version": EXTRACTOR_VERSION,
+                      "skills_updated_at": now}
+            if "reparsed_text" in doc:
+                update.update(text=doc["reparsed_text"], text_version=text_version())
+            if skills != doc.get("skills"):
+                changed.append((doc["_id"], skills))
+        # a live write that re-extracted the doc meanwhile already stamped the
+        # current version; don't overwrite it with results from the older text
+        ops.append(UpdateOne({"_id": doc["_id"], "extractor_version": {"$ne": EXTRACTOR_VERSION}},
+                             {"$set": update}))
+    if ops:
+        await db[collection].bulk_write(ops, ordered=False)
+
+    state["changed"] += len(changed)
+    state["unchanged"] += len(docs) - len(changed) - sum(s is None for s in skills_lists)
+    if not changed:
+        return
+    if collection == "resumes":
+        match_store.schedule_resume_refresh(doc_id for doc_id, _ in changed)
+    else:
+        await run_blocking(skill_index.add_jobs, changed)
+        match_store.schedule_job_refresh(doc_id for doc_id, _ in changed)
+
+
+async def run(collection: str, batch_size: int = REEXTRACT_BATCH, rate: float = REEXTRACT_RATE,
+              processes: int = REEXTRACT_PROCESSES, limit: Optional[int] = None, restart: bool = False,
+              progress: Optional[Dict] = None, on_progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """
+    Re-extract `collection` documents stamped with another extractor version,
+    resuming from its checkpoint. Stops after about `limit` documents (status
+    "paused"; run again to continue) or when none are left ("done").
+    `progress` is an optional dict kept in sync with the checkpoint, for the
+    task queue's progress reporting.
+    """
+    if collection not in COLLECTIONS:
+        raise ValueError(f"unknown collection {collection!r}")
+    saved = None if restart else await load_checkpoint(collection)
+    if saved is None or saved["status"] == "done":
+        # a finished pass starts over from the top to pick up docs written by older instances since
+        saved = _new_state(collection)
+    state = {**saved, "status": "running", "finished_at": None, "error": None}
+    progress = progress if progress is not None else {}
+    progress.update(public(state))
+
+    bucket = TokenBucket(rate, capacity=max(rate, batch_size))
+    done_here = 0
+    try:
+        while limit is None or done_here < limit:
+            size = batch_size if limit is None else min(batch_size, limit - done_here)
+            docs = await (db[collection].find(stale_query(state["last_id"]), FIELDS[collection])
+                          .sort("_id", 1).limit(size).to_list(size))
+            if not docs:
+                state["status"] = "done"
+                state["finished_at"] = _now()
+                break
+            await bucket.acquire(len(docs))
+
+            texts = [_text(collection, doc) for doc in docs]
+            if collection == "resumes":
+                for i, doc in enumerate(docs):
+                    text = await _reparsed_text(doc)
+                    if text:
+                        texts[i] = doc["reparsed_text"] = text
+            with_text = [i for i, text in enumerate(texts) if text]
+            extracted = await extract_skills_batch_cached([texts[i] for i in with_text], processes=processes)
+            skills_lists: List[Optional[List[str]]] = [None] * len(docs)
+            for i, skills in zip(with_text, extracted):
+                skills_lists[i] = skills
+            await _apply(collection, docs, skills_lists, state)
+
+            state["last_id"] = docs[-1]["_id"]
+            state["scanned"] += len(docs)
+            done_here += len(docs)
+            await _save(state)
+            progress.update(public(state))
+            if on_progress:
+                on_progress(public(state))
+        else:
+            state["status"] = "paused"
+    except asyncio.CancelledError:
+        state["status"] = "paused"
+        await asyncio.shield(_save(state))
+        raise
+    except Exception as e:
+        state["status"] = "failed"
+        state["error"] = str(e) or type(e).__name__
+        await _save(state)
+        raise
+    await _save(state)
+    progress.update(public(state))
+    logger.info("Re-extraction of %s %s: %d scanned, %d changed",
+                collection, state["status"], state["scanned"], state["changed"])
+    return public(state)
+
+
+async def run_all(collections=COLLECTIONS, progress: Optional[Dict] = None, **kwargs) -> Dict[str, Dict]:
+    """run() over each collection in turn; `progress` gets one entry per collection."""
+    progress = progress if progress is not None else {}
+    return {collection: await run(collection, progress=progress.setdefault(collection, {}), **kwargs)
+            for collection in collections}
+
+
+def public(state: Dict) -> Dict:
+    """A checkpoint without Mongo types, for JSON responses."""
+    return {k: (str(v) if k == "last_id" and v is not None else v) for k, v in state.items() if k != "_id"}
+
+
+async def status() -> Dict[str, Dict]:
+    """Checkpoint and count of documents still to re-extract, per collection."""
+    result = {}
+    for collection in COLLECTIONS:
+        saved = await load_checkpoint(collection)
+        result[collection] = {
+            "extractor_version": EXTRACTOR_VERSION,
+            "stale": await db[collection].count_documents(stale_query()),
+            "checkpoint": public(saved) if saved else None,
+        }
+    return result
@@ -1,13 +1,141 @@
 import os
-from openai import OpenAI  
+import asyncio
+import json
+import logging
+import threading
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
 
-# Use GitHub ChatGPT token + Azure inference endpoint
-client = OpenAI(
-    api_key=os.getenv("GITHUB_TOKEN"),
-    base_url="https://models.inference.ai.azure.com"
-)
+from app.services import llm_cache
+from app.services.json_stream import JSONObjectStream
+from app.services.metrics import record_llm_usage, timed
+from app.services.singleflight import SingleFlight, StreamFlight
+
+# Any OpenAI-compatible endpoint; defaults to the GitHub models Azure inference
+# endpoint with a GitHub token. Point LLM_BASE_URL at a local server for testing.
+LLM_BASE_URL = os.getenv("LLM_BASE_URL", "https://models.inference.ai.azure.com")
+LLM_API_KEY = os.getenv("LLM_API_KEY") or os.getenv("GITHUB_TOKEN")
+LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4o-mini")   # you can try "gpt-4o" if enabled
+LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0.7"))
+# Bump when a prompt changes so cached responses to the old prompt aren't reused
+PROMPT_VERSION = "1"
+
+AI_ROADMAP_SYSTEM = "You are a career guidance AI."
+AI_ROADMAP_MAX_TOKENS = 400
+SKILL_ROADMAP_SYSTEM = "You are a practical curriculum designer."
+SKILL_ROADMAP_MAX_TOKENS = 600
+AI_ROADMAP_FALLBACK = "⚠️ Roadmap generation failed."
+
+# Batched skill roadmaps (POST /roadmap/skills): uncached skills are generated
+# at most SKILL_BATCH_CONCURRENCY at a time, each given SKILL_BATCH_TIMEOUT
+# seconds once it starts; slower ones are reported as "timeout" and keep
+# generating into the cache for the next request
+SKILL_BATCH_CONCURRENCY = int(os.getenv("SKILL_BATCH_CONCURRENCY", "4"))
+SKILL_BATCH_TIMEOUT = float(os.getenv("SKILL_BATCH_TIMEOUT", "20"))
+SKILL_BATCH_MAX = int(os.getenv("SKILL_BATCH_MAX", "25"))
+
+logger = logging.getLogger(__name__)
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_llm_client():
+    """The shared async OpenAI client (so LLM calls don't hold up the event loop), created on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                # imported lazily: the SDK is slow to import and only roadmap calls need it
+                from openai import AsyncOpenAI
+                _client = AsyncOpenAI(api_key=LLM_API_KEY, base_url=LLM_BASE_URL)
+    return _client
+
+
+def llm_client_loaded() -> bool:
+    return _client is not None
+
+# Identical concurrent requests (same cache key) share one cache lookup and LLM call
+_flights = SingleFlight()
+# ... and identical concurrent streams share one streamed LLM call
+_stream_flights = StreamFlight()
+
+
+def _messages(system: str, prompt: str):
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": prompt}
+    ]
+
+
+async def _complete(system: str, prompt: str, max_tokens: int) -> str:
+    """One chat completion; raises on any failure so errors are never cached."""
+    with timed("llm_call"):
+        response = await get_llm_client().chat.completions.create(
+            model=LLM_MODEL,
+            messages=_messages(system, prompt),
+            temperature=LLM_TEMPERATURE,
+            max_tokens=max_tokens
+        )
+    record_llm_usage(LLM_MODEL, getattr(response, "usage", None))
+    return response.choices[0].message.content.strip()
+
+
+async def _stream(system: str, prompt: str, max_tokens: int, meta: Optional[dict] = None) -> AsyncIterator[str]:
+    """
+    Same call with stream=True, yielding content deltas as they arrive.
+    `meta["finish_reason"]` is set from the final chunk ("stop" when the
+    answer is complete, "length" when it was cut off at max_tokens).
+    """
+    # timed until the last chunk; only endpoints that send usage on a chunk are counted
+    with timed("llm_stream"):
+        stream = await get_llm_client().chat.completions.create(
+            model=LLM_MODEL,
+            messages=_messages(system, prompt),
+            temperature=LLM_TEMPERATURE,
+            max_tokens=max_tokens,
+            stream=True
+        )
+        async for chunk in stream:
+            record_llm_usage(LLM_MODEL, getattr(chunk, "usage", None))
+            if chunk.choices and chunk.choices[0].finish_reason and meta is not None:
+                meta["finish_reason"] = chunk.choices[0].finish_reason
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+async def _stream_and_cache(key: str, kind: str, system: str, prompt: str, max_tokens: int,
+                            finish: Callable[[str], Any]) -> AsyncIterator[str]:
+    """
+    The deltas of one streamed completion; once it ends, `finish(text)` is
+    cached, but only when the model completed the answer and it isn't empty.
+    """
+    parts, meta = [], {}
+    async for delta in _stream(system, prompt, max_tokens, meta):
+        parts.append(delta)
+        yield delta
+    text = "".join(parts).strip()
+    if text and meta.get("finish_reason") == "stop":
+        await llm_cache.put(key, finish(text), kind=kind, model=LLM_MODEL)
+    else:
+        logger.warning("Not caching %s stream (finish_reason=%s, %d chars)", kind, meta.get("finish_reason"), len(text))
+
+
+def _cache_key(kind: str, inputs: dict, max_tokens: int) -> str:
+    return llm_cache.make_key(
+        kind, inputs,
+        model=LLM_MODEL, temperature=LLM_TEMPERATURE, max_tokens=max_tokens, prompt_version=PROMPT_VERSION,
+    )
+
+
+def ai_roadmap_prompt(job_title, existing_skills, missing_skills) -> Tuple[str, str]:
+    """(prompt, cache key) for a job roadmap."""
+    # the response only depends on these inputs; normalize them so the same
+    # request in a different order or case reuses the cached roadmap
+    job_title = " ".join(str(job_title).split())
+    existing_skills = llm_cache.normalize(existing_skills)
+    missing_skills = llm_cache.normalize(missing_skills)
 
-def generate_ai_roadmap(job_title, existing_skills, missing_skills):
     prompt = f"""
     You are an AI career mentor.
     A student wants to become a {job_title}.
@@ -21,45 +149,92 @@ def generate_ai_roadmap(job_title, existing_skills, missing_skills):
     - Estimate learning time (short/medium/long).
     - Keep tone motivating and simple.
     """
+    key = _cache_key(
+        "ai_roadmap", {"job_title": job_title, "existing": existing_skills, "missing": missing_skills},
+        AI_ROADMAP_MAX_TOKENS,
+    )
+    return prompt, key
+
 
-    # ✅ Debug log
-    print("📌 --- AI Roadmap Prompt ---")
-    print(prompt)
-    print("📌 -------------------------")
+async def generate_ai_roadmap(job_title, existing_skills, missing_skills):
+    prompt, key = ai_roadmap_prompt(job_title, existing_skills, missing_skills)
+
+    async def compute():
+        logger.debug("AI roadmap prompt:\n%s", prompt)
+        roadmap = await _complete(AI_ROADMAP_SYSTEM, prompt, max_tokens=AI_ROADMAP_MAX_TOKENS)
+        logger.debug("AI roadmap response:\n%s", roadmap)
+        return roadmap
 
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",   # you can try "gpt-4o" if enabled
-            messages=[
-                {"role": "system", "content": "You are a career guidance AI."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=400
+        return await _flights.do(
+            key, lambda: llm_cache.cached_call(key, compute, kind="ai_roadmap", model=LLM_MODEL)
         )
+    except Exception as e:
+        logger.error("generate_ai_roadmap failed: %s", e)
+        return AI_ROADMAP_FALLBACK
 
-        roadmap = response.choices[0].message.content.strip()
-        print("📌 --- AI Roadmap Response ---")
-        print(roadmap)
-        print("📌 ----------------------------")
 
-        return roadmap
+async def stream_ai_roadmap(job_title, existing_skills, missing_skills) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    generate_ai_roadmap as a stream of (event, data): ("delta", text) per
+    chunk, then ("done", full roadmap). A cached roadmap is sent as a single
+    delta; a streamed one is cached once complete, and concurrent identical
+    streams share one LLM call. Raises on failure.
+    """
+    prompt, key = ai_roadmap_prompt(job_title, existing_skills, missing_skills)
+    cached = await llm_cache.get(key)
+    if isinstance(cached, str) and cached:
+        yield "delta", cached
+        yield "done", cached
+        return
 
-    except Exception as e:
-        print("🔥 ERROR in generate_ai_roadmap:", str(e))
-        return "⚠️ Roadmap generation failed."
+    parts = []
+    produce = partial(_stream_and_cache, key, "ai_roadmap", AI_ROADMAP_SYSTEM, prompt, AI_ROADMAP_MAX_TOKENS, str)
+    async for delta in _stream_flights.stream(key, produce):
+        parts.append(delta)
+        yield "delta", delta
+    yield "done", "".join(parts).strip()
 
 
-def generate_skill_roadmap_agent(skill_name: str):
-    """Generate a skill-focused detailed roadmap. Returns structured dict with keys:
-    - summary: short text
-    - videos: list of {title, url, duration}
-    - day_plan: list of days with tasks
-    - blogs: list of {title, url}
-    - notes: short bullet points
+def parse_skill_roadmap(raw: str) -> dict:
+    """Parse the model's JSON answer; if parsing fails return the text under 'summary'."""
+    # Clean common wrappers (triple backticks, ```json, etc.) before parsing
+    clean = raw
+    # Remove surrounding ``` fences if present
+    if clean.startswith('```') and clean.endswith('```'):
+        # remove the outer fences and optional language tag
+        # drop first fence line
+        parts = clean.split('\n')
+        # if first line is like ```json, drop it
+        if parts[0].strip().startswith('```'):
+            parts = parts[1:]
+        # if last line is fence, drop it
+        if parts and parts[-1].strip().startswith('```'):
+            parts = parts[:-1]
+        clean = '\n'.join(parts).strip()
 
-    Attempts to parse JSON from the model; if parsing fails returns text under 'summary'.
-    """
+    # Try to find the first { and last } to extract JSON substring
+    if ('{' in clean) and ('}' in clean):
+        first = clean.find('{')
+        last = clean.rfind('}')
+        if first != -1 and last != -1 and last > first:
+            json_sub = clean[first:last+1]
+        else:
+            json_sub = clean
+    else:
+        json_sub = clean
+
+    try:
+        parsed = json.loads(json_sub)
+        return parsed
+    except Exception:
+        # Final fallback: return raw text as summary
+        return {"summary": raw, "videos": [], "day_plan": [], "blogs": [], "notes": []}
+
+
+def skill_roadmap_prompt(skill_name: str) -> Tuple[str, str]:
+    """(prompt, cache key) for a single-skill roadmap."""
+    skill_name = " ".join(str(skill_name).split())
     prompt = f"""
     You are a helpful career mentor and curriculum designer.
     Produce a JSON object (no additional text) with the following keys:
@@ -71,59 +246,137 @@ def generate_skill_roadmap_agent(skill_name: str):
 
     Keep responses concise. If you cannot provide a field leave it as an empty array or empty string.
     """
+    return prompt, _cache_key("skill_roadmap", {"skill": skill_name}, SKILL_ROADMAP_MAX_TOKENS)
+
+
+def skill_roadmap_fallback() -> dict:
+    return {"summary": "⚠️ Skill roadmap generation failed.", "videos": [], "day_plan": [], "blogs": [], "notes": []}
 
-    print("📌 --- Skill Roadmap Prompt ---")
-    print(prompt)
+
+async def generate_skill_roadmap_agent(skill_name: str):
+    """Generate a skill-focused detailed roadmap. Returns structured dict with keys:
+    - summary: short text
+    - videos: list of {title, url, duration}
+    - day_plan: list of days with tasks
+    - blogs: list of {title, url}
+    - notes: short bullet points
+
+    Attempts to parse JSON from the model; if parsing fails returns text under 'summary'.
+    Responses are cached per normalized skill name, and concurrent requests for
+    the same skill share one call.
+    """
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a practical curriculum designer."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=600
-        )
+        return await _skill_roadmap(skill_name)
+    except Exception as e:
+        logger.error("generate_skill_roadmap_agent failed: %s", e)
+        return skill_roadmap_fallback()
+
+
+def _skill_compute(prompt: str):
+    async def compute():
+        logger.debug("Skill roadmap prompt:\n%s", prompt)
+        raw = await _complete(SKILL_ROADMAP_SYSTEM, prompt, max_tokens=SKILL_ROADMAP_MAX_TOKENS)
+        logger.debug("Skill roadmap raw response:\n%s", raw)
+        return parse_skill_roadmap(raw)
+    return compute
+
+
+async def _skill_roadmap(skill_name: str) -> dict:
+    """Cached / coalesced skill roadmap; raises on failure."""
+    prompt, key = skill_roadmap_prompt(skill_name)
+    compute = _skill_compute(prompt)
+    return await _flights.do(
+        key, lambda: llm_cache.cached_call(key, compute, kind="skill_roadmap", model=LLM_MODEL)
+    )
+
+
+async def generate_skill_roadmaps(skills: Iterable[str], concurrency: Optional[int] = None,
+                                  timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    Roadmaps for several skills, one {"skill", "status", "detail"} per
+    distinct skill (as the response cache sees it) in request order. Cached
+    roadmaps are answered straight away ("cached"); the rest are generated
+    at most `concurrency` at a time ("generated", or "failed" with the
+    fallback roadmap). Each generation gets `timeout` seconds from the moment
+    it starts (not while it waits for a slot); slower ones come back as
+    "timeout" with no detail.
+    """
+    concurrency = concurrency or SKILL_BATCH_CONCURRENCY
+    timeout = SKILL_BATCH_TIMEOUT if timeout is None else timeout
+    prompts, seen = {}, set()
+    for skill in skills:
+        name = " ".join(str(skill).split())
+        prompt, key = skill_roadmap_prompt(name)
+        # skills sharing a cache key ("Docker" / "docker") are answered once, under the first spelling
+        if name and key not in seen:
+            seen.add(key)
+            prompts[name] = (prompt, key)
+    names = list(prompts)
 
-        raw = response.choices[0].message.content.strip()
-        print("📌 --- Skill Roadmap Raw Response ---")
-        print(raw)
-
-        # Try to parse JSON from the model output
-        import json
-        # Clean common wrappers (triple backticks, ```json, etc.) before parsing
-        clean = raw
-        # Remove surrounding ``` fences if present
-        if clean.startswith('```') and clean.endswith('```'):
-            # remove the outer fences and optional language tag
-            # drop first fence line
-            parts = clean.split('\n')
-            # if first line is like ```json, drop it
-            if parts[0].strip().startswith('```'):
-                parts = parts[1:]
-            # if last line is fence, drop it
-            if parts and parts[-1].strip().startswith('```'):
-                parts = parts[:-1]
-            clean = '\n'.join(parts).strip()
-
-        # Try to find the first { and last } to extract JSON substring
-        if ('{' in clean) and ('}' in clean):
-            first = clean.find('{')
-            last = clean.rfind('}')
-            if first != -1 and last != -1 and last > first:
-                json_sub = clean[first:last+1]
-            else:
-                json_sub = clean
+    cached = await asyncio.gather(*(
+        llm_cache.get(key, _skill_compute(prompt), kind="skill_roadmap", model=LLM_MODEL)
+        for prompt, key in prompts.values()
+    ))
+    results = {name: {"skill": name, "status": "cached", "detail": detail}
+               for name, detail in zip(names, cached) if detail is not None}
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def generate(name):
+        prompt, key = prompts[name]
+        compute = _skill_compute(prompt)
+
+        async def compute_and_store():
+            # already looked up above: a miss goes straight to the model
+            value = await compute()
+            await llm_cache.put(key, value, kind="skill_roadmap", model=LLM_MODEL)
+            return value
+
+        async with sem:
+            # The timeout only abandons the wait: _flights shields the call, so
+            # a slow roadmap still finishes into the cache (deliberately, the
+            # client is told to ask again) and other requests for the skill
+            # keep sharing it. Its slot is freed for the next skill meanwhile.
+            return await asyncio.wait_for(_flights.do(key, compute_and_store), timeout)
+
+    pending = [name for name in names if name not in results]
+    outcomes = await asyncio.gather(*(generate(name) for name in pending), return_exceptions=True)
+    for name, outcome in zip(pending, outcomes):
+        if isinstance(outcome, asyncio.TimeoutError):
+            results[name] = {"skill": name, "status": "timeout", "detail": None}
+        elif isinstance(outcome, BaseException):
+            logger.error("Skill roadmap for %r failed: %s", name, outcome)
+            results[name] = {"skill": name, "status": "failed", "detail": skill_roadmap_fallback()}
         else:
-            json_sub = clean
+            results[name] = {"skill": name, "status": "generated", "detail": outcome}
+    return [results[name] for name in names]
 
-        try:
-            parsed = json.loads(json_sub)
-            return parsed
-        except Exception:
-            # Final fallback: return raw text as summary
-            return {"summary": raw, "videos": [], "day_plan": [], "blogs": [], "notes": []}
 
-    except Exception as e:
-        print("🔥 ERROR in generate_skill_roadmap_agent:", str(e))
-        return {"summary": "⚠️ Skill roadmap generation failed.", "videos": [], "day_plan": [], "blogs": [], "notes": []}
+async def stream_skill_roadmap(skill_name: str) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    generate_skill_roadmap_agent as a stream of (event, data): ("section",
+    {"key", "value"}) as each top-level key of the model's JSON closes, then
+    ("done", full roadmap dict). Concurrent identical streams share one LLM
+    call. Raises on failure.
+    """
+    prompt, key = skill_roadmap_prompt(skill_name)
+    cached = await llm_cache.get(key)
+    if isinstance(cached, str):
+        # entries cached as raw text rather than the parsed dict
+        cached = parse_skill_roadmap(cached)
+    if isinstance(cached, dict) and cached:
+        for name, value in cached.items():
+            yield "section", {"key": name, "value": value}
+        yield "done", cached
+        return
+    # anything else isn't a usable roadmap: generate a fresh one
+
+    parser = JSONObjectStream()
+    parts = []
+    produce = partial(_stream_and_cache, key, "skill_roadmap", SKILL_ROADMAP_SYSTEM, prompt,
+                      SKILL_ROADMAP_MAX_TOKENS, parse_skill_roadmap)
+    async for delta in _stream_flights.stream(key, produce):
+        parts.append(delta)
+        for name, value in parser.feed(delta):
+            yield "section", {"key": name, "value": value}
+    yield "done", parse_skill_roadmap("".join(parts).strip())
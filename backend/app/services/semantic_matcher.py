@@ -0,0 +1,191 @@
+# backend/app/services/semantic_matcher.py
+import asyncio
+import atexit
+import logging
+import os
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.services.executor import run_blocking
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SEMANTIC_MODEL = os.getenv("SEMANTIC_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+SEMANTIC_DEVICE = os.getenv("SEMANTIC_DEVICE", "cpu")
+# cosine similarity at or above which two skills count as the same skill
+SEMANTIC_THRESHOLD = float(os.getenv("SEMANTIC_THRESHOLD", "0.75"))
+EMBEDDING_CACHE_PATH = os.getenv(
+    "EMBEDDING_CACHE_PATH", os.path.join(APP_DIR, "cache", "skill_embeddings.npz")
+)
+# Newly encoded skills are written to disk in the background every this many
+# seconds (and at shutdown), not by the request that encoded them
+EMBEDDING_SAVE_INTERVAL = float(os.getenv("EMBEDDING_SAVE_INTERVAL", "60"))
+
+logger = logging.getLogger(__name__)
+
+
+class SkillEmbeddings:
+    """
+    Embedding matrix for canonical skills. Each skill is encoded once, kept
+    as a row of an L2-normalized float32 matrix, and the matrix is persisted
+    to disk so restarts don't re-encode the vocabulary. New rows only mark
+    the matrix dirty; flush() writes them out, off the request path.
+    """
+
+    def __init__(self, path: str = EMBEDDING_CACHE_PATH, model_name: str = SEMANTIC_MODEL, encoder=None):
+        self.path = path
+        self.model_name = model_name
+        self._encoder = encoder
+        self._lock = threading.Lock()
+        self._index: Dict[str, int] = {}
+        self._matrix: Optional[np.ndarray] = None
+        self._loaded = False
+        self._dirty = 0                       # skills encoded since the last save
+        self._save_lock = threading.Lock()    # one writer of the cache file at a time
+
+    def _get_encoder(self):
+        if self._encoder is None:
+            # imported lazily: torch is heavy and only needed for semantic mode
+            from sentence_transformers import SentenceTransformer
+            self._encoder = SentenceTransformer(self.model_name, device=SEMANTIC_DEVICE)
+        return self._encoder
+
+    def _load(self) -> None:
+        self._loaded = True
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                if str(data["model"]) != self.model_name:
+                    return  # vectors from another model are not comparable
+                skills = data["skills"].tolist()
+                self._matrix = data["vectors"].astype(np.float32)
+                self._index = {s: i for i, s in enumerate(skills)}
+        except Exception as e:
+            logger.warning("Ignoring unreadable embedding cache: %s", e)
+
+    def _save(self, skills: List[str], matrix: np.ndarray) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp.npz"
+        np.savez(tmp, model=np.array(self.model_name), skills=np.array(skills), vectors=matrix)
+        os.replace(tmp, self.path)
+
+    def flush(self) -> bool:
+        """Persist the matrix if skills were encoded since the last save; True when written."""
+        if not self.path:
+            return False
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return False
+                dirty = self._dirty
+                # rows are only ever appended (vstack makes a new array), so this
+                # snapshot stays consistent while vectors() keeps encoding
+                skills = sorted(self._index, key=self._index.get)
+                matrix = self._matrix
+            try:
+                self._save(skills, matrix)
+            except Exception as e:
+                logger.warning("Could not persist skill embeddings: %s", e)
+                return False
+            with self._lock:
+                self._dirty -= dirty
+            return True
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def vectors(self, skills: List[str]) -> np.ndarray:
+        """Rows of the embedding matrix for `skills`, encoding any unseen ones in one batch."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            missing = list(dict.fromkeys(s for s in skills if s not in self._index))
+            if missing:
+                encoded = self._get_encoder().encode(
+                    missing, batch_size=64, convert_to_numpy=True, normalize_embeddings=True
+                ).astype(np.float32)
+                start = len(self._index)
+                self._matrix = encoded if self._matrix is None else np.vstack([self._matrix, encoded])
+                for offset, skill in enumerate(missing):
+                    self._index[skill] = start + offset
+                self._dirty += len(missing)
+            rows = [self._index[s] for s in skills]
+            return self._matrix[rows]
+
+
+skill_embeddings = SkillEmbeddings()
+# processes without the API's lifespan (CLI, pool workers) save on exit
+atexit.register(skill_embeddings.flush)
+
+_flusher: Optional[asyncio.Task] = None
+
+
+async def _flush_loop() -> None:
+    while True:
+        await asyncio.sleep(EMBEDDING_SAVE_INTERVAL)
+        await run_blocking(skill_embeddings.flush)
+
+
+def start() -> None:
+    global _flusher
+    if EMBEDDING_SAVE_INTERVAL > 0 and _flusher is None:
+        _flusher = asyncio.get_running_loop().create_task(_flush_loop())
+
+
+async def stop() -> None:
+    global _flusher
+    if _flusher is not None:
+        _flusher.cancel()
+        try:
+            await _flusher
+        except asyncio.CancelledError:
+            pass
+        _flusher = None
+    await run_blocking(skill_embeddings.flush)
+
+
+def _unique_lower(skills) -> List[str]:
+    return list(dict.fromkeys(s.strip().lower() for s in skills if isinstance(s, str) and s.strip()))
+
+
+def compute_semantic_match(
+    resume_skills: List[str],
+    job_skills: List[str],
+    threshold: float = SEMANTIC_THRESHOLD,
+    embeddings: Optional[SkillEmbeddings] = None,
+) -> Dict:
+    """
+    compute_match with embedding similarity instead of exact string equality:
+    a job skill is covered when some resume skill has cosine similarity
+    >= threshold. All pairs are scored with one matrix product.
+    """
+    embeddings = embeddings if embeddings is not None else skill_embeddings
+    resume = _unique_lower(resume_skills)
+    job = _unique_lower(job_skills)
+
+    if not resume or not job:
+        return {"match_percent": 0.0, "matched_skills": [], "skill_gap": job, "similar_skills": {}}
+
+    sim = embeddings.vectors(job) @ embeddings.vectors(resume).T  # (len(job), len(resume))
+    job_best = sim.argmax(axis=1)
+    job_covered = sim[np.arange(len(job)), job_best] >= threshold
+    resume_covered = sim.max(axis=0) >= threshold
+
+    matched = [s for s, ok in zip(job, job_covered) if ok]
+    gap = [s for s, ok in zip(job, job_covered) if not ok]
+    # which resume skill stood in for each job skill that wasn't an exact match
+    similar = {
+        job[i]: resume[j]
+        for i, j in enumerate(job_best.tolist())
+        if job_covered[i] and job[i] != resume[j]
+    }
+
+    return {
+        "match_percent": round(int(resume_covered.sum()) / len(resume) * 100, 2),
+        "matched_skills": matched,
+        "skill_gap": gap,
+        "similar_skills": similar,
+    }
@@ -0,0 +1,105 @@
+# backend/app/services/singleflight.py
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key: the first caller starts
+    `fn()`, everyone arriving while it is in flight awaits the same result
+    (or exception). Nothing is kept once the call finishes, so this only
+    collapses bursts; caching is the caller's business.
+
+    The computation runs as its own task, so a caller that goes away (client
+    disconnect) doesn't cancel it for the others. Callers share the returned
+    object and must not mutate it.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0      # computations started
+        self.shared = 0     # callers served by someone else's computation
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _, key=key: self._calls.pop(key, None))
+            self.calls += 1
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        return {"calls": self.calls, "shared": self.shared, "in_flight": len(self._calls)}
+
+
+class SharedStream:
+    """
+    One producer stream read by any number of consumers: the producer runs
+    as its own task, chunks are kept as they arrive and every reader gets
+    all of them from the start, then the producer's exception if it failed.
+    """
+
+    def __init__(self, source: AsyncIterator[Any]):
+        self.chunks: List[Any] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self._changed = asyncio.Event()
+        self.task = asyncio.ensure_future(self._pump(source))
+
+    async def _pump(self, source: AsyncIterator[Any]) -> None:
+        try:
+            async for chunk in source:
+                self.chunks.append(chunk)
+                self._wake()
+        except BaseException as e:
+            self.error = e
+        finally:
+            self.done = True
+            self._wake()
+
+    def _wake(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def read(self) -> AsyncIterator[Any]:
+        i = 0
+        while True:
+            while i < len(self.chunks):
+                yield self.chunks[i]
+                i += 1
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            await self._changed.wait()
+
+
+class StreamFlight:
+    """
+    SingleFlight for streams: concurrent callers with the same key read one
+    SharedStream of `fn()` instead of each starting their own. The producer
+    outlives readers that disconnect, so it can finish (and cache) for the rest.
+    """
+
+    def __init__(self):
+        self._streams: Dict[Hashable, SharedStream] = {}
+        self.calls = 0
+        self.shared = 0
+
+    def stream(self, key: Hashable, fn: Callable[[], AsyncIterator[Any]]) -> AsyncIterator[Any]:
+        shared = self._streams.get(key)
+        if shared is None:
+            shared = self._streams[key] = SharedStream(fn())
+            shared.task.add_done_callback(
+                lambda _, key=key, shared=shared: self._streams.pop(key) if self._streams.get(key) is shared else None
+            )
+            self.calls += 1
+        else:
+            self.shared += 1
+        return shared.read()
+
+    def stats(self) -> Dict[str, int]:
+        return {"calls": self.calls, "shared": self.shared, "in_flight": len(self._streams)}
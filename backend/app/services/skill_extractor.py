@@ -1,32 +1,52 @@
 # backend/app/services/skill_extractor.py
+import hashlib
+import os
 import re
-from typing import List, Tuple, Set
-import spacy
-
-# Load spaCy model once
-nlp = spacy.load("en_core_web_sm")
-
-# Basic canonicalization map (extend this)
-CANONICAL_MAP = {
-    "py": "python",
-    "python3": "python",
-    "google cloud": "gcp",
-    "aws": "aws",
-    "amazon web services": "aws",
-    "dbs": "databases",
-    "sql server": "sql",
-    "postgre": "postgresql",
-    "nlp": "nlp",
-    "machine learning": "machine learning",
-    "ml": "machine learning",
-    "data viz": "data visualization",
-    "tableau": "tableau",
-    "power bi": "power bi",
-    "pandas": "pandas",
-    "numpy": "numpy",
-}
-
-# Regex patterns to locate 'Skills' section and common bullet/line separators
+import threading
+import time
+from importlib import metadata
+from typing import Iterable, Iterator, List, Set, Tuple
+from app.services import parser
+from app.services.metrics import record_stage, timed
+from app.services.skill_taxonomy import taxonomy
+
+# Bump whenever the extraction code changes its output. The section headers,
+# taxonomy contents, spaCy model and resume text settings (parser revision,
+# PDF text mode and budget) are folded into EXTRACTOR_VERSION below, so
+# changing those needs no bump.
+EXTRACTOR_REVISION = "1"
+
+# Pipeline components the extractor never reads (we only use entities and
+# noun chunks, which need tagger/parser/ner), disabled to save time per doc.
+UNUSED_PIPES = ["lemmatizer"]
+
+# Default nlp.pipe batch size for batched extraction, overridable per deployment
+SKILL_BATCH_SIZE = int(os.getenv("SKILL_BATCH_SIZE", "32"))
+
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+
+_nlp = None
+_nlp_lock = threading.Lock()
+
+
+def get_nlp():
+    """The spaCy pipeline, loaded once on first use (thread-safe)."""
+    global _nlp
+    if _nlp is None:
+        with _nlp_lock:
+            if _nlp is None:
+                # imported lazily: spaCy and its model take seconds to load and
+                # most requests (health checks, news, listings) never need them
+                import spacy
+                _nlp = spacy.load(SPACY_MODEL, disable=UNUSED_PIPES)
+    return _nlp
+
+
+def nlp_loaded() -> bool:
+    return _nlp is not None
+
+# Regex patterns to locate 'Skills' section and common bullet/line separators,
+# in priority order: the first header found anywhere in the text wins
 SKILLS_SECTION_HEADERS = [
     r"\bskills\b",
     r"\btechnical skills\b",
@@ -34,10 +54,63 @@ SKILLS_SECTION_HEADERS = [
     r"\bexpertise\b",
 ]
 
+# All headers in one zero-width pattern so a single scan sees every position
+# where any header starts; group i is SKILLS_SECTION_HEADERS[i]
+_HEADERS = "(?=" + "|".join(f"({h})" for h in SKILLS_SECTION_HEADERS) + ")"
+_HEADER_RE = re.compile(_HEADERS)
+# ASCII text can be matched case-insensitively in place instead of lowercasing a copy
+_HEADER_RE_ASCII = re.compile(_HEADERS, re.IGNORECASE | re.ASCII)
+
 # Any punctuation used to split items inside a skills line
 SPLIT_PATTERN = re.compile(r"[•\-\n\r,;]+")  # bullets, hyphens, commas, semicolons, newlines
+PARENTHETICAL_PATTERN = re.compile(r"\(.*?\)")
+PERCENT_PATTERN = re.compile(r"\d{1,3}%")
+TECH_CHAR_PATTERN = re.compile(r"[a-zA-Z0-9\+\#\.\-]")
+NON_SKILL_CHARS_PATTERN = re.compile(r"[^\w\s\+\#\.]")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# spaCy entity labels that tend to be tools, products and languages
+SKILL_ENTITY_LABELS = frozenset(("ORG", "PRODUCT", "WORK_OF_ART", "LANGUAGE", "NORP", "TECHNOLOGY"))
+
+
+def _model_version() -> str:
+    """Installed version of the spaCy model package (without loading it); "" for a model path."""
+    try:
+        return metadata.version(SPACY_MODEL)
+    except (metadata.PackageNotFoundError, ValueError):
+        return ""
+
+
+def extractor_fingerprint() -> str:
+    """Everything besides the code that decides what skills come out of a text."""
+    parts = [*SKILLS_SECTION_HEADERS, taxonomy.fingerprint, SPACY_MODEL, _model_version(), parser.text_version()]
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()[:10]
+
+
+# Stamped on stored resumes, jobs, matches and cache entries; anything with
+# another version is stale and picked up by the re-extraction migration
+EXTRACTOR_VERSION = f"{EXTRACTOR_REVISION}-{extractor_fingerprint()}"
+
+
+def _find_header(text: str) -> int:
+    """Start of the highest-priority header found in `text`, or -1."""
+    if text.isascii():
+        scan, pattern = text, _HEADER_RE_ASCII
+    else:
+        # str.lower() can change lengths outside ASCII; match on the lowered copy
+        scan, pattern = text.lower(), _HEADER_RE
+    first = {}
+    for m in pattern.finditer(scan):
+        # at each position the lowest-numbered matching header is reported, so the
+        # first position of the best header present is always seen
+        index = m.lastindex - 1
+        if index == 0:
+            return m.start()
+        first.setdefault(index, m.start())
+    return first[min(first)] if first else -1
 
 
+@timed("section_heuristics")
 def find_skills_section(text: str) -> Tuple[int, int, str]:
     """
     Try to locate the start and end of the Skills section. Returns
@@ -46,47 +119,45 @@ def find_skills_section(text: str) -> Tuple[int, int, str]:
       - find a header like 'Skills' and capture ~3 lines after it
       - fallback: look for common short lines with many comma-separated tokens
     """
-    lowered = text.lower()
-    for header in SKILLS_SECTION_HEADERS:
-        m = re.search(header, lowered)
-        if m:
-            start = m.start()
-            # heuristically take next 600 characters ( ~3-10 lines )
-            end = start + 600
-            section_text = text[start:end]
-            return start, end, section_text
+    start = _find_header(text)
+    if start >= 0:
+        # heuristically take next 600 characters ( ~3-10 lines )
+        end = start + 600
+        section_text = text[start:end]
+        return start, end, section_text
 
     # fallback: pick lines with many comma-separated tokens (likely skills list)
     lines = text.splitlines()
+    start = 0  # approximate char position of line i
     for i, line in enumerate(lines):
-        if len(line.split(',')) >= 3 and len(line) < 200:
+        if line.count(',') >= 2 and len(line) < 200:
             # return this line (and next 2 lines)
             section_text = "\n".join(lines[i:i+3])
-            # get char positions approx
-            start = sum(len(l)+1 for l in lines[:i])
             end = start + len(section_text)
             return start, end, section_text
+        start += len(line) + 1
 
     return 0, 0, ""
 
 
-def extract_skill_candidates_from_section(section_text: str) -> List[str]:
+def iter_skill_candidates_from_section(section_text: str) -> Iterator[str]:
     """
-    From the skills-section-like text, split on bullets/commas and return candidate tokens.
+    From the skills-section-like text, split on bullets/commas and yield candidate tokens.
     """
-    items = SPLIT_PATTERN.split(section_text)
-    cleaned = []
-    for it in items:
+    for it in SPLIT_PATTERN.split(section_text):
         it = it.strip()
         if not it:
             continue
         # remove extra parentheticals and years/percentages
-        it = re.sub(r"\(.*?\)", "", it)
-        it = re.sub(r"\d{1,3}%", "", it)
+        it = PARENTHETICAL_PATTERN.sub("", it)
+        it = PERCENT_PATTERN.sub("", it)
         it = it.strip()
         if len(it) >= 2 and len(it) < 60:
-            cleaned.append(it)
-    return cleaned
+            yield it
+
+
+def extract_skill_candidates_from_section(section_text: str) -> List[str]:
+    return list(iter_skill_candidates_from_section(section_text))
 
 
 def extract_skills_from_text(text: str, top_k_named_entities: int = 50) -> List[str]:
@@ -94,55 +165,112 @@ def extract_skills_from_text(text: str, top_k_named_entities: int = 50) -> List[
     Combined approach:
      1. Try to find a Skills section and split on bullets/commas.
      2. Use spaCy noun chunks and named entities to pick technical noun phrases.
-     3. Merge and canonicalize.
+     3. Add every taxonomy skill mentioned anywhere in the text.
+     4. Merge and canonicalize.
     """
-    skills: Set[str] = set()
+    with timed("spacy"):
+        doc = get_nlp()(text)
+    return skills_from_doc(text, doc, top_k_named_entities)
 
+
+def _timed_docs(docs: Iterator) -> Iterator:
+    """Pass nlp.pipe's docs through, recording the time spent producing them as one `spacy` stage."""
+    spent = 0.0
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                doc = next(docs)
+            except StopIteration:
+                return
+            finally:
+                spent += time.perf_counter() - start
+            yield doc
+    finally:
+        record_stage("spacy", spent)
+
+
+def extract_skills_batch(
+    texts: Iterable[str],
+    batch_size: int = SKILL_BATCH_SIZE,
+    n_process: int = 1,
+    top_k_named_entities: int = 50,
+) -> List[List[str]]:
+    """
+    Batched version of extract_skills_from_text built on nlp.pipe.
+    Returns one skill list per input text, in input order. The server runs
+    this inside the process pool (extraction_cache splits big batches across
+    it), where nlp.pipe can't fork workers of its own; `n_process` > 1 is
+    for standalone scripts only.
+    """
+    texts = [t or "" for t in texts]
+    if not texts:
+        return []
+    docs = _timed_docs(get_nlp().pipe(texts, batch_size=batch_size, n_process=n_process))
+    return [
+        skills_from_doc(text, doc, top_k_named_entities)
+        for text, doc in zip(texts, docs)
+    ]
+
+
+def iter_raw_candidates(text: str, doc, top_k_named_entities: int = 50) -> Iterator[str]:
+    """
+    Raw skill phrases from the section heuristics on `text` and the entity /
+    noun-chunk heuristics on its already-processed spaCy `doc`, then taxonomy
+    matches, in that order (duplicates included).
+    """
     # 1) Section-based extraction
     _, _, section_text = find_skills_section(text)
     if section_text:
-        candidates = extract_skill_candidates_from_section(section_text)
-        for c in candidates:
-            skills.add(c.lower())
+        for c in iter_skill_candidates_from_section(section_text):
+            yield c.lower()
 
     # 2) spaCy-based extraction from whole resume
-    doc = nlp(text)
     # Named entities and noun chunks are good sources
     for ent in doc.ents[:top_k_named_entities]:
         # keep ORG/WORK_OF_ART/PRODUCT/TECH-like tokens
-        if ent.label_ in ("ORG", "PRODUCT", "WORK_OF_ART", "LANGUAGE", "NORP", "TECHNOLOGY"):
-            skills.add(ent.text.lower())
+        if ent.label_ in SKILL_ENTITY_LABELS:
+            yield ent.text.lower()
     # noun chunks: filter for short technical phrases
     for chunk in doc.noun_chunks:
         phrase = chunk.text.lower().strip()
         # heuristics: contain alnum and at least one short token, not full sentences
-        if 1 <= len(phrase.split()) <= 4 and re.search(r"[a-zA-Z0-9\+\#\.\-]", phrase):
+        if 1 <= len(phrase.split()) <= 4 and TECH_CHAR_PATTERN.search(phrase):
             # ignore stopwords-only chunks
             if len(phrase) > 1 and len(phrase) < 60:
-                skills.add(phrase)
+                yield phrase
+
+    # 3) gazetteer matches from the skill taxonomy (already canonical)
+    yield from taxonomy.find(text)
 
-    # 3) post-process: canonicalize and filter
-    processed = []
-    for s in skills:
+
+def iter_canonical_skills(candidates: Iterable[str]) -> Iterator[str]:
+    """Canonicalize candidates and drop the ones that can't be skills."""
+    for s in candidates:
         s_norm = s.strip().lower()
         # basic lowercase and cleanup
-        s_norm = re.sub(r"[^\w\s\+\#\.]", " ", s_norm)
-        s_norm = re.sub(r"\s+", " ", s_norm).strip()
+        s_norm = NON_SKILL_CHARS_PATTERN.sub(" ", s_norm)
+        s_norm = WHITESPACE_PATTERN.sub(" ", s_norm).strip()
 
-        # map some items to canonical names
-        mapped = CANONICAL_MAP.get(s_norm, s_norm)
-        # filter out near-english stopwords by naive heuristic
-        if len(mapped) <= 2:
+        # map known aliases to canonical names
+        mapped = taxonomy.canonicalize(s_norm)
+        # filter out near-english stopwords by naive heuristic (known short skills like "c#" stay)
+        if len(mapped) <= 2 and not taxonomy.is_skill(mapped):
             continue
         # filter extremely long candidates
         if len(mapped) > 60:
             continue
-        processed.append(mapped)
+        yield mapped
+
 
-    # dedupe while preserving ordering-ish
-    final = []
-    for p in processed:
-        if p not in final:
-            final.append(p)
+def skills_from_doc(text: str, doc, top_k_named_entities: int = 50) -> List[str]:
+    """
+    Run the section heuristics on `text` and the entity / noun-chunk
+    heuristics on its already-processed spaCy `doc`.
+    """
+    # raw phrases are collapsed in a set first, then canonicalized; the set's
+    # iteration order decides the output order, so it is built exactly as before
+    skills: Set[str] = set(iter_raw_candidates(text, doc, top_k_named_entities))
 
-    return final
+    # 4) post-process, then dedupe keeping first occurrences (dict is an ordered set)
+    return list(dict.fromkeys(iter_canonical_skills(skills)))
@@ -0,0 +1,265 @@
+# backend/app/services/skill_index.py
+import asyncio
+import logging
+import os
+import threading
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.db import db
+from app.services.executor import run_blocking
+
+# Jobs read from Mongo per add_jobs() call while (re)building the index
+INDEX_BUILD_BATCH = 5000
+# sync() re-reads jobs whose skills_updated_at is up to this many seconds older
+# than the newest one seen: writers in other processes may commit out of
+# order or with slightly skewed clocks
+INDEX_SYNC_OVERLAP = float(os.getenv("INDEX_SYNC_OVERLAP", "30"))
+# Compact the index once this fraction of its slots are tombstones of updated or removed jobs
+INDEX_COMPACT_RATIO = float(os.getenv("INDEX_COMPACT_RATIO", "0.25"))
+
+logger = logging.getLogger(__name__)
+
+
+def _clean(skills) -> set:
+    return {s.strip().lower() for s in skills or [] if isinstance(s, str) and s.strip()}
+
+
+class SkillIndex:
+    """
+    In-memory inverted index: canonical (lowercased) skill -> posting list of jobs.
+
+    Jobs are stored in integer slots; posting lists are compact int32 arrays.
+    Updating a job tombstones its old slot and appends a new one, so inserts
+    and updates are O(#skills) and queries only touch jobs that share at
+    least one skill with the resume. Once tombstones pass INDEX_COMPACT_RATIO
+    of the slots, sync compacts them away.
+
+    Jobs loaded from Mongo carry their `skills_updated_at` stamp; the newest
+    one is the watermark sync() continues from, and the stamps inside the
+    overlap window are remembered so re-reading those jobs doesn't re-add them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._job_ids: List[str] = []          # slot -> job id
+        self._slots: Dict[str, int] = {}       # job id -> live slot
+        self._alive = bytearray()              # slot -> 1 if live
+        self._dead = 0                         # tombstoned slots
+        self._postings: Dict[str, array] = {}
+        self.watermark: Optional[datetime] = None   # newest skills_updated_at seen, for sync()
+        self._recent: Dict[str, datetime] = {}      # job id -> stamp, within the overlap window
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def add_job(self, job_id, skills: Iterable[str]) -> None:
+        self.add_jobs([(job_id, skills)])
+
+    def add_jobs(self, jobs: Iterable[Tuple]) -> None:
+        """Index (job_id, skills) pairs, or (job_id, skills, skills_updated_at) as read from Mongo."""
+        with self._lock:
+            for job_id, skills, *stamp in jobs:
+                job_id = str(job_id)
+                if stamp and stamp[0] is not None:
+                    self._recent[job_id] = stamp[0]
+                    if self.watermark is None or stamp[0] > self.watermark:
+                        self.watermark = stamp[0]
+                self._remove(job_id)
+                slot = len(self._job_ids)
+                cleaned = _clean(skills)
+                self._job_ids.append(job_id)
+                self._slots[job_id] = slot
+                self._alive.append(1)
+                for skill in cleaned:
+                    postings = self._postings.get(skill)
+                    if postings is None:
+                        postings = self._postings[skill] = array("i")
+                    postings.append(slot)
+
+    def remove_job(self, job_id) -> None:
+        with self._lock:
+            self._remove(str(job_id))
+
+    def _remove(self, job_id: str) -> None:
+        slot = self._slots.pop(job_id, None)
+        if slot is not None:
+            self._alive[slot] = 0
+            self._dead += 1
+
+    def needs_compaction(self) -> bool:
+        return self._dead > 0 and self._dead >= INDEX_COMPACT_RATIO * len(self._job_ids)
+
+    def compact(self) -> None:
+        """Drop tombstoned slots: live jobs are renumbered in order and their postings remapped."""
+        with self._lock:
+            alive = np.frombuffer(self._alive, dtype=np.uint8).astype(bool)
+            remap = (np.cumsum(alive) - 1).astype(np.int32)
+            postings = {}
+            for skill, slots in self._postings.items():
+                slots = np.frombuffer(slots, dtype=np.int32)
+                slots = remap[slots[alive[slots]]]
+                if len(slots):
+                    postings[skill] = array("i")
+                    postings[skill].frombytes(slots.tobytes())
+            self._postings = postings
+            self._job_ids = [job_id for job_id, live in zip(self._job_ids, alive.tolist()) if live]
+            self._slots = {job_id: slot for slot, job_id in enumerate(self._job_ids)}
+            self._alive = bytearray(b"\x01" * len(self._job_ids))
+            self._dead = 0
+
+    def indexed_at(self, job_id) -> Optional[datetime]:
+        """The skills_updated_at a recently synced job was indexed with."""
+        return self._recent.get(str(job_id))
+
+    def since(self) -> Optional[datetime]:
+        """Lower bound on skills_updated_at for the next sync (None: no stamped job seen yet)."""
+        with self._lock:
+            if self.watermark is None:
+                return None
+            cutoff = self.watermark - timedelta(seconds=INDEX_SYNC_OVERLAP)
+            self._recent = {j: t for j, t in self._recent.items() if t >= cutoff}
+            return cutoff
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def replace(self, other: "SkillIndex") -> None:
+        """Take over the contents of `other` (a freshly built index) in one step."""
+        with self._lock, other._lock:
+            self.__dict__.update({k: v for k, v in other.__dict__.items() if k != "_lock"})
+
+    def top_k(self, resume_skills: Iterable[str], k: int = 10) -> List[Tuple[str, int]]:
+        """
+        The k jobs sharing the most skills with the resume, as (job_id, overlap)
+        sorted best first. Since compute_match divides by the resume's skill
+        count, ordering by overlap is ordering by match percent.
+        """
+        resume_set = _clean(resume_skills)
+        with self._lock:
+            views = [np.frombuffer(self._postings[s], dtype=np.int32)
+                     for s in resume_set if s in self._postings and len(self._postings[s])]
+            if not views:
+                return []
+            hits = np.concatenate(views)
+            del views  # release buffer exports so posting arrays can grow again
+            slots, counts = np.unique(hits, return_counts=True)
+            alive = np.frombuffer(self._alive, dtype=np.uint8)[slots].astype(bool)
+            slots, counts = slots[alive], counts[alive]
+            if not len(slots):
+                return []
+            if k < len(slots):
+                keep = np.argpartition(-counts, k - 1)[:k]
+                # argpartition splits ties arbitrarily; widen to every job tied
+                # with the k-th best so the id tie-break below is deterministic
+                threshold = counts[keep].min()
+                keep = np.nonzero(counts >= threshold)[0]
+                slots, counts = slots[keep], counts[keep]
+            ranked = sorted(
+                ((self._job_ids[s], int(c)) for s, c in zip(slots.tolist(), counts.tolist())),
+                key=lambda item: (-item[1], item[0]),
+            )
+        return ranked[:k]
+
+
+skill_index = SkillIndex()
+
+
+# One build or sync at a time, so a rebuild can't interleave with another
+_build_lock = asyncio.Lock()
+
+
+async def ensure_indexes() -> None:
+    # multikey index: lets Mongo answer {"skills": {"$in": [...]}} without a collection scan
+    await db.jobs.create_index("skills")
+    # sync(): jobs whose skills were written since the watermark
+    await db.jobs.create_index("skills_updated_at")
+
+
+async def _load(index: SkillIndex, query: dict, skip_seen: bool = False) -> None:
+    batch = []
+    async for doc in db.jobs.find(query, {"skills": 1, "skills_updated_at": 1}):
+        stamp = doc.get("skills_updated_at")
+        if skip_seen and stamp is not None and index.indexed_at(doc["_id"]) == stamp:
+            continue
+        batch.append((doc["_id"], doc.get("skills", []), stamp))
+        if len(batch) >= INDEX_BUILD_BATCH:
+            await run_blocking(index.add_jobs, batch)
+            batch = []
+    if batch:
+        await run_blocking(index.add_jobs, batch)
+
+
+async def _build(index: SkillIndex) -> None:
+    # built off to the side so queries keep using the old contents meanwhile
+    fresh = SkillIndex()
+    await _load(fresh, {})
+    fresh.ready = True
+    index.replace(fresh)
+
+
+async def build_skill_index(index: Optional[SkillIndex] = None) -> SkillIndex:
+    """(Re)build the index from every job in Mongo."""
+    if index is None:
+        index = skill_index
+    async with _build_lock:
+        await _build(index)
+    return index
+
+
+async def sync_skill_index(index: Optional[SkillIndex] = None) -> SkillIndex:
+    """
+    Bring the index up to date with jobs whose skills were written since the
+    last build/sync (new postings, upserts and re-extractions, from any
+    worker process), using the skills_updated_at watermark.
+    """
+    if index is None:
+        index = skill_index
+    async with _build_lock:
+        if not index.ready:
+            await _build(index)
+            return index
+        since = index.since()
+        query = {"skills_updated_at": {"$gte": since}} if since is not None else {"skills_updated_at": {"$ne": None}}
+        await _load(index, query, skip_seen=True)
+        if index.needs_compaction():
+            await run_blocking(index.compact)
+    return index
+
+
+_builder: Optional[asyncio.Task] = None
+
+
+async def _build_at_startup() -> None:
+    try:
+        await build_skill_index()
+        logger.info("Skill index built with %d jobs", len(skill_index))
+    except Exception as e:
+        # the first /match/{id}/top request builds it instead
+        logger.warning("Could not build the skill index at startup: %s", e)
+
+
+def start() -> None:
+    """Build the index in the background at startup instead of in the first top-jobs request."""
+    global _builder
+    if _builder is None:
+        _builder = asyncio.get_running_loop().create_task(_build_at_startup())
+
+
+async def stop() -> None:
+    global _builder
+    if _builder is not None:
+        _builder.cancel()
+        try:
+            await _builder
+        except asyncio.CancelledError:
+            pass
+        _builder = None
@@ -0,0 +1,139 @@
+# backend/app/services/skill_taxonomy.py
+import csv
+import hashlib
+import os
+import re
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_TAXONOMY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "skills.csv"
+)
+SKILL_TAXONOMY_PATH = os.getenv("SKILL_TAXONOMY_PATH", DEFAULT_TAXONOMY_PATH)
+
+# A token is a run of letters/digits that may carry the symbols used in tech
+# names (c++, c#, node.js, .net); everything else is a word boundary, so
+# "java" never matches inside "javascript".
+TOKEN_PATTERN = re.compile(r"\.?[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*")
+
+# Terms prefixed with this in the data file are ordinary English words
+# ("go", "excel", "spring"): they canonicalize extracted candidates but are
+# not scanned for in free text.
+LOOKUP_ONLY_PREFIX = "~"
+
+# Trie key marking "a phrase ends here"; tokens are never None
+_END = None
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def normalize_phrase(phrase: str) -> str:
+    """Lowercase and collapse a phrase to its tokens, the key used for alias lookups."""
+    return " ".join(tokenize(phrase))
+
+
+class SkillTaxonomy:
+    """
+    Compiled skill gazetteer. Holds an alias -> canonical lookup table and a
+    token trie so every known skill can be found in one left-to-right pass.
+    """
+
+    def __init__(self):
+        self.aliases: Dict[str, str] = {}
+        self.skills: Dict[str, None] = {}
+        self._trie: dict = {}
+        # hash of the rows it was built from; part of the extractor version
+        self.fingerprint = ""
+
+    def add(self, canonical: str, alias: str, scan: bool = True) -> None:
+        key = normalize_phrase(alias)
+        if not key:
+            return
+        canonical = canonical.strip().lower()
+        self.skills.setdefault(canonical, None)
+        # first definition wins, so the data file order decides conflicts
+        self.aliases.setdefault(key, canonical)
+        if not scan:
+            return
+        node = self._trie
+        for token in key.split(" "):
+            node = node.setdefault(token, {})
+        node.setdefault(_END, canonical)
+
+    def lookup(self, phrase: str) -> Optional[str]:
+        """Canonical name for a known skill or alias, else None."""
+        return self.aliases.get(normalize_phrase(phrase))
+
+    def canonicalize(self, phrase: str) -> str:
+        """Canonical name for a known skill or alias, else the phrase unchanged."""
+        return self.lookup(phrase) or phrase
+
+    def is_skill(self, name: str) -> bool:
+        return name in self.skills
+
+    def find(self, text: str) -> List[str]:
+        """
+        Canonical names of every skill mentioned in `text`, in order of first
+        appearance. Longest match wins ("machine learning" over "learning").
+        """
+        tokens = tokenize(text)
+        found: Dict[str, None] = {}
+        n = len(tokens)
+        i = 0
+        while i < n:
+            node = self._trie
+            match, end = None, i
+            j = i
+            while j < n:
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                j += 1
+                if _END in node:
+                    match, end = node[_END], j
+            if match is not None:
+                found.setdefault(match, None)
+                i = end
+            else:
+                i += 1
+        return list(found)
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.skills
+
+
+def build_taxonomy(rows: Iterable[Iterable[str]]) -> SkillTaxonomy:
+    """Build a taxonomy from (skill, alias, alias, ...) rows."""
+    taxonomy = SkillTaxonomy()
+    hasher = hashlib.sha1()
+    for row in rows:
+        terms = [t.strip() for t in row if t and t.strip()]
+        if not terms:
+            continue
+        hasher.update("\x1f".join(terms).encode("utf-8") + b"\n")
+        canonical = terms[0].lstrip(LOOKUP_ONLY_PREFIX)
+        for term in terms:
+            scan = not term.startswith(LOOKUP_ONLY_PREFIX)
+            taxonomy.add(canonical, term.lstrip(LOOKUP_ONLY_PREFIX), scan=scan)
+    taxonomy.fingerprint = hasher.hexdigest()[:12]
+    return taxonomy
+
+
+def load_taxonomy(path: str = SKILL_TAXONOMY_PATH) -> SkillTaxonomy:
+    """
+    Load a CSV with columns `skill,aliases` where aliases are `;`-separated.
+    A leading `~` marks a term as lookup-only (see LOOKUP_ONLY_PREFIX).
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        return build_taxonomy(
+            [row["skill"], *(row.get("aliases") or "").split(";")] for row in reader
+        )
+
+
+# Load the taxonomy once
+taxonomy = load_taxonomy()
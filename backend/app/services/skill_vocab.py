@@ -0,0 +1,145 @@
+# backend/app/services/skill_vocab.py
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
+
+from app.services.db import db
+
+COLLECTION = "skill_vocab"
+COUNTER_ID = "skill_vocab"
+
+
+def _flatten(skills) -> Iterable[str]:
+    for s in skills or []:
+        if isinstance(s, list):
+            yield from _flatten(s)  # older documents stored nested lists
+        elif isinstance(s, str) and s.strip():
+            yield s.strip().lower()
+
+
+def clean_skills(skills) -> List[str]:
+    """Distinct normalized (stripped, lowercased) skills, the form ids are assigned to."""
+    return list(dict.fromkeys(_flatten(skills)))
+
+
+class SkillVocab:
+    """
+    Normalized skill <-> integer id, shared by every worker process.
+
+    Ids are allocated in Mongo (one `skill_vocab` doc per skill, ranges
+    reserved from a counter) and cached here; resumes and jobs store their
+    skills' ids as a sorted `skill_ids` array next to the strings so matching
+    can run on integer arrays instead of rebuilding string sets.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids: Dict[str, int] = {}
+        self._skills: List[Optional[str]] = []   # id -> skill (None for ids lost to a race)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def size(self) -> int:
+        """One past the highest known id; the length of a bitmap over the vocabulary."""
+        return len(self._skills)
+
+    def add_many(self, pairs: Iterable) -> None:
+        with self._lock:
+            for skill, skill_id in pairs:
+                if skill_id >= len(self._skills):
+                    self._skills.extend([None] * (skill_id + 1 - len(self._skills)))
+                self._skills[skill_id] = skill
+                self._ids[skill] = skill_id
+
+    def get(self, skill: str) -> Optional[int]:
+        return self._ids.get(skill)
+
+    def ids(self, skills) -> List[int]:
+        """Sorted ids of the known skills among `skills` (unknown ones are dropped)."""
+        found = (self._ids.get(s) for s in clean_skills(skills))
+        return sorted(i for i in found if i is not None)
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        skills = self._skills
+        return [skills[i] for i in ids]
+
+    def bitmap(self, ids, size: Optional[int] = None) -> np.ndarray:
+        """Boolean membership array over the id space with `ids` set."""
+        mask = np.zeros(max(size or 0, self.size), dtype=bool)
+        mask[np.asarray(ids, dtype=np.int64)] = True
+        return mask
+
+    async def encode(self, skills) -> List[int]:
+        """Sorted ids for `skills`, allocating ids for skills not seen before."""
+        return (await self.encode_many([skills]))[0]
+
+    async def encode_many(self, skills_lists) -> List[List[int]]:
+        """
+        encode() for a batch of documents: every unknown skill across the batch
+        is looked up with one query and allocated with one counter bump and
+        one insert, so a batch costs at most three round trips.
+        """
+        cleaned = [clean_skills(skills) for skills in skills_lists]
+        missing = list(dict.fromkeys(s for skills in cleaned for s in skills if s not in self._ids))
+        if missing:
+            await self._load({"skill": {"$in": missing}})
+            missing = [s for s in missing if s not in self._ids]
+        if missing:
+            await self._allocate(missing)
+        return [sorted(self._ids[s] for s in skills) for skills in cleaned]
+
+    async def resolve(self, ids: Iterable[int]) -> None:
+        """Make sure ids allocated by other processes can be decoded."""
+        skills = self._skills
+        unknown = [i for i in set(ids) if i >= len(skills) or skills[i] is None]
+        if unknown:
+            await self._load({"_id": {"$in": unknown}})
+
+    async def _load(self, query: dict) -> None:
+        self.add_many([(doc["skill"], doc["_id"]) async for doc in db[COLLECTION].find(query)])
+
+    async def _allocate(self, skills: List[str]) -> None:
+        counter = await db.counters.find_one_and_update(
+            {"_id": COUNTER_ID}, {"$inc": {"seq": len(skills)}},
+            upsert=True, return_document=ReturnDocument.AFTER,
+        )
+        first = counter["seq"] - len(skills)
+        docs = [{"_id": first + i, "skill": s} for i, s in enumerate(skills)]
+        try:
+            await db[COLLECTION].insert_many(docs, ordered=False)
+        except BulkWriteError:
+            # another process allocated some of these skills first; its ids win
+            await self._load({"skill": {"$in": skills}})
+        else:
+            self.add_many((d["skill"], d["_id"]) for d in docs)
+
+
+skill_vocab = SkillVocab()
+
+
+async def ensure_indexes() -> None:
+    await db[COLLECTION].create_index("skill", unique=True)
+
+
+async def attach_skill_ids(docs: List[Dict]) -> List[Dict]:
+    """
+    Fill `skill_ids` on documents stored before skills had ids (in memory
+    only) and make every id in `docs` decodable; returns `docs`.
+    """
+    unencoded = [doc for doc in docs if "skill_ids" not in doc]
+    if unencoded:
+        ids_lists = await skill_vocab.encode_many([doc.get("skills", []) for doc in unencoded])
+        for doc, ids in zip(unencoded, ids_lists):
+            doc["skill_ids"] = ids
+    await skill_vocab.resolve(i for doc in docs for i in doc["skill_ids"])
+    return docs
+
+
+async def load_vocab() -> SkillVocab:
+    await skill_vocab._load({})
+    return skill_vocab
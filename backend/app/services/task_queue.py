@@ -0,0 +1,154 @@
+# backend/app/services/task_queue.py
+import asyncio
+import itertools
+import logging
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from fastapi import HTTPException
+
+from app.services.cache import TTLCache
+
+# Concurrent tasks; tasks are coroutines that offload CPU work to the executor
+TASK_WORKERS = int(os.getenv("TASK_WORKERS", "4"))
+# How long finished task results stay queryable at /tasks/{task_id}
+TASK_RESULT_TTL = int(os.getenv("TASK_RESULT_TTL", "3600"))
+TASK_RESULT_MAX = int(os.getenv("TASK_RESULT_MAX", "10000"))
+
+# Lower runs first
+PRIORITY_HIGH = 0      # a user is waiting on it (roadmaps)
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 10      # batch work (bulk ingestion)
+
+logger = logging.getLogger(__name__)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class TaskQueue:
+    """
+    In-process background task queue: a priority queue drained by a bounded
+    pool of worker coroutines. Submitting a task whose `dedupe_key` matches a
+    queued or running task returns that task instead of queueing a duplicate.
+    Finished tasks keep their result (or error) for `result_ttl` seconds.
+    """
+
+    def __init__(self, workers: int = TASK_WORKERS, result_ttl: float = TASK_RESULT_TTL,
+                 max_results: int = TASK_RESULT_MAX):
+        self.workers = workers
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._workers: List[asyncio.Task] = []
+        self._active: Dict[str, dict] = {}            # queued + running records
+        self._calls: Dict[str, tuple] = {}            # task id -> (callable, dedupe key)
+        self._inflight: Dict[Hashable, str] = {}      # dedupe key -> task id
+        self._finished = TTLCache(maxsize=max_results, ttl=result_ttl)
+        self._seq = itertools.count()                 # FIFO within a priority
+        self._counters = {"submitted": 0, "deduplicated": 0, "done": 0, "failed": 0}
+
+    def start(self) -> None:
+        """Start the workers on the running loop (idempotent)."""
+        if self._workers:
+            return
+        self._queue = asyncio.PriorityQueue()
+        loop = asyncio.get_running_loop()
+        self._workers = [loop.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def drain(self) -> None:
+        """Wait until everything queued so far has finished (for CLI runs that exit afterwards)."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    def submit(self, name: str, call: Callable[[], Awaitable[Any]], priority: int = PRIORITY_NORMAL,
+               dedupe_key: Optional[Hashable] = None, task_id: Optional[str] = None,
+               progress: Optional[dict] = None) -> dict:
+        """
+        Queue `call()` (a no-argument coroutine function, e.g. functools.partial)
+        and return its task record. `progress` is an optional dict the task
+        updates while it runs, reported with the record.
+        """
+        self.start()
+        if dedupe_key is not None:
+            existing = self._inflight.get(dedupe_key)
+            if existing in self._active:
+                self._counters["deduplicated"] += 1
+                return self._active[existing]
+
+        task_id = task_id or uuid.uuid4().hex
+        record = {
+            "task_id": task_id,
+            "name": name,
+            "status": "queued",
+            "priority": priority,
+            "created_at": _now(),
+            "started_at": None,
+            "finished_at": None,
+            "result": None,
+            "error": None,
+        }
+        if progress is not None:
+            record["progress"] = progress
+        self._active[task_id] = record
+        self._calls[task_id] = (call, dedupe_key)
+        if dedupe_key is not None:
+            self._inflight[dedupe_key] = task_id
+        self._counters["submitted"] += 1
+        self._queue.put_nowait((priority, next(self._seq), task_id))
+        return record
+
+    def get(self, task_id: str) -> Optional[dict]:
+        return self._active.get(task_id) or self._finished.get(task_id)
+
+    async def _worker(self) -> None:
+        while True:
+            _, _, task_id = await self._queue.get()
+            record = self._active[task_id]
+            call, dedupe_key = self._calls.pop(task_id)
+            record["status"] = "running"
+            record["started_at"] = _now()
+            try:
+                record["result"] = await call()
+                record["status"] = "done"
+                self._counters["done"] += 1
+            except asyncio.CancelledError:
+                record["status"] = "cancelled"
+                raise
+            except HTTPException as e:
+                record["status"] = "failed"
+                record["error"] = e.detail
+                record["status_code"] = e.status_code
+                self._counters["failed"] += 1
+            except Exception as e:
+                record["status"] = "failed"
+                record["error"] = str(e)
+                self._counters["failed"] += 1
+                logger.exception("Task %s %s failed: %s", record["name"], task_id, e)
+            finally:
+                record["finished_at"] = _now()
+                self._active.pop(task_id, None)
+                self._finished.set(task_id, record)
+                if dedupe_key is not None and self._inflight.get(dedupe_key) == task_id:
+                    del self._inflight[dedupe_key]
+                self._queue.task_done()
+
+    def stats(self) -> Dict[str, object]:
+        running = sum(1 for r in self._active.values() if r["status"] == "running")
+        return {
+            "workers": self.workers,
+            "queued": len(self._active) - running,
+            "running": running,
+            **self._counters,
+            "finished_kept": len(self._finished),
+        }
+
+
+task_queue = TaskQueue()
@@ -0,0 +1,144 @@
+# backend/app/services/uploads.py
+import hashlib
+import os
+import tempfile
+import uuid
+from typing import BinaryIO, Dict, Tuple
+
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+
+from app.services.executor import run_blocking
+
+UPLOAD_DIR = os.getenv("UPLOAD_DIR", "/app/app/uploads")
+# Bytes read from the request and written to disk per step
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+# Larger uploads are rejected with 413 as soon as the limit is crossed
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+ALLOWED_EXTENSIONS = {".pdf", ".docx", ".doc"}
+# Room for multipart boundaries and part headers on top of a capped file's size
+MULTIPART_OVERHEAD = int(os.getenv("MULTIPART_OVERHEAD", str(64 * 1024)))
+
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+
+
+class FileTooLarge(ValueError):
+    pass
+
+
+def is_allowed(filename: str) -> bool:
+    return os.path.splitext(filename or "")[1].lower() in ALLOWED_EXTENSIONS
+
+
+def _finalize(tmp_path: str, final_path: str) -> None:
+    if os.path.exists(final_path):
+        # identical content already stored; keep the existing copy
+        os.remove(tmp_path)
+    else:
+        os.replace(tmp_path, final_path)
+
+
+def _discard(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _copy(src: BinaryIO, path: str, max_bytes: int) -> Tuple[str, int]:
+    """Write `src` to `path` in chunks; (sha256 hex digest, size). Removes `path` on failure."""
+    hasher = hashlib.sha256()
+    size = 0
+    try:
+        with open(path, "wb") as out:
+            for chunk in iter(lambda: src.read(UPLOAD_CHUNK_SIZE), b""):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise FileTooLarge(f"File exceeds the {max_bytes} byte upload limit")
+                hasher.update(chunk)
+                out.write(chunk)
+    except BaseException:
+        _discard(path)
+        raise
+    return hasher.hexdigest(), size
+
+
+def store_file(src: BinaryIO, filename: str, upload_dir: str = UPLOAD_DIR,
+               max_bytes: int = MAX_UPLOAD_BYTES) -> Tuple[str, str, int]:
+    """
+    Copy a readable binary stream to disk in fixed-size chunks, hashing as it
+    goes, and store it under its content hash (`<sha256><ext>`). Concurrent
+    writes of the same filename can't collide and duplicate files are stored
+    once. Raises FileTooLarge as soon as `max_bytes` is crossed.
+    Returns (path, sha256 hex digest, size in bytes).
+    """
+    ext = os.path.splitext(filename or "")[1].lower()
+    tmp_path = os.path.join(upload_dir, f".{uuid.uuid4().hex}.part")
+    digest, size = _copy(src, tmp_path, max_bytes)
+    final_path = os.path.join(upload_dir, digest + ext)
+    _finalize(tmp_path, final_path)
+    return final_path, digest, size
+
+
+def store_temp_file(src: BinaryIO, filename: str, upload_dir: str = UPLOAD_DIR,
+                    max_bytes: int = MAX_UPLOAD_BYTES) -> Tuple[str, int]:
+    """
+    store_file for a file owned (and deleted) by a single job: a unique path,
+    never shared with an identical upload. Returns (path, size in bytes).
+    """
+    fd, path = tempfile.mkstemp(suffix=os.path.splitext(filename or "")[1].lower(), dir=upload_dir)
+    os.close(fd)
+    _, size = _copy(src, path, max_bytes)
+    return path, size
+
+
+async def save_upload(file: UploadFile, upload_dir: str = UPLOAD_DIR,
+                      max_bytes: int = MAX_UPLOAD_BYTES) -> Tuple[str, str, int]:
+    """store_file for a request upload, run in the worker pool; errors map to 400/413."""
+    if not is_allowed(file.filename):
+        raise HTTPException(status_code=400, detail="Unsupported file format. Only PDF and DOCX are allowed.")
+    try:
+        return await run_blocking(store_file, file.file, file.filename, upload_dir, max_bytes)
+    except FileTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+
+class BodySizeLimit:
+    """
+    ASGI middleware capping the request body per path. A Content-Length over
+    the limit is refused with 413 before any of the body is read; otherwise
+    the body is counted as it streams in and the request fails with 413 as
+    soon as the limit is crossed, so Starlette never spools more than
+    `limit` bytes of a multipart upload to disk.
+    """
+
+    def __init__(self, app, limits: Dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send):
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        detail = f"Request body exceeds the {limit} byte limit"
+        length = Headers(scope=scope).get("content-length", "")
+        if length.isdigit() and int(length) > limit:
+            await JSONResponse({"detail": detail}, status_code=413)(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # FastAPI re-raises HTTPExceptions from body parsing as they are
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,56 @@
+# backend/app/services/warmup.py
+import asyncio
+import logging
+import os
+import time
+from typing import Dict
+
+from app.services import db, roadmap_agent, skill_extractor
+from app.services.skill_index import skill_index
+from app.services.executor import run_blocking
+
+# Load the spaCy model and create the LLM / Mongo clients right after startup
+# instead of on the first request that needs them
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "false").lower() in ("1", "true", "yes")
+
+_state = {"status": "idle", "seconds": None, "errors": {}}
+_tasks = set()  # strong ref to the warm-up task
+logger = logging.getLogger(__name__)
+
+
+async def warm_up() -> Dict:
+    """Initialize the lazy singletons in parallel; failures are recorded, not raised."""
+    _state["status"] = "running"
+    start = time.perf_counter()
+    steps = {
+        "nlp": run_blocking(skill_extractor.get_nlp),
+        "llm_client": run_blocking(roadmap_agent.get_llm_client),
+        "db": db.ping(),
+    }
+    results = await asyncio.gather(*steps.values(), return_exceptions=True)
+    _state["errors"] = {name: str(r) for name, r in zip(steps, results) if isinstance(r, Exception)}
+    for name, error in _state["errors"].items():
+        logger.warning("Warm-up of %s failed: %s", name, error)
+    _state["seconds"] = round(time.perf_counter() - start, 3)
+    _state["status"] = "done"
+    return dict(_state)
+
+
+def start() -> None:
+    """Run warm_up in the background so the app answers liveness checks meanwhile."""
+    _state["status"] = "running"
+    task = asyncio.get_running_loop().create_task(warm_up())
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+
+def state() -> Dict:
+    return {
+        "warmup": {"enabled": WARMUP_ON_STARTUP, **_state},
+        "models": {
+            "nlp": skill_extractor.nlp_loaded(),
+            "llm_client": roadmap_agent.llm_client_loaded(),
+            "db_client": db.client_loaded(),
+            "skill_index": skill_index.ready,
+        },
+    }
@@ -0,0 +1,89 @@
+# backend/benchmarks/bench_job_fetch.py
+"""
+Wall time to fetch several (query, location) searches, paging each up to
+--limit jobs, against the local mock SerpAPI: one search after another vs
+all searches concurrently through the shared pool and rate limiter. Also
+reports time to the first page, when storage could start. No Mongo needed.
+
+    python -m benchmarks.bench_job_fetch --searches 6 --limit 30 --latency 0.5
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.common import report
+from benchmarks.stub_serpapi import StubSerpAPI
+from benchmarks.synthetic import LOCATIONS, TITLES
+
+
+async def serial(job_fetcher, searches, limit):
+    start = time.perf_counter()
+    first = None
+    jobs = 0
+    for query, location in searches:
+        async for page in job_fetcher.iter_job_pages(query, location, limit):
+            first = first or time.perf_counter() - start
+            jobs += len(page)
+    return jobs, first, time.perf_counter() - start
+
+
+async def concurrent(job_fetcher, searches, limit):
+    start = time.perf_counter()
+    first = None
+    jobs = 0
+    async for page in job_fetcher.fetch_many(searches, limit):
+        if "error" in page:
+            raise RuntimeError(page["error"])
+        first = first or time.perf_counter() - start
+        jobs += len(page["jobs"])
+    return jobs, first, time.perf_counter() - start
+
+
+async def bench(args, stub):
+    from app.services import job_fetcher
+
+    searches = [(TITLES[i % len(TITLES)], LOCATIONS[i % len(LOCATIONS)]) for i in range(args.searches)]
+    rows = []
+    try:
+        for name, fn in (("serial", serial), ("concurrent", concurrent)):
+            before, stub.max_in_flight = stub.requests, 0
+            jobs, first, total = await fn(job_fetcher, searches, args.limit)
+            rows.append({
+                "mode": name,
+                "searches": len(searches),
+                "jobs": jobs,
+                "requests": stub.requests - before,
+                "max_in_flight": stub.max_in_flight,
+                "first_page_ms": round(first * 1000, 1),
+                "total_ms": round(total * 1000, 1),
+            })
+    finally:
+        await job_fetcher.close()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--searches", type=int, default=6)
+    parser.add_argument("--limit", type=int, default=30, help="jobs per search (10 per page)")
+    parser.add_argument("--latency", type=float, default=0.5, help="mock SerpAPI seconds per page")
+    parser.add_argument("--rate", type=float, default=20, help="SERPAPI_RATE requests/second")
+    parser.add_argument("--throttle-every", type=int, default=0, help="mock answers every Nth request with 429")
+    parser.add_argument("--out")
+    args = parser.parse_args()
+
+    stub = StubSerpAPI(latency=args.latency, pages=max(1, -(-args.limit // 10)), throttle_every=args.throttle_every)
+    os.environ["SERPAPI_BASE_URL"] = stub.start()
+    os.environ.setdefault("SERPAPI_KEY", "stub")
+    os.environ["SERPAPI_RATE"] = str(args.rate)
+    os.environ["SERPAPI_BURST"] = str(args.rate)
+    try:
+        rows = asyncio.run(bench(args, stub))
+    finally:
+        stub.stop()
+    report("job fetch", rows, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# backend/benchmarks/bench_jobs_list.py
+"""
+/jobs/list page latency at increasing depth on a large jobs collection:
+skip/limit offset paging (what "page N" used to require) vs keyset paging on
+_id with the same filters the API builds, plus bytes per page with and
+without a `fields=` projection.
+
+Needs a local mongod; seeds a throwaway database once (reused across runs):
+    MONGO_URI=mongodb://localhost:27017 python -m benchmarks.bench_jobs_list --docs 1000000
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+
+import bson
+from pymongo import DESCENDING, MongoClient
+
+from benchmarks.common import report
+from benchmarks.synthetic import COMPANIES, FILLER, LOCATIONS, SKILL_POOL, TITLES
+
+PAGE = 20
+LIST_VIEW_FIELDS = ["title", "company", "location", "skills"]
+
+
+def make_doc(rng: random.Random, job_store) -> dict:
+    skills = rng.sample(SKILL_POOL, 8)
+    doc = {
+        "title": rng.choice(TITLES),
+        "company": rng.choice(COMPANIES),
+        "location": rng.choice(LOCATIONS),
+        "via": "LinkedIn",
+        "description": " ".join(rng.choice(FILLER) for _ in range(12)),
+        "job_highlights": [{"title": "Qualifications", "items": [f"Hands-on knowledge of {s}" for s in skills]}],
+        "extensions": ["Full-time"],
+        "link": "https://example.com/job",
+        "source": "synthetic",
+        "skills": skills,
+        "skills_extracted": True,
+    }
+    doc["company_norm"] = job_store.normalize_field(doc["company"])
+    doc["location_norm"] = job_store.normalize_field(doc["location"])
+    return doc
+
+
+def seed(coll, n: int, job_store, batch: int = 10_000) -> None:
+    have = coll.estimated_document_count()
+    if have >= n:
+        return
+    rng = random.Random(have)
+    start = time.perf_counter()
+    for offset in range(have, n, batch):
+        coll.insert_many([make_doc(rng, job_store) for _ in range(min(batch, n - offset))], ordered=False)
+    print(f"seeded {n - have} jobs in {time.perf_counter() - start:.1f}s")
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return round(statistics.median(samples) * 1000, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=1_000_000)
+    parser.add_argument("--depths", type=int, nargs="+", default=[0, 1_000, 10_000, 100_000, 500_000, 990_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--db", default="career_mentor_bench_jobs")
+    parser.add_argument("--out")
+    args = parser.parse_args()
+
+    os.environ["MONGO_DB"] = args.db
+    from app.services import job_store
+
+    # same indexes the API creates at startup
+    asyncio.run(job_store.ensure_indexes())
+    coll = MongoClient(os.getenv("MONGO_URI", "mongodb://localhost:27017"))[args.db].jobs
+    seed(coll, args.docs, job_store)
+
+    scenarios = [
+        ("all jobs", {}),
+        ("skills=python", {"skills": ["python"]}),
+        ("location=bengaluru", {"location": "bengaluru"}),
+    ]
+    rows = []
+    for name, filters in scenarios:
+        base = job_store.list_filter(**filters)
+        total = coll.count_documents(base)
+        for depth in args.depths:
+            if depth >= total:
+                continue
+            offset_ms = timed(lambda: list(coll.find(base).sort("_id", DESCENDING).skip(depth).limit(PAGE)),
+                              args.repeat)
+            # the cursor a client would hold after paging down to `depth` (not timed)
+            cursor = None
+            if depth:
+                prev = coll.find(base, {"_id": 1}).sort("_id", DESCENDING).skip(depth - 1).limit(1)
+                cursor = str(next(iter(prev))["_id"])
+            keyset = job_store.list_filter(cursor=cursor, **filters)
+            keyset_ms = timed(lambda: list(coll.find(keyset).sort("_id", DESCENDING).limit(PAGE + 1)), args.repeat)
+            rows.append({"filter": name, "matching": total, "depth": depth,
+                         "offset_ms": offset_ms, "keyset_ms": keyset_ms})
+
+    page_full = list(coll.find({}).sort("_id", DESCENDING).limit(PAGE))
+    page_lean = list(coll.find({}, job_store.list_projection(LIST_VIEW_FIELDS)).sort("_id", DESCENDING).limit(PAGE))
+    size = lambda docs: sum(len(bson.encode(d)) for d in docs)
+    report("jobs list paging", rows, args.out)
+    print(f"\nbytes per {PAGE}-job page: full documents {size(page_full):,} "
+          f"vs fields={','.join(LIST_VIEW_FIELDS)} {size(page_lean):,}")
+
+
+if __name__ == "__main__":
+    main()
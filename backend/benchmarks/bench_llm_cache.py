@@ -0,0 +1,90 @@
+# backend/benchmarks/bench_llm_cache.py
+"""
+Latency of /roadmap/skill-style calls with the LLM response cache: skill
+names are drawn from a Zipf-like distribution (a few popular skills asked
+for constantly) and answered by the local stub LLM with a fixed latency.
+Reports per-pass latency, upstream calls made and the cache counters.
+
+Needs a local mongod for the Mongo tier (uses a throwaway database):
+    MONGO_URI=mongodb://localhost:27017 python -m benchmarks.bench_llm_cache --requests 500
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+
+from benchmarks.common import report, summarize
+from benchmarks.stub_llm import StubLLM
+from benchmarks.synthetic import SKILL_POOL
+
+
+def zipf_skills(rng: random.Random, n: int, vocab, s: float = 1.1):
+    weights = [1 / (rank ** s) for rank in range(1, len(vocab) + 1)]
+    return rng.choices(vocab, weights=weights, k=n)
+
+
+async def run_pass(agent, skills, concurrency):
+    sem = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(skill):
+        async with sem:
+            start = time.perf_counter()
+            await agent.generate_skill_roadmap_agent(skill)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(s) for s in skills))
+    return time.perf_counter() - start, latencies
+
+
+async def bench(args, stub):
+    from app.services import db, llm_cache, roadmap_agent
+
+    await db.db[llm_cache.COLLECTION].drop()
+    await llm_cache.ensure_indexes()
+    rng = random.Random(args.seed)
+    skills = zipf_skills(rng, args.requests, SKILL_POOL)
+
+    rows = []
+    for name in ("cold", "warm (memory tier)", "warm (mongo tier)"):
+        if name == "warm (mongo tier)":
+            llm_cache._memory.clear()
+        calls_before = stub.calls
+        elapsed, latencies = await run_pass(roadmap_agent, skills, args.concurrency)
+        rows.append({
+            "pass": name,
+            "requests": len(skills),
+            "distinct": len(set(skills)),
+            "upstream_calls": stub.calls - calls_before,
+            "wall_s": round(elapsed, 2),
+            **summarize(latencies),
+        })
+    await db.db[llm_cache.COLLECTION].drop()
+    return rows, llm_cache.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=1.0, help="stub LLM seconds per completion")
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--out")
+    args = parser.parse_args()
+
+    stub = StubLLM(latency=args.latency)
+    os.environ["LLM_BASE_URL"] = stub.start()
+    os.environ.setdefault("LLM_API_KEY", "stub")
+    os.environ.setdefault("MONGO_DB", "career_mentor_bench")
+    try:
+        rows, stats = asyncio.run(bench(args, stub))
+    finally:
+        stub.stop()
+    report("llm response cache", rows, args.out)
+    print("cache stats:", stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# backend/benchmarks/bench_match_many.py
+"""
+Scoring one resume against many jobs: compute_match per job (string sets
+rebuilt on every call) vs compute_match_many / match_percents on stored
+skill ids (one vectorized pass). Fails unless every result matches.
+
+Run from backend/:
+    python -m benchmarks.bench_match_many --jobs 1000 10000 100000
+"""
+import argparse
+import sys
+import time
+
+from app.services.matcher import compute_match, compute_match_many, match_percents
+from app.services.skill_taxonomy import load_taxonomy
+from app.services.skill_vocab import SkillVocab
+from benchmarks.bench_top_k import synthetic_skill_sets
+from benchmarks.common import report, summarize
+
+
+def timed(fn, repeats: int):
+    times, result = [], None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return summarize(times)["p50_ms"], result
+
+
+def same(expected, got) -> bool:
+    return (expected["match_percent"] == got["match_percent"]
+            and sorted(expected["matched_skills"]) == sorted(got["matched_skills"])
+            and sorted(expected["skill_gap"]) == sorted(got["skill_gap"]))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--jobs", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    ap.add_argument("--resumes", type=int, default=5)
+    ap.add_argument("--repeats", type=int, default=3)
+    ap.add_argument("--out", help="write results as JSON")
+    args = ap.parse_args()
+
+    skills = list(load_taxonomy().skills)
+    vocab = SkillVocab()
+    vocab.add_many((skill, i) for i, skill in enumerate(skills))
+    resumes = list(synthetic_skill_sets(args.resumes, skills, seed=1))
+
+    rows, mismatches = [], 0
+    for n in args.jobs:
+        jobs = list(synthetic_skill_sets(n, skills))
+        # what the write paths store next to the strings
+        jobs_ids = [vocab.ids(job) for job in jobs]
+        row = {"jobs": n, "sets_ms": 0.0, "ids_ms": 0.0, "percents_ms": 0.0}
+        for resume in resumes:
+            resume_ids = vocab.ids(resume)
+            sets_ms, expected = timed(lambda: [compute_match(resume, job) for job in jobs], args.repeats)
+            ids_ms, got = timed(lambda: compute_match_many(resume_ids, jobs_ids, vocab), args.repeats)
+            percents_ms, percents = timed(lambda: match_percents(resume_ids, jobs_ids), args.repeats)
+            mismatches += sum(not same(e, g) for e, g in zip(expected, got))
+            mismatches += sum(e["match_percent"] != round(float(p), 2) for e, p in zip(expected, percents))
+            row["sets_ms"] += sets_ms / len(resumes)
+            row["ids_ms"] += ids_ms / len(resumes)
+            row["percents_ms"] += percents_ms / len(resumes)
+        row = {k: round(v, 2) if isinstance(v, float) else v for k, v in row.items()}
+        row["speedup_full"] = round(row["sets_ms"] / row["ids_ms"], 1) if row["ids_ms"] else None
+        row["speedup_scores"] = round(row["sets_ms"] / row["percents_ms"], 1) if row["percents_ms"] else None
+        rows.append(row)
+
+    report("one resume vs N jobs (p50 per resume)", rows, args.out)
+    if mismatches:
+        print(f"FAIL: {mismatches} results differ from compute_match")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
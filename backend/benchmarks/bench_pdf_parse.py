@@ -0,0 +1,114 @@
+# backend/benchmarks/bench_pdf_parse.py
+"""
+Resume parsing throughput on a synthetic corpus:
+
+    layout          pdfminer layout analysis (PDF_TEXT_MODE=layout, the old path)
+    plain           layout-free text device (PDF_TEXT_MODE=plain)
+    plain_parallel  plain, page ranges spread over the process pool (long PDFs only)
+    plain_budget    plain, stopping once --budget characters are read
+
+reported as pages/sec per document length, plus docx2txt vs the streamed
+DOCX reader in docs/sec. Fails unless plain finds the same taxonomy skills
+as layout and the DOCX reader returns exactly docx2txt's text.
+
+Run from backend/:
+    python -m benchmarks.bench_pdf_parse --docs 10 --pages 2 10 40
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+from app.services import executor, parser
+from app.services.extraction_cache import parse_file
+from app.services.skill_taxonomy import taxonomy
+from benchmarks.common import report
+from benchmarks.synthetic import make_resume_docx, make_resume_pdf
+
+
+def write(directory: str, name: str, data: bytes) -> str:
+    path = os.path.join(directory, name)
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+def run(paths, extract):
+    start = time.perf_counter()
+    texts = [extract(p) for p in paths]
+    return time.perf_counter() - start, texts
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--docs", type=int, default=10, help="documents per length")
+    ap.add_argument("--pages", type=int, nargs="+", default=[2, 10, 40])
+    ap.add_argument("--budget", type=int, default=4000, help="characters for plain_budget")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--out", help="write results as JSON")
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    workdir = tempfile.mkdtemp(prefix="bench-parse-")
+    rows, mismatches = [], 0
+    loop = asyncio.new_event_loop()
+    # spawned workers read the mode from their environment
+    os.environ["PDF_TEXT_MODE"] = "plain"
+    # start the pool's processes before timing anything
+    loop.run_until_complete(executor.run_in_process(len, ""))
+
+    for pages in args.pages:
+        paths = [write(workdir, f"cv-{pages}-{i}.pdf", make_resume_pdf(rng, pages=pages, tag=str(i)))
+                 for i in range(args.docs)]
+        total = pages * len(paths)
+        row = {"pages": pages}
+
+        parser.PDF_TEXT_MODE = "layout"
+        wall, layout_texts = run(paths, parser.extract_text_from_file)
+        row["layout_pages_s"] = round(total / wall, 1)
+
+        parser.PDF_TEXT_MODE = "plain"
+        wall, plain_texts = run(paths, parser.extract_text_from_file)
+        row["plain_pages_s"] = round(total / wall, 1)
+        mismatches += sum(set(taxonomy.find(a)) != set(taxonomy.find(b)) for a, b in zip(layout_texts, plain_texts))
+
+        ranges = parser.pdf_page_ranges(paths[0]) if executor.PROCESS_WORKERS > 1 else []
+        wall, parallel_texts = run(paths, lambda p: loop.run_until_complete(parse_file(p)))
+        row["parallel_pages_s"] = round(total / wall, 1) if ranges else None
+        mismatches += sum(a != b for a, b in zip(plain_texts, parallel_texts))
+
+        parser.PDF_TEXT_BUDGET = args.budget
+        wall, budget_texts = run(paths, parser.extract_text_from_file)
+        parser.PDF_TEXT_BUDGET = 0
+        row["budget_docs_s"] = round(len(paths) / wall, 1)
+        row["budget_pages_read"] = round(sum(t.count(parser.PAGE_BREAK) for t in budget_texts) / len(paths), 1)
+        row["speedup"] = round(row["plain_pages_s"] / row["layout_pages_s"], 1)
+        rows.append(row)
+
+    report("PDF text extraction", rows, args.out)
+
+    import docx2txt
+    docx_paths = [write(workdir, f"cv-{i}.docx", make_resume_docx(rng, tag=str(i), paragraphs=200))
+                  for i in range(args.docs)]
+    old_s, old = run(docx_paths, docx2txt.process)
+    new_s, new = run(docx_paths, parser.extract_docx_text)
+    docx_mismatches = sum(a != b for a, b in zip(old, new))
+    report("DOCX text extraction", [{
+        "docs": len(docx_paths),
+        "docx2txt_docs_s": round(len(docx_paths) / old_s, 1),
+        "streamed_docs_s": round(len(docx_paths) / new_s, 1),
+        "identical": not docx_mismatches,
+    }])
+
+    executor.shutdown()
+    loop.close()
+    if mismatches or docx_mismatches:
+        print(f"FAIL: {mismatches} PDF and {docx_mismatches} DOCX outputs differ")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
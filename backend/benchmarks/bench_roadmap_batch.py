@@ -0,0 +1,113 @@
+# backend/benchmarks/bench_roadmap_batch.py
+"""
+Roadmaps for N skills at once against the stub LLM, the API served
+in-process (httpx ASGI transport):
+
+    sequential   N POST /roadmap/skill calls one after another (what the UI did)
+    batch        one POST /roadmap/skills with the same N uncached skills
+    batch_warm   the same batch again, every skill answered from the cache
+    batch_tight  a fresh batch with stub latency jitter of up to one more call
+                 and SKILL_BATCH_TIMEOUT at 1.5 calls, showing partial
+                 ("timeout") answers
+
+reported as wall time, upstream LLM calls and per-status counts. Fails
+unless batch makes one upstream call per skill and batch_warm none.
+
+Run from backend/:
+    python -m benchmarks.bench_roadmap_batch --skills 5 10 20 --latency 0.5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import Counter
+
+from benchmarks.common import report
+from benchmarks.stub_llm import StubLLM
+
+
+async def bench(args, stub):
+    import httpx
+
+    from app.main import app
+    from app.services import db, roadmap_agent
+
+    await db.get_client().drop_database(db.MONGO_DB)
+    rows, failures = [], 0
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+
+            async def sequential(skills):
+                for skill in skills:
+                    r = await client.post("/roadmap/skill", json={"skill": skill})
+                    r.raise_for_status()
+                return Counter(generated=len(skills))
+
+            async def batch(skills):
+                r = await client.post("/roadmap/skills", json={"skills": skills})
+                r.raise_for_status()
+                return Counter(r.json()["counts"])
+
+            async def measure(name, n, call, skills):
+                calls = stub.calls
+                start = time.perf_counter()
+                counts = await call(skills)
+                row = {"skills": n, "mode": name, "wall_ms": round((time.perf_counter() - start) * 1000, 1),
+                       "llm_calls": stub.calls - calls}
+                row.update({s: counts.get(s, 0) for s in ("cached", "generated", "timeout", "failed")})
+                rows.append(row)
+                return row
+
+            for n in args.skills:
+                tag = time.time_ns()
+                await measure("sequential", n, sequential, [f"seq skill {n} {i} {tag}" for i in range(n)])
+                skills = [f"batch skill {n} {i} {tag}" for i in range(n)]
+                cold = await measure("batch", n, batch, skills)
+                warm = await measure("batch_warm", n, batch, skills)
+                failures += cold["llm_calls"] != n or warm["llm_calls"] != 0
+
+                timeout = roadmap_agent.SKILL_BATCH_TIMEOUT
+                roadmap_agent.SKILL_BATCH_TIMEOUT, stub.jitter = args.latency * 1.5, args.latency
+                try:
+                    await measure("batch_tight", n, batch, [f"tight skill {n} {i} {tag}" for i in range(n)])
+                finally:
+                    roadmap_agent.SKILL_BATCH_TIMEOUT, stub.jitter = timeout, 0.0
+                # let the timed-out generations land before the next round is measured
+                await asyncio.sleep(args.latency * 2)
+    return rows, failures
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--skills", type=int, nargs="+", default=[5, 10, 20])
+    ap.add_argument("--latency", type=float, default=0.5, help="stub LLM seconds per completion")
+    ap.add_argument("--mongo", default="mock", help="'mock' (mongomock-motor) or a MongoDB URI")
+    ap.add_argument("--out", help="write results as JSON")
+    args = ap.parse_args()
+
+    stub = StubLLM(latency=args.latency)
+    # the app reads its configuration at import time, so this has to come first
+    os.environ.update({"LLM_BASE_URL": stub.start(), "LLM_API_KEY": "stub"})
+    os.environ.setdefault("MONGO_DB", "career_mentor_bench_roadmap_batch")
+    if args.mongo != "mock":
+        os.environ["MONGO_URI"] = args.mongo
+
+    from app.services import db
+    if args.mongo == "mock":
+        from mongomock_motor import AsyncMongoMockClient
+        db._client = AsyncMongoMockClient()
+
+    try:
+        rows, failures = asyncio.run(bench(args, stub))
+    finally:
+        stub.stop()
+    report("roadmaps for N skills", rows, args.out)
+    if failures:
+        print(f"FAIL: {failures} batches made unexpected upstream calls")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
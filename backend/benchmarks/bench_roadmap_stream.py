@@ -0,0 +1,111 @@
+# backend/benchmarks/bench_roadmap_stream.py
+"""
+Time to first byte of the skill roadmap: blocking POST /roadmap/skill vs the
+SSE POST /roadmap/skill/stream, with the API served by uvicorn in-process and
+the model answered by the local stub LLM (so numbers reflect our overhead
+plus the stub's configured latency, not a real model).
+
+Every request uses a distinct skill so the response cache never answers.
+Needs a local mongod for the cache tier (uses a throwaway database):
+    MONGO_URI=mongodb://localhost:27017 python -m benchmarks.bench_roadmap_stream --requests 20
+"""
+import argparse
+import asyncio
+import os
+import socket
+import threading
+import time
+
+import httpx
+
+from benchmarks.common import report, summarize
+from benchmarks.stub_llm import StubLLM
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_api(port: int):
+    import uvicorn
+    from app.main import app
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, thread
+
+
+async def blocking_call(client, skill):
+    start = time.perf_counter()
+    r = await client.post("/roadmap/skill", json={"skill": skill})
+    r.raise_for_status()
+    total = time.perf_counter() - start
+    return {"ttfb": total, "first_section": total, "total": total}
+
+
+async def streaming_call(client, skill):
+    start = time.perf_counter()
+    ttfb = first_section = None
+    async with client.stream("POST", "/roadmap/skill/stream", json={"skill": skill}) as r:
+        r.raise_for_status()
+        async for chunk in r.aiter_text():
+            now = time.perf_counter() - start
+            if ttfb is None:
+                ttfb = now
+            if first_section is None and "event: section" in chunk:
+                first_section = now
+    return {"ttfb": ttfb, "first_section": first_section, "total": time.perf_counter() - start}
+
+
+async def bench(base_url: str, requests: int, concurrency: int):
+    rows = []
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        for name, call in (("blocking /roadmap/skill", blocking_call),
+                           ("SSE /roadmap/skill/stream", streaming_call)):
+            sem = asyncio.Semaphore(concurrency)
+            samples = []
+
+            async def one(i):
+                async with sem:
+                    samples.append(await call(client, f"bench skill {name[:3]} {i} {time.time_ns()}"))
+
+            await asyncio.gather(*(one(i) for i in range(requests)))
+            for metric in ("ttfb", "first_section", "total"):
+                stats = summarize([s[metric] for s in samples if s[metric] is not None])
+                rows.append({"endpoint": name, "metric": metric,
+                             **{k: stats[k] for k in ("count", "p50_ms", "p95_ms", "max_ms")}})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=3.0, help="stub LLM seconds for a full completion")
+    parser.add_argument("--first-token", type=float, default=0.2, help="stub LLM seconds to the first chunk")
+    parser.add_argument("--out")
+    args = parser.parse_args()
+
+    stub = StubLLM(latency=args.latency, first_token=args.first_token)
+    os.environ["LLM_BASE_URL"] = stub.start()
+    os.environ.setdefault("LLM_API_KEY", "stub")
+    os.environ.setdefault("MONGO_DB", "career_mentor_bench")
+
+    port = free_port()
+    server, thread = start_api(port)
+    try:
+        rows = asyncio.run(bench(f"http://127.0.0.1:{port}", args.requests, args.concurrency))
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+        stub.stop()
+    report("roadmap time to first byte", rows, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# backend/benchmarks/bench_semantic_match.py
+"""
+CPU latency of semantic skill matching: one batched matrix product vs a
+pairwise Python loop over the same cached embeddings, plus the one-off
+cost of loading the model and encoding unseen skills.
+
+Needs sentence-transformers. Run from backend/:
+    python -m benchmarks.bench_semantic_match --pairs 200
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+from app.services.semantic_matcher import SEMANTIC_MODEL, SkillEmbeddings, compute_semantic_match
+from app.services.skill_taxonomy import load_taxonomy
+from benchmarks.common import report, summarize
+
+
+def pairwise_loop(embeddings, resume, job, threshold):
+    """The per-pair Python loop the matrix product replaces."""
+    r_vecs = {s: embeddings.vectors([s])[0] for s in resume}
+    j_vecs = {s: embeddings.vectors([s])[0] for s in job}
+    matched = []
+    for js, jv in j_vecs.items():
+        if max(float(np.dot(jv, rv)) for rv in r_vecs.values()) >= threshold:
+            matched.append(js)
+    return matched
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--pairs", type=int, default=200)
+    ap.add_argument("--model", default=SEMANTIC_MODEL)
+    ap.add_argument("--threshold", type=float, default=0.75)
+    ap.add_argument("--out", help="write results as JSON")
+    args = ap.parse_args()
+
+    os.environ.setdefault("CUDA_VISIBLE_DEVICES", "")  # CPU-only numbers
+    vocab = list(load_taxonomy().skills)
+    rng = random.Random(0)
+    cache_path = os.path.join(tempfile.mkdtemp(), "skill_embeddings.npz")
+    embeddings = SkillEmbeddings(path=cache_path, model_name=args.model)
+
+    rows = []
+    start = time.perf_counter()
+    embeddings._get_encoder()
+    rows.append({"stage": "model load", "ms": round((time.perf_counter() - start) * 1000, 1)})
+
+    start = time.perf_counter()
+    embeddings.vectors(vocab)
+    rows.append({"stage": f"encode {len(vocab)} skills (cold)",
+                 "ms": round((time.perf_counter() - start) * 1000, 1)})
+
+    start = time.perf_counter()
+    embeddings.flush()
+    rows.append({"stage": "persist matrix (background flush)", "ms": round((time.perf_counter() - start) * 1000, 1)})
+
+    start = time.perf_counter()
+    SkillEmbeddings(path=cache_path, model_name=args.model).vectors(vocab)
+    rows.append({"stage": "reload matrix from disk", "ms": round((time.perf_counter() - start) * 1000, 1)})
+
+    for resume_n, job_n in ((15, 10), (50, 50)):
+        pairs = [(rng.sample(vocab, resume_n), rng.sample(vocab, job_n)) for _ in range(args.pairs)]
+        matrix_times, loop_times = [], []
+        for resume, job in pairs:
+            start = time.perf_counter()
+            compute_semantic_match(resume, job, args.threshold, embeddings)
+            matrix_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            pairwise_loop(embeddings, resume, job, args.threshold)
+            loop_times.append(time.perf_counter() - start)
+        rows.append({"stage": f"match {resume_n}x{job_n} matrix product (warm)",
+                     "ms": summarize(matrix_times)["p50_ms"]})
+        rows.append({"stage": f"match {resume_n}x{job_n} pairwise loop (warm)",
+                     "ms": summarize(loop_times)["p50_ms"]})
+
+    report(f"semantic matching on CPU ({args.model})", rows, args.out)
+
+
+if __name__ == "__main__":
+    main()
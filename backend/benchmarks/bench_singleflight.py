@@ -0,0 +1,125 @@
+# backend/benchmarks/bench_singleflight.py
+"""
+Fires --concurrency identical requests at once (same skill roadmap, same job
+roadmap, same resume/job match) on a cold cache and no stored matches, with and without request
+coalescing, and counts the upstream work: completions served by the stub
+LLM, and match computations. Exits non-zero unless every coalesced burst
+made exactly one upstream call.
+
+Needs a local mongod for the response cache and the match documents (uses a
+throwaway database):
+    MONGO_URI=mongodb://localhost:27017 python -m benchmarks.bench_singleflight --concurrency 100
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from benchmarks.common import report, summarize
+from benchmarks.stub_llm import StubLLM
+
+
+class NoCoalescing:
+    """Stand-in for SingleFlight that runs every call (the baseline)."""
+
+    async def do(self, key, fn):
+        return await fn()
+
+
+async def burst(n: int, fn):
+    latencies = []
+
+    async def one():
+        start = time.perf_counter()
+        await fn()
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(n)))
+    return time.perf_counter() - start, latencies
+
+
+async def bench(args, stub):
+    from app.services import db, llm_cache, match_store, matcher, roadmap_agent
+    from app.services.singleflight import SingleFlight
+
+    await db.db[llm_cache.COLLECTION].drop()
+    resume_id = (await db.db.resumes.insert_one({"skills": ["python", "sql", "git"]})).inserted_id
+    job_id = (await db.db.jobs.insert_one({"title": "Data Engineer", "skills": ["python", "spark", "sql"]})).inserted_id
+
+    scored = 0
+    score_skills = matcher.score_skills
+
+    def counting_score_skills(*a, **kw):
+        nonlocal scored
+        scored += 1
+        return score_skills(*a, **kw)
+
+    matcher.score_skills = counting_score_skills
+    upstream = {
+        "skill roadmap": lambda: stub.calls,
+        "ai roadmap": lambda: stub.calls,
+        "match": lambda: scored,
+    }
+    calls = {
+        "skill roadmap": lambda: roadmap_agent.generate_skill_roadmap_agent("Python"),
+        "ai roadmap": lambda: roadmap_agent.generate_ai_roadmap("Data Engineer", ["python", "sql"], ["spark"]),
+        "match": lambda: match_store.get_match(str(resume_id), str(job_id)),
+    }
+
+    rows = []
+    try:
+        for coalesced in (False, True):
+            for name, call in calls.items():
+                # cold cache every time so each burst really has to go upstream
+                llm_cache._memory.clear()
+                await db.db[llm_cache.COLLECTION].drop()
+                await db.db[match_store.COLLECTION].drop()
+                flights = SingleFlight() if coalesced else NoCoalescing()
+                roadmap_agent._flights = match_store._flights = flights
+                before = upstream[name]()
+                elapsed, latencies = await burst(args.concurrency, call)
+                rows.append({
+                    "call": name,
+                    "coalescing": coalesced,
+                    "requests": args.concurrency,
+                    "upstream_calls": upstream[name]() - before,
+                    "wall_ms": round(elapsed * 1000, 1),
+                    **summarize(latencies),
+                })
+    finally:
+        matcher.score_skills = score_skills
+        await db.db[llm_cache.COLLECTION].drop()
+        await db.db[match_store.COLLECTION].drop()
+        await db.db.resumes.delete_one({"_id": resume_id})
+        await db.db.jobs.delete_one({"_id": job_id})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.5, help="stub LLM seconds per completion")
+    parser.add_argument("--out")
+    args = parser.parse_args()
+
+    stub = StubLLM(latency=args.latency)
+    os.environ["LLM_BASE_URL"] = stub.start()
+    os.environ.setdefault("LLM_API_KEY", "stub")
+    os.environ.setdefault("MONGO_DB", "career_mentor_bench")
+    try:
+        rows = asyncio.run(bench(args, stub))
+    finally:
+        stub.stop()
+    report("request coalescing", rows, args.out)
+
+    failed = [r["call"] for r in rows if r["coalescing"] and r["upstream_calls"] != 1]
+    if failed:
+        print(f"FAIL: more than one upstream call per coalesced burst for: {', '.join(failed)}")
+        sys.exit(1)
+    print(f"OK: every coalesced burst of {args.concurrency} made one upstream call")
+
+
+if __name__ == "__main__":
+    main()
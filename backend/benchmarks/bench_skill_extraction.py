@@ -0,0 +1,43 @@
+# backend/benchmarks/bench_skill_extraction.py
+"""
+Throughput of skill extraction: per-document nlp() vs batched nlp.pipe.
+
+Run from backend/:
+    python -m benchmarks.bench_skill_extraction --docs 200 --processes 4
+"""
+import argparse
+import os
+
+from app.services.job_parser import job_text
+from app.services.skill_extractor import extract_skills_from_text, extract_skills_batch
+from benchmarks.common import report, time_call
+from benchmarks.synthetic import make_jobs
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--docs", type=int, default=200)
+    ap.add_argument("--processes", type=int, default=min(4, os.cpu_count() or 1))
+    ap.add_argument("--out", help="write results as JSON")
+    args = ap.parse_args()
+
+    texts = [job_text(j) for j in make_jobs(args.docs)]
+    extract_skills_from_text(texts[0])  # warm the model
+
+    rows = []
+    elapsed, _ = time_call(lambda: [extract_skills_from_text(t) for t in texts])
+    rows.append({"mode": "serial nlp()", "batch_size": 1, "n_process": 1,
+                 "docs_per_sec": round(len(texts) / elapsed, 1)})
+
+    for n_process in sorted({1, args.processes}):
+        for batch_size in (1, 16, 64):
+            elapsed, _ = time_call(extract_skills_batch, texts,
+                                   batch_size=batch_size, n_process=n_process)
+            rows.append({"mode": "nlp.pipe", "batch_size": batch_size, "n_process": n_process,
+                         "docs_per_sec": round(len(texts) / elapsed, 1)})
+
+    report("skill extraction throughput", rows, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# backend/benchmarks/bench_skill_matching.py
+"""
+Gazetteer skill matching: per-keyword substring loop vs the compiled taxonomy trie.
+
+Run from backend/:
+    python -m benchmarks.bench_skill_matching --docs 200
+"""
+import argparse
+
+from app.services.job_parser import job_text
+from app.services.skill_taxonomy import build_taxonomy, load_taxonomy
+from benchmarks.common import report, time_call
+from benchmarks.synthetic import make_jobs
+
+
+def keyword_list(size: int):
+    """`size` taxonomy entries: the real skills first, padded with synthetic multi-word ones."""
+    real = list(load_taxonomy().skills)
+    keywords = real[:size]
+    i = 0
+    while len(keywords) < size:
+        keywords.append(f"tool{i} framework" if i % 2 else f"skill{i}")
+        i += 1
+    return keywords
+
+
+def substring_loop(keywords, text):
+    text = text.lower()
+    return list(set(skill for skill in keywords if skill in text))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--docs", type=int, default=200)
+    ap.add_argument("--out", help="write results as JSON")
+    args = ap.parse_args()
+
+    texts = [job_text(j) for j in make_jobs(args.docs)]
+    rows = []
+    for size in (50, 5_000, 50_000):
+        keywords = keyword_list(size)
+        build_s, taxonomy = time_call(build_taxonomy, ([k] for k in keywords))
+        loop_s, _ = time_call(lambda: [substring_loop(keywords, t) for t in texts])
+        trie_s, _ = time_call(lambda: [taxonomy.find(t) for t in texts])
+        rows.append({
+            "entries": size,
+            "build_ms": round(build_s * 1000, 1),
+            "loop_ms_per_doc": round(loop_s / len(texts) * 1000, 3),
+            "trie_ms_per_doc": round(trie_s / len(texts) * 1000, 3),
+            "speedup": round(loop_s / trie_s, 1) if trie_s else None,
+        })
+
+    report("skill gazetteer matching", rows, args.out)
+
+
+if __name__ == "__main__":
+    main()
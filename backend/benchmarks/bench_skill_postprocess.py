@@ -0,0 +1,163 @@
+# backend/benchmarks/bench_skill_postprocess.py
+"""
+Micro-benchmark of the non-spaCy part of skill extraction (section finding,
+candidate cleanup, canonicalization and dedupe) on long CVs and verbose job
+descriptions, comparing the current extractor with the previous list-based
+implementation kept below as the reference.
+
+The corpus (synthetic resumes and jobs at several lengths plus edge cases:
+header priority, "technical skills", non-ASCII text, the comma-line
+fallback) is parsed with spaCy once; both implementations then run on the
+same docs and their outputs must be identical, element for element and in
+order. Exits non-zero on any difference. The expected output itself is
+pinned by tests/data/skill_postprocess_golden.json (tests/test_skill_postprocess.py),
+which needs no spaCy model.
+
+    python -m benchmarks.bench_skill_postprocess --docs 100 --scale 1 5 20
+"""
+import argparse
+import random
+import re
+import sys
+from typing import List, Set, Tuple
+
+from app.services import skill_extractor
+from app.services.job_parser import job_text
+from app.services.skill_taxonomy import taxonomy
+from benchmarks.common import report, time_call
+from benchmarks.synthetic import make_job, make_resume_text
+
+EDGE_CASES = [
+    "Experienced engineer.\nExpertise: Kafka, Spark\nTechnical Skills: Python, Docker (3 years), SQL 90%",
+    "CORE COMPETENCIES\n• Leadership • Kubernetes • Terraform\nSkills\nGo, Rust",
+    "Profile: İstanbul based developer. Skills: Python, Django, PostgreSQL, İleri düzey Excel",
+    "No header here.\nPython, Java, C#, Node.js\nAWS, GCP\nmore text",
+    "ſkills: not a header\nexpertise in machine learning, deep learning, nlp",
+    "",
+]
+
+
+# --- previous implementation (reference) ---------------------------------
+
+def legacy_find_skills_section(text: str) -> Tuple[int, int, str]:
+    lowered = text.lower()
+    for header in skill_extractor.SKILLS_SECTION_HEADERS:
+        m = re.search(header, lowered)
+        if m:
+            start = m.start()
+            end = start + 600
+            return start, end, text[start:end]
+    lines = text.splitlines()
+    for i, line in enumerate(lines):
+        if len(line.split(',')) >= 3 and len(line) < 200:
+            section_text = "\n".join(lines[i:i+3])
+            start = sum(len(l)+1 for l in lines[:i])
+            return start, start + len(section_text), section_text
+    return 0, 0, ""
+
+
+def legacy_candidates(section_text: str) -> List[str]:
+    cleaned = []
+    for it in skill_extractor.SPLIT_PATTERN.split(section_text):
+        it = it.strip()
+        if not it:
+            continue
+        it = re.sub(r"\(.*?\)", "", it)
+        it = re.sub(r"\d{1,3}%", "", it)
+        it = it.strip()
+        if len(it) >= 2 and len(it) < 60:
+            cleaned.append(it)
+    return cleaned
+
+
+def legacy_skills_from_doc(text: str, doc, top_k_named_entities: int = 50) -> List[str]:
+    skills: Set[str] = set()
+    _, _, section_text = legacy_find_skills_section(text)
+    if section_text:
+        for c in legacy_candidates(section_text):
+            skills.add(c.lower())
+    for ent in doc.ents[:top_k_named_entities]:
+        if ent.label_ in ("ORG", "PRODUCT", "WORK_OF_ART", "LANGUAGE", "NORP", "TECHNOLOGY"):
+            skills.add(ent.text.lower())
+    for chunk in doc.noun_chunks:
+        phrase = chunk.text.lower().strip()
+        if 1 <= len(phrase.split()) <= 4 and re.search(r"[a-zA-Z0-9\+\#\.\-]", phrase):
+            if len(phrase) > 1 and len(phrase) < 60:
+                skills.add(phrase)
+    skills.update(taxonomy.find(text))
+    processed = []
+    for s in skills:
+        s_norm = s.strip().lower()
+        s_norm = re.sub(r"[^\w\s\+\#\.]", " ", s_norm)
+        s_norm = re.sub(r"\s+", " ", s_norm).strip()
+        mapped = taxonomy.canonicalize(s_norm)
+        if len(mapped) <= 2 and not taxonomy.is_skill(mapped):
+            continue
+        if len(mapped) > 60:
+            continue
+        processed.append(mapped)
+    final = []
+    for p in processed:
+        if p not in final:
+            final.append(p)
+    return final
+
+
+# --------------------------------------------------------------------------
+
+def corpus(n: int, scale: int, seed: int) -> List[str]:
+    """n/2 resumes and n/2 job descriptions, each repeated `scale` times to make them long."""
+    rng = random.Random(seed)
+    texts = []
+    for i in range(n):
+        base = make_resume_text(rng) if i % 2 == 0 else job_text(make_job(rng))
+        texts.append("\n".join([base] * scale))
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=100)
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 5, 20], help="text length multipliers")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=17)
+    parser.add_argument("--out")
+    args = parser.parse_args()
+
+    nlp = skill_extractor.get_nlp()
+    rows, mismatches = [], 0
+    for scale in args.scale:
+        texts = corpus(args.docs, scale, args.seed) + EDGE_CASES
+        docs = list(nlp.pipe(texts))
+        pairs = list(zip(texts, docs))
+
+        for text, doc in pairs:
+            if skill_extractor.find_skills_section(text) != legacy_find_skills_section(text):
+                mismatches += 1
+                print("section mismatch:", repr(text[:80]))
+            if skill_extractor.skills_from_doc(text, doc) != legacy_skills_from_doc(text, doc):
+                mismatches += 1
+                print("skills mismatch:", repr(text[:80]))
+
+        timings = {}
+        for name, fn in (("previous", legacy_skills_from_doc), ("current", skill_extractor.skills_from_doc)):
+            timings[name] = min(time_call(lambda: [fn(t, d) for t, d in pairs])[0] for _ in range(args.repeat))
+        rows.append({
+            "scale": scale,
+            "docs": len(pairs),
+            "avg_chars": sum(map(len, texts)) // len(texts),
+            "avg_noun_chunks": sum(len(list(d.noun_chunks)) for d in docs) // len(docs),
+            "previous_ms": round(timings["previous"] * 1000, 2),
+            "current_ms": round(timings["current"] * 1000, 2),
+            "speedup": round(timings["previous"] / timings["current"], 2),
+        })
+
+    report("skill post-processing", rows, args.out)
+    if mismatches:
+        print(f"FAIL: {mismatches} outputs differ from the previous implementation")
+        sys.exit(1)
+    print("OK: output identical to the previous implementation on every document")
+
+
+if __name__ == "__main__":
+    main()
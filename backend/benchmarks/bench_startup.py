@@ -0,0 +1,107 @@
+# backend/benchmarks/bench_startup.py
+"""
+Cold-start cost of the API: `import app.main` time in fresh interpreters,
+then, for a uvicorn process started with WARMUP_ON_STARTUP off and on, the
+time from process start until /health/live and /health/ready answer 200 and
+the latency of the first and second model-bound request (skill extraction
+for two seeded resumes, so the second isn't an extraction-cache hit).
+
+Needs a local mongod and the spaCy model (uses a throwaway database):
+    MONGO_URI=mongodb://localhost:27017 python -m benchmarks.bench_startup --imports 5
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+from pymongo import MongoClient
+
+from benchmarks.common import report
+from benchmarks.synthetic import make_resume_texts
+
+IMPORT_SNIPPET = "import time; t = time.perf_counter(); import app.main; print(time.perf_counter() - t)"
+
+
+def import_seconds(env: dict, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", IMPORT_SNIPPET], env=env, check=True,
+                             capture_output=True, text=True).stdout
+        samples.append(float(out.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for(client: httpx.Client, path: str, start: float, timeout: float):
+    """Seconds since `start` until GET path returns 200, or None on timeout."""
+    while time.perf_counter() - start < timeout:
+        try:
+            if client.get(path).status_code == 200:
+                return time.perf_counter() - start
+        except httpx.TransportError:
+            pass
+        time.sleep(0.01)
+    return None
+
+
+def ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def run_server(env: dict, resume_ids, timeout: float) -> dict:
+    port = free_port()
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=timeout) as client:
+            live = wait_for(client, "/health/live", start, timeout)
+            ready = wait_for(client, "/health/ready", start, timeout)
+            extract = []
+            for resume_id in resume_ids:
+                t = time.perf_counter()
+                client.post(f"/skills/extract/{resume_id}").raise_for_status()
+                extract.append(time.perf_counter() - t)
+    finally:
+        proc.terminate()
+        proc.wait()
+    return {"live_ms": ms(live), "ready_ms": ms(ready),
+            "first_extract_ms": ms(extract[0]), "second_extract_ms": ms(extract[1])}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--imports", type=int, default=5, help="fresh interpreters to time `import app.main` in")
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--db", default="career_mentor_bench_startup")
+    parser.add_argument("--out")
+    args = parser.parse_args()
+
+    env = {**os.environ, "MONGO_DB": args.db}
+    mongo = MongoClient(os.getenv("MONGO_URI", "mongodb://localhost:27017"))[args.db]
+
+    rows = []
+    import_s = import_seconds(env, args.imports)
+    for warm in (False, True):
+        # fresh resumes and an empty extraction cache so every run does the same work
+        mongo.client.drop_database(args.db)
+        resume_ids = [str(mongo.resumes.insert_one({"text": text}).inserted_id) for text in make_resume_texts(2)]
+        server = run_server({**env, "WARMUP_ON_STARTUP": str(warm).lower()}, resume_ids, args.timeout)
+        rows.append({"warmup": warm, "import_ms": ms(import_s), **server})
+    mongo.client.drop_database(args.db)
+    report("startup", rows, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# backend/benchmarks/bench_top_k.py
+"""
+Top-K job ranking for one resume: inverted skill index vs scoring every job
+with compute_match.
+
+Run from backend/:
+    python -m benchmarks.bench_top_k --jobs 10000 1000000
+"""
+import argparse
+import random
+import time
+
+from app.services.matcher import compute_match
+from app.services.skill_index import SkillIndex
+from app.services.skill_taxonomy import load_taxonomy
+from benchmarks.common import report, summarize
+
+
+def synthetic_skill_sets(n: int, vocab, seed: int = 0):
+    """Skill lists with a skewed (Zipf-like) popularity, like real postings."""
+    rng = random.Random(seed)
+    weights = [1.0 / (rank + 1) for rank in range(len(vocab))]
+    for _ in range(n):
+        yield list(set(rng.choices(vocab, weights=weights, k=rng.randint(5, 15))))
+
+
+def brute_force(resume, jobs, k):
+    scored = [(job_id, compute_match(resume, skills)["match_percent"]) for job_id, skills in jobs]
+    scored.sort(key=lambda item: (-item[1], item[0]))
+    return scored[:k]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--jobs", type=int, nargs="+", default=[10_000, 1_000_000])
+    ap.add_argument("--queries", type=int, default=50)
+    ap.add_argument("--brute-queries", type=int, default=3)
+    ap.add_argument("-k", type=int, default=10)
+    ap.add_argument("--out", help="write results as JSON")
+    args = ap.parse_args()
+
+    vocab = list(load_taxonomy().skills)
+    resumes = list(synthetic_skill_sets(args.queries, vocab, seed=1))
+    rows = []
+    for n in args.jobs:
+        jobs = [(f"{i:024x}", skills) for i, skills in enumerate(synthetic_skill_sets(n, vocab))]
+
+        index = SkillIndex()
+        start = time.perf_counter()
+        index.add_jobs(jobs)
+        build_s = time.perf_counter() - start
+
+        index_times = []
+        for resume in resumes:
+            start = time.perf_counter()
+            index.top_k(resume, args.k)
+            index_times.append(time.perf_counter() - start)
+
+        brute_times = []
+        for resume in resumes[: args.brute_queries]:
+            start = time.perf_counter()
+            expected = brute_force(resume, jobs, args.k)
+            brute_times.append(time.perf_counter() - start)
+            got = index.top_k(resume, args.k)
+            # same jobs in the same order (index returns overlap counts, brute force percents)
+            assert [j for j, _ in got] == [j for j, _ in expected], "index and brute force disagree"
+
+        rows.append({
+            "jobs": n,
+            "build_s": round(build_s, 2),
+            "index_p50_ms": summarize(index_times)["p50_ms"],
+            "index_p99_ms": summarize(index_times)["p99_ms"],
+            "brute_force_p50_ms": summarize(brute_times)["p50_ms"],
+        })
+
+    report(f"top-{args.k} jobs per resume", rows, args.out)
+
+
+if __name__ == "__main__":
+    main()
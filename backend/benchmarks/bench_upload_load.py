@@ -0,0 +1,84 @@
+# backend/benchmarks/bench_upload_load.py
+"""
+Load test: concurrent /resume/upload requests against a running API backed by
+a local mongod, while a probe keeps hitting `/` to show whether the event
+loop stays responsive.
+
+Start the API first, e.g.:
+    MONGO_URI=mongodb://localhost:27017 uvicorn app.main:app --port 8000
+then from backend/:
+    python -m benchmarks.bench_upload_load --uploads 200 --concurrency 20
+"""
+import argparse
+import asyncio
+import random
+import time
+
+import httpx
+
+from benchmarks.common import report, summarize
+from benchmarks.synthetic import make_resume_pdf
+
+
+async def upload(client, sem, pdf, name, latencies, errors):
+    async with sem:
+        start = time.perf_counter()
+        try:
+            r = await client.post("/resume/upload", files={"file": (name, pdf, "application/pdf")})
+            r.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+        except Exception as e:
+            errors.append(f"{name}: {e}")
+
+
+async def probe(client, stop, latencies, interval):
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            await client.get("/")
+            latencies.append(time.perf_counter() - start)
+        except Exception:
+            pass
+        await asyncio.sleep(interval)
+
+
+async def run(args):
+    rng = random.Random(0)
+    # unique content per upload so every request does a full parse + extraction
+    pdfs = [make_resume_pdf(rng, pages=args.pages, tag=str(i)) for i in range(args.uploads)]
+    limits = httpx.Limits(max_connections=args.concurrency + 2)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=120, limits=limits) as client:
+        sem = asyncio.Semaphore(args.concurrency)
+        upload_lat, probe_lat, errors = [], [], []
+        stop = asyncio.Event()
+        prober = asyncio.create_task(probe(client, stop, probe_lat, args.probe_interval))
+        start = time.perf_counter()
+        await asyncio.gather(*(upload(client, sem, pdf, f"resume-{i}.pdf", upload_lat, errors)
+                               for i, pdf in enumerate(pdfs)))
+        wall = time.perf_counter() - start
+        stop.set()
+        await prober
+
+    rows = [
+        {"endpoint": "POST /resume/upload", **summarize(upload_lat),
+         "throughput_rps": round(len(upload_lat) / wall, 2), "errors": len(errors)},
+        {"endpoint": "GET / (during load)", **summarize(probe_lat), "throughput_rps": "", "errors": ""},
+    ]
+    report(f"upload load test, concurrency={args.concurrency}", rows, args.out)
+    for e in errors[:5]:
+        print("error:", e)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--base-url", default="http://localhost:8000")
+    ap.add_argument("--uploads", type=int, default=200)
+    ap.add_argument("--concurrency", type=int, default=20)
+    ap.add_argument("--pages", type=int, default=2)
+    ap.add_argument("--probe-interval", type=float, default=0.05)
+    ap.add_argument("--out", help="write results as JSON")
+    asyncio.run(run(ap.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# backend/benchmarks/bench_upload_memory.py
+"""
+Peak memory of handling one resume upload: the old path (read the whole
+upload into memory, write it, pdfminer extract_text over every page) vs the
+streaming path (save_upload in chunks + page-by-page extraction, optionally
+stopping after N pages).
+
+Each measurement runs in a fresh subprocess so ru_maxrss is not polluted by
+earlier runs. From backend/:
+    python -m benchmarks.bench_upload_memory --sizes-mb 1 5 20 --max-pages 2
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.common import report
+from benchmarks.synthetic import make_resume_pdf
+
+
+def _rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def child(mode: str, pdf_path: str, max_pages: int) -> dict:
+    upload_dir = tempfile.mkdtemp(prefix="upload-bench-")
+    os.environ["UPLOAD_DIR"] = upload_dir
+
+    from starlette.datastructures import UploadFile
+    from app.services.executor import shutdown
+
+    async def stream():
+        from app.services.parser import extract_text_from_file
+        from app.services.uploads import save_upload
+        with open(pdf_path, "rb") as f:
+            path, _, _ = await save_upload(UploadFile(f, filename="resume.pdf"),
+                                           max_bytes=1 << 40)
+        return extract_text_from_file(path, max_pages or None)
+
+    async def buffer():
+        from pdfminer.high_level import extract_text
+        with open(pdf_path, "rb") as f:
+            data = await UploadFile(f, filename="resume.pdf").read()
+        path = os.path.join(upload_dir, "resume.pdf")
+        with open(path, "wb") as out:
+            out.write(data)
+        return extract_text(path)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    text = asyncio.run(stream() if mode == "stream" else buffer())
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    shutdown()
+    return {
+        "seconds": round(elapsed, 3),
+        "tracemalloc_peak_mb": round(peak / (1024 * 1024), 1),
+        "maxrss_mb": _rss_mb(),
+        "text_chars": len(text),
+    }
+
+
+def run_child(mode: str, pdf_path: str, max_pages: int) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_upload_memory", "--child", mode, pdf_path, str(max_pages)],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1, 5, 20])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--max-pages", type=int, default=2, help="page cap for the stream+limit row")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out")
+    parser.add_argument("--child", nargs=3, metavar=("MODE", "PDF", "MAX_PAGES"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        mode, pdf_path, max_pages = args.child
+        print(json.dumps(child(mode, pdf_path, int(max_pages))))
+        return
+
+    rng = random.Random(args.seed)
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size_mb in args.sizes_mb:
+            seed = rng.random()
+            base = make_resume_pdf(random.Random(seed), pages=args.pages)
+            # same document padded with an unreferenced stream up to the requested size
+            padding = max(0, int(size_mb * 1024 * 1024) - len(base))
+            pdf = make_resume_pdf(random.Random(seed), pages=args.pages, padding=padding)
+            pdf_path = os.path.join(tmp, f"resume-{size_mb}mb.pdf")
+            with open(pdf_path, "wb") as f:
+                f.write(pdf)
+
+            for mode, max_pages in (("buffer", 0), ("stream", 0), ("stream", args.max_pages)):
+                result = run_child(mode, pdf_path, max_pages)
+                rows.append({
+                    "file_mb": round(len(pdf) / (1024 * 1024), 2),
+                    "mode": mode if not max_pages else f"stream+max_pages={max_pages}",
+                    **result,
+                })
+
+    report("upload memory", rows, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# backend/benchmarks/common.py
+"""Small helpers shared by the benchmark scripts (timing, percentiles, output)."""
+import json
+import math
+import time
+from typing import Callable, Dict, List, Optional
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of `samples` (pct in 0..100)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Latency summary in milliseconds for a list of durations in seconds."""
+    if not samples:
+        return {"count": 0}
+    return {
+        "count": len(samples),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 3),
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 95) * 1000, 3),
+        "p99_ms": round(percentile(samples, 99) * 1000, 3),
+        "max_ms": round(max(samples) * 1000, 3),
+    }
+
+
+def time_call(fn: Callable, *args, **kwargs):
+    """Run fn once and return (elapsed_seconds, result)."""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def report(name: str, rows: List[Dict], out: Optional[str] = None) -> None:
+    """Print rows as an aligned table and optionally dump them as JSON."""
+    print(f"\n== {name} ==")
+    if rows:
+        keys = list(rows[0].keys())
+        widths = {k: max(len(k), *(len(str(r.get(k, ""))) for r in rows)) for k in keys}
+        print("  ".join(k.ljust(widths[k]) for k in keys))
+        for r in rows:
+            print("  ".join(str(r.get(k, "")).ljust(widths[k]) for k in keys))
+    if out:
+        with open(out, "w") as f:
+            json.dump({"benchmark": name, "results": rows}, f, indent=2)
+        print(f"results written to {out}")
@@ -0,0 +1,83 @@
+# backend/benchmarks/compare.py
+"""
+Compare two benchmarks.run result files (e.g. the base and head commit of a
+branch) stage by stage. A stage regresses when a latency percentile grows,
+or throughput drops, by more than --threshold percent; exits non-zero if any
+stage regressed.
+
+    python -m benchmarks.compare base.json head.json --threshold 10
+"""
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional
+
+LATENCY_KEYS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+def change(before: Optional[float], after: Optional[float]) -> Optional[float]:
+    """Relative change in percent (None when either side is missing or zero)."""
+    if not before or after is None:
+        return None
+    return round((after - before) / before * 100, 1)
+
+
+def compare(base: Dict, head: Dict, threshold: float) -> List[Dict]:
+    rows = []
+    for stage, before in base["results"].items():
+        after = head["results"].get(stage)
+        if after is None:
+            continue
+        row = {"stage": stage}
+        regressed = []
+        for key in LATENCY_KEYS:
+            delta = change(before.get(key), after.get(key))
+            row[key] = f"{before.get(key)} -> {after.get(key)} ({delta:+}%)" if delta is not None else "n/a"
+            if delta is not None and delta > threshold:
+                regressed.append(key)
+        delta = change(before.get("throughput_per_s"), after.get("throughput_per_s"))
+        row["throughput"] = f"{delta:+}%" if delta is not None else "n/a"
+        if delta is not None and -delta > threshold:
+            regressed.append("throughput")
+        row["regressed"] = ",".join(regressed) or "-"
+        rows.append(row)
+    return rows
+
+
+def describe(run: Dict) -> str:
+    meta = run.get("meta", {})
+    commit = (meta.get("commit") or "unknown")[:12] + (" (dirty)" if meta.get("dirty") else "")
+    return f"{commit} at {meta.get('timestamp', '?')}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed slowdown in percent")
+    args = parser.parse_args()
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.head) as f:
+        head = json.load(f)
+
+    print(f"base: {describe(base)}\nhead: {describe(head)}")
+    if base.get("meta", {}).get("params") != head.get("meta", {}).get("params"):
+        print("warning: the runs used different parameters; numbers may not be comparable")
+
+    rows = compare(base, head, args.threshold)
+    widths = {k: max(len(k), *(len(str(r[k])) for r in rows)) for k in rows[0]} if rows else {}
+    print("  ".join(k.ljust(w) for k, w in widths.items()))
+    for row in rows:
+        print("  ".join(str(row[k]).ljust(w) for k, w in widths.items()))
+
+    regressions = [r["stage"] for r in rows if r["regressed"] != "-"]
+    if regressions:
+        print(f"FAIL: {len(regressions)} stage(s) slower than the {args.threshold}% threshold: {', '.join(regressions)}")
+        sys.exit(1)
+    print(f"OK: no stage regressed by more than {args.threshold}%")
+
+
+if __name__ == "__main__":
+    main()
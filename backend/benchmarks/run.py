@@ -0,0 +1,278 @@
+# backend/benchmarks/run.py
+"""
+Reproducible benchmark of the whole request pipeline, for comparing commits.
+
+Generates a deterministic corpus (resume PDFs and DOCX files, job postings)
+at the requested scale, points the app at local stubs for everything
+external (Mongo via mongomock-motor or a local mongod, SerpAPI, RapidAPI
+news, the OpenAI-compatible LLM endpoint) and measures throughput and
+p50/p95/p99 of:
+
+    parse_pdf / parse_docx   parser.extract_text_from_file
+    extract_skills           skill_extractor.extract_skills_from_text
+    compute_match            matcher.compute_match
+    jobs_fetch               POST /jobs/fetch
+    resume_upload            POST /resume/upload
+    roadmap_ai               GET /roadmap/ai/{resume_id}/{job_id}, distinct pairs (LLM called)
+    roadmap_ai_cached        the same pairs again (response cache)
+    news                     GET /news/
+
+The API is driven in-process through its ASGI app (lifespan included), so
+numbers don't depend on a uvicorn setup. Results go to a JSON file with the
+commit, environment and parameters; compare two runs with benchmarks.compare:
+
+    python -m benchmarks.run --resumes 50 --jobs 200 --out base.json
+    git checkout my-branch
+    python -m benchmarks.run --resumes 50 --jobs 200 --out head.json
+    python -m benchmarks.compare base.json head.json
+
+`--mongo mongodb://localhost:27017` uses a real mongod (throwaway database)
+instead of mongomock-motor. Stub latencies default to a few milliseconds so
+the app's own overhead dominates; raise them to model production.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Iterable, List
+
+from benchmarks.common import report, summarize
+from benchmarks.stub_llm import StubLLM
+from benchmarks.stub_news import StubNews
+from benchmarks.stub_serpapi import StubSerpAPI
+from benchmarks.synthetic import TITLES, make_job, make_resume_docx, make_resume_pdf, make_resume_text
+
+STAGES = (
+    "parse_pdf", "parse_docx", "extract_skills", "compute_match",
+    "jobs_fetch", "resume_upload", "roadmap_ai", "roadmap_ai_cached", "news",
+)
+
+
+def _result(latencies: List[float], wall: float, errors: int = 0) -> Dict:
+    return {
+        "errors": errors,
+        "wall_s": round(wall, 3),
+        "throughput_per_s": round(len(latencies) / wall, 2) if wall else 0.0,
+        **summarize(latencies),
+    }
+
+
+def measure(fn: Callable, items: Iterable) -> Dict:
+    """Call fn(item) for each item in turn."""
+    latencies = []
+    start = time.perf_counter()
+    for item in items:
+        t = time.perf_counter()
+        fn(item)
+        latencies.append(time.perf_counter() - t)
+    return _result(latencies, time.perf_counter() - start)
+
+
+async def measure_async(fn: Callable[..., Awaitable[bool]], items: Iterable, concurrency: int) -> Dict:
+    """Await fn(item) for every item, at most `concurrency` at a time; fn returns False on an error response."""
+    sem = asyncio.Semaphore(concurrency)
+    latencies, errors = [], 0
+
+    async def one(item):
+        nonlocal errors
+        async with sem:
+            t = time.perf_counter()
+            ok = await fn(item)
+            latencies.append(time.perf_counter() - t)
+            errors += not ok
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(item) for item in items))
+    return _result(latencies, time.perf_counter() - start, errors)
+
+
+def git_commit() -> Dict:
+    def git(*args):
+        return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+    try:
+        return {"commit": git("rev-parse", "HEAD"), "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def write_corpus(directory: str, n: int, seed: int) -> Dict[str, List[str]]:
+    """n resume PDFs and n resume DOCX files, all distinct (so upload never hits the extraction cache)."""
+    rng = random.Random(seed)
+    files = {"pdf": [], "docx": []}
+    for i in range(n):
+        for ext, data in (("pdf", make_resume_pdf(rng, pages=2, tag=f"pdf-{seed}-{i}")),
+                          ("docx", make_resume_docx(rng, tag=f"docx-{seed}-{i}"))):
+            path = os.path.join(directory, f"resume-{i}.{ext}")
+            with open(path, "wb") as f:
+                f.write(data)
+            files[ext].append(path)
+    return files
+
+
+def function_stages(args, corpus: Dict[str, List[str]], selected) -> Dict[str, Dict]:
+    from app.services import matcher
+    from app.services.job_parser import job_text
+    from app.services.parser import extract_text_from_file
+    from app.services.skill_extractor import extract_skills_from_text
+
+    rng = random.Random(args.seed)
+    results = {}
+    for ext in ("pdf", "docx"):
+        if f"parse_{ext}" in selected:
+            results[f"parse_{ext}"] = measure(extract_text_from_file, corpus[ext])
+
+    texts = [make_resume_text(rng) for _ in range(args.resumes)] + [job_text(make_job(rng)) for _ in range(args.jobs)]
+    if "extract_skills" in selected:
+        results["extract_skills"] = measure(extract_skills_from_text, texts)
+    if "compute_match" in selected:
+        skill_lists = [extract_skills_from_text(t) for t in texts[:50]]
+        pairs = [(rng.choice(skill_lists), rng.choice(skill_lists)) for _ in range(args.matches)]
+        results["compute_match"] = measure(lambda pair: matcher.compute_match(*pair), pairs)
+    return results
+
+
+async def api_stages(args, corpus: Dict[str, List[str]], selected) -> Dict[str, Dict]:
+    import httpx
+
+    from app.main import app
+    from app.services import db
+    from app.services.task_queue import task_queue
+
+    results = {}
+    rng = random.Random(args.seed)
+    resume_ids: List[str] = []
+    await db.get_client().drop_database(db.MONGO_DB)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+
+            async def fetch(i):
+                # distinct queries so every fetch stores new postings
+                r = await client.post("/jobs/fetch", params={"query": f"{TITLES[i % len(TITLES)]} {i}",
+                                                             "location": "Remote", "limit": 10})
+                return r.status_code == 200
+
+            async def upload(path):
+                with open(path, "rb") as f:
+                    r = await client.post("/resume/upload", files={"file": (os.path.basename(path), f.read())})
+                if r.status_code == 200:
+                    resume_ids.append(r.json()["resume_id"])
+                return r.status_code == 200
+
+            async def roadmap(pair):
+                r = await client.get(f"/roadmap/ai/{pair[0]}/{pair[1]}")
+                return r.status_code == 200
+
+            async def news(i):
+                r = await client.get("/news/", params={"query": f"topic {i % 10}", "limit": 5})
+                return r.status_code == 200
+
+            # jobs and resumes are needed for the roadmaps even when their stages aren't reported
+            fetches = max(1, args.jobs // 10)
+            result = await measure_async(fetch, range(fetches), args.concurrency)
+            if "jobs_fetch" in selected:
+                results["jobs_fetch"] = result
+
+            paths = [p for pair in zip(corpus["pdf"], corpus["docx"]) for p in pair]
+            result = await measure_async(upload, paths, args.concurrency)
+            if "resume_upload" in selected:
+                results["resume_upload"] = result
+
+            # let the background match refresh finish so it doesn't overlap the roadmap numbers
+            await task_queue.drain()
+
+            job_ids = [str(doc["_id"]) async for doc in db.db.jobs.find({}, {"_id": 1}).limit(args.jobs)]
+            pairs = list(dict.fromkeys((rng.choice(resume_ids), rng.choice(job_ids)) for _ in range(args.roadmaps)))
+            if "roadmap_ai" in selected:
+                results["roadmap_ai"] = await measure_async(roadmap, pairs, args.concurrency)
+            if "roadmap_ai_cached" in selected:
+                results["roadmap_ai_cached"] = await measure_async(roadmap, pairs, args.concurrency)
+            if "news" in selected:
+                results["news"] = await measure_async(news, range(args.requests), args.concurrency)
+        # before the lifespan's shutdown closes the client
+        await db.get_client().drop_database(db.MONGO_DB)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=20, help="resumes per format (PDF and DOCX)")
+    parser.add_argument("--jobs", type=int, default=100, help="job postings (fetched in pages of 10)")
+    parser.add_argument("--matches", type=int, default=10000, help="compute_match calls")
+    parser.add_argument("--roadmaps", type=int, default=30, help="resume/job pairs for /roadmap/ai")
+    parser.add_argument("--requests", type=int, default=50, help="/news/ calls")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--mongo", default="mock", help="'mock' (mongomock-motor) or a MongoDB URI")
+    parser.add_argument("--llm-latency", type=float, default=0.005)
+    parser.add_argument("--serpapi-latency", type=float, default=0.005)
+    parser.add_argument("--news-latency", type=float, default=0.005)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", help="results JSON (default: benchmark-<commit>.json)")
+    args = parser.parse_args()
+
+    llm, serpapi, news = StubLLM(latency=args.llm_latency), StubSerpAPI(latency=args.serpapi_latency), \
+        StubNews(latency=args.news_latency)
+    workdir = tempfile.mkdtemp(prefix="career-mentor-bench-")
+    # the app reads its configuration at import time, so this has to come first
+    os.environ.update({
+        "LLM_BASE_URL": llm.start(), "LLM_API_KEY": "stub",
+        "SERPAPI_BASE_URL": serpapi.start(), "SERPAPI_KEY": "stub",
+        "NEWS_API_URL": news.start() + "/technology", "RAPIDAPI_KEY": "stub",
+        "UPLOAD_DIR": os.path.join(workdir, "uploads"),
+    })
+    os.environ.setdefault("SERPAPI_RATE", "1000")
+    os.environ.setdefault("SERPAPI_BURST", "1000")
+    os.environ.setdefault("MONGO_DB", "career_mentor_bench_pipeline")
+    if args.mongo != "mock":
+        os.environ["MONGO_URI"] = args.mongo
+
+    from app.services import db, roadmap_agent, skill_extractor
+    if args.mongo == "mock":
+        from mongomock_motor import AsyncMongoMockClient
+        db._client = AsyncMongoMockClient()
+
+    # model load and the OpenAI SDK import are reported once, not inside the first measured call
+    load_start = time.perf_counter()
+    skill_extractor.get_nlp()
+    roadmap_agent.get_llm_client()
+    meta = {
+        **git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "mongo": "mongomock" if args.mongo == "mock" else "mongod",
+        "spacy_model": skill_extractor.SPACY_MODEL,
+        "load_s": round(time.perf_counter() - load_start, 3),
+        "params": {k: v for k, v in vars(args).items() if k != "out"},
+    }
+
+    try:
+        corpus = write_corpus(workdir, args.resumes, args.seed)
+        results = function_stages(args, corpus, set(args.stages))
+        results.update(asyncio.run(api_stages(args, corpus, set(args.stages))))
+    finally:
+        for stub in (llm, serpapi, news):
+            stub.stop()
+
+    results = {stage: results[stage] for stage in STAGES if stage in results}
+    report("pipeline", [{"stage": stage, **r} for stage, r in results.items()])
+    out = args.out or f"benchmark-{(meta['commit'] or 'unknown')[:12]}.json"
+    with open(out, "w") as f:
+        json.dump({"suite": "pipeline", "meta": meta, "results": results}, f, indent=2)
+    print(f"results written to {out}")
+    if any(r["errors"] for r in results.values()):
+        print("FAIL: some requests returned an error status")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+# backend/benchmarks/stub_llm.py
+"""
+Local fake of an OpenAI-compatible chat completions endpoint, for testing and
+benchmarking the roadmap agent without network access or API costs.
+
+    python -m benchmarks.stub_llm --port 8901 --latency 1.5
+    LLM_BASE_URL=http://127.0.0.1:8901 LLM_API_KEY=stub uvicorn app.main:app
+
+POST /chat/completions answers after `--latency` seconds: prompts asking for a
+JSON object get a small skill-roadmap JSON, others a short text roadmap. With
+"stream": true the answer is sent as SSE chunks, the first after
+`--first-token` seconds and the rest spread over the remaining latency.
+GET /stats returns the number of completions served (to count upstream calls).
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+def skill_roadmap_answer(prompt: str) -> str:
+    skill = prompt.split("learning goal for '", 1)[-1].split("'", 1)[0] if "learning goal for '" in prompt else "it"
+    return json.dumps({
+        "summary": f"Learn the fundamentals of {skill} and apply them in a small project.",
+        "videos": [{"title": f"{skill} crash course", "url": "https://example.com/video", "duration": "1h"}],
+        "day_plan": [{"day": d, "tasks": [f"{skill} topic {d}"], "minutes": 60} for d in range(1, 4)],
+        "blogs": [{"title": f"{skill} guide", "url": "https://example.com/blog"}],
+        "notes": ["Practice daily", "Build something"],
+    })
+
+
+def text_answer(prompt: str) -> str:
+    return "\n".join(f"Step {i}: study and practice part {i} of the plan." for i in range(1, 8))
+
+
+class StubLLM:
+    def __init__(self, latency: float = 1.0, jitter: float = 0.0, fail_rate: float = 0.0, seed: int = 0,
+                 first_token: Optional[float] = None):
+        self.latency = latency
+        self.first_token = latency / 10 if first_token is None else first_token
+        self.jitter = jitter
+        self.fail_rate = fail_rate
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def answer(self, body: dict) -> str:
+        prompt = body["messages"][-1]["content"]
+        return skill_roadmap_answer(prompt) if "JSON object" in prompt else text_answer(prompt)
+
+    def handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, payload: dict):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if self.path.rstrip("/").endswith("/stats"):
+                    self._send(200, {"calls": stub.calls})
+                else:
+                    self._send(404, {"error": "not found"})
+
+            def _stream(self, body: dict, content: str, delay: float):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                # roughly token-sized pieces: words with their trailing whitespace
+                pieces = [p + " " for p in content.split(" ")]
+                pieces[-1] = pieces[-1][:-1]
+                step = max(0.0, delay - stub.first_token) / max(1, len(pieces) - 1)
+                time.sleep(stub.first_token)
+                for i, piece in enumerate(pieces):
+                    if i:
+                        time.sleep(step)
+                    chunk = {
+                        "id": "chatcmpl-stub", "object": "chat.completion.chunk", "created": int(time.time()),
+                        "model": body.get("model", "stub"),
+                        "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}],
+                    }
+                    self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                    self.wfile.flush()
+                done = {"id": "chatcmpl-stub", "object": "chat.completion.chunk", "created": int(time.time()),
+                        "model": body.get("model", "stub"),
+                        "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+                self.wfile.write(f"data: {json.dumps(done)}\n\ndata: [DONE]\n\n".encode())
+                self.wfile.flush()
+
+            def do_POST(self):
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self._send(404, {"error": "not found"})
+                    return
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                with stub._lock:
+                    stub.calls += 1
+                    fail = stub._rng.random() < stub.fail_rate
+                    delay = stub.latency + stub._rng.uniform(0, stub.jitter)
+                if fail:
+                    time.sleep(stub.first_token if body.get("stream") else delay)
+                    self._send(500, {"error": {"message": "stub failure", "type": "server_error"}})
+                    return
+                content = stub.answer(body)
+                if body.get("stream"):
+                    self._stream(body, content, delay)
+                    return
+                time.sleep(delay)
+                self._send(200, {
+                    "id": f"chatcmpl-stub-{stub.calls}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": body.get("model", "stub"),
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                                 "finish_reason": "stop"}],
+                    "usage": {"prompt_tokens": len(body["messages"][-1]["content"]) // 4,
+                              "completion_tokens": len(content) // 4,
+                              "total_tokens": (len(body["messages"][-1]["content"]) + len(content)) // 4},
+                })
+
+        return Handler
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve in a background thread; returns the base URL (port 0 picks a free port)."""
+        self._server = ThreadingHTTPServer((host, port), self.handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return f"http://{host}:{self._server.server_address[1]}"
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8901)
+    parser.add_argument("--latency", type=float, default=1.0, help="seconds before each answer")
+    parser.add_argument("--first-token", type=float, default=None,
+                        help="seconds before the first streamed chunk (default: latency / 10)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency, up to this many seconds")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="fraction of requests answered with HTTP 500")
+    args = parser.parse_args()
+
+    stub = StubLLM(args.latency, args.jitter, args.fail_rate, first_token=args.first_token)
+    server = ThreadingHTTPServer((args.host, args.port), stub.handler())
+    print(f"stub LLM listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# backend/benchmarks/stub_news.py
+"""
+Local mock of the RapidAPI Google News endpoint the news route calls, for
+testing and benchmarking without a RapidAPI key.
+
+    python -m benchmarks.stub_news --port 8903 --latency 0.3
+    NEWS_API_URL=http://127.0.0.1:8903/technology RAPIDAPI_KEY=stub uvicorn app.main:app
+
+GET /technology answers after `--latency` seconds with `pageSize` synthetic
+items in the API's {"status", "items"} shape. GET /stats returns the number
+of requests served.
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+
+def news_item(query: str, i: int) -> dict:
+    return {
+        "title": f"{query.title()} roundup #{i}",
+        "snippet": f"What changed this week for {query}.",
+        "publisher": "Example News",
+        "timestamp": str(1700000000000 + i * 60000),
+        "newsUrl": f"https://example.com/news/{i}",
+    }
+
+
+class StubNews:
+    def __init__(self, latency: float = 0.3):
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, payload: dict):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path.rstrip("/").endswith("/stats"):
+                    self._send(200, {"requests": stub.requests})
+                    return
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                with stub._lock:
+                    stub.requests += 1
+                time.sleep(stub.latency)
+                size = int(params.get("pageSize", 5))
+                query = params.get("q", "technology")
+                self._send(200, {"status": "success", "items": [news_item(query, i) for i in range(size)]})
+
+        return Handler
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve in a background thread; returns the base URL (port 0 picks a free port)."""
+        self._server = ThreadingHTTPServer((host, port), self.handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return f"http://{host}:{self._server.server_address[1]}"
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8903)
+    parser.add_argument("--latency", type=float, default=0.3)
+    args = parser.parse_args()
+
+    stub = StubNews(args.latency)
+    server = ThreadingHTTPServer((args.host, args.port), stub.handler())
+    print(f"stub news API listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# backend/benchmarks/stub_serpapi.py
+"""
+Local mock of SerpAPI's Google Jobs engine (GET /search.json), for testing
+and benchmarking the job fetcher without an API key or quota.
+
+    python -m benchmarks.stub_serpapi --port 8902 --latency 0.8 --pages 5
+    SERPAPI_BASE_URL=http://127.0.0.1:8902 SERPAPI_KEY=stub uvicorn app.main:app
+
+Each (q, location) has `--pages` pages of 10 deterministic synthetic postings,
+linked with serpapi_pagination.next_page_token like the real API. Every
+`--throttle-every`-th request is answered 429 with Retry-After: 0 to exercise
+retries. GET /stats returns request counts.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.synthetic import make_job
+
+PAGE_SIZE = 10
+
+
+def serpapi_job(job: dict, tag: str) -> dict:
+    """A synthetic job in SerpAPI's response shape."""
+    return {
+        "title": job["title"],
+        "company_name": job["company"],
+        "location": job["location"],
+        "via": job["via"],
+        "description": job["description"],
+        "job_highlights": job["job_highlights"],
+        "extensions": job["extensions"],
+        "apply_options": [{"title": "Apply", "link": f"https://example.com/job/{tag}"}],
+        "job_id": tag,
+    }
+
+
+class StubSerpAPI:
+    def __init__(self, latency: float = 0.5, pages: int = 3, throttle_every: int = 0):
+        self.latency = latency
+        self.pages = pages
+        self.throttle_every = throttle_every
+        self.requests = 0
+        self.throttled = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def page(self, query: str, location: str, page_no: int) -> dict:
+        rng = random.Random(f"{query}|{location}|{page_no}")
+        jobs = [serpapi_job(make_job(rng), f"{query}-{location}-{page_no}-{i}") for i in range(PAGE_SIZE)]
+        body = {"search_metadata": {"status": "Success"}, "jobs_results": jobs}
+        if page_no + 1 < self.pages:
+            body["serpapi_pagination"] = {"next_page_token": f"page-{page_no + 1}"}
+        return body
+
+    def handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, payload: dict, headers=None):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path.rstrip("/").endswith("/stats"):
+                    self._send(200, {"requests": stub.requests, "throttled": stub.throttled,
+                                     "max_in_flight": stub.max_in_flight})
+                    return
+                if url.path != "/search.json":
+                    self._send(404, {"error": "not found"})
+                    return
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                with stub._lock:
+                    stub.requests += 1
+                    throttle = stub.throttle_every and stub.requests % stub.throttle_every == 0
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                try:
+                    if throttle:
+                        with stub._lock:
+                            stub.throttled += 1
+                        self._send(429, {"error": "Too many requests"}, {"Retry-After": "0"})
+                        return
+                    time.sleep(stub.latency)
+                    token = params.get("next_page_token", "page-0")
+                    page_no = int(token.rsplit("-", 1)[-1])
+                    self._send(200, stub.page(params.get("q", ""), params.get("location", ""), page_no))
+                finally:
+                    with stub._lock:
+                        stub.in_flight -= 1
+
+        return Handler
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve in a background thread; returns the base URL (port 0 picks a free port)."""
+        self._server = ThreadingHTTPServer((host, port), self.handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return f"http://{host}:{self._server.server_address[1]}"
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8902)
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds per results page")
+    parser.add_argument("--pages", type=int, default=3, help="pages available per search")
+    parser.add_argument("--throttle-every", type=int, default=0, help="answer every Nth request with 429")
+    args = parser.parse_args()
+
+    stub = StubSerpAPI(args.latency, args.pages, args.throttle_every)
+    server = ThreadingHTTPServer((args.host, args.port), stub.handler())
+    print(f"stub SerpAPI listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
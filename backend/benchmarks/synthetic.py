@@ -0,0 +1,156 @@
+# backend/benchmarks/synthetic.py
+"""Deterministic synthetic resumes and job postings for the benchmarks."""
+import random
+from typing import Dict, List
+
+SKILL_POOL = [
+    "python", "java", "javascript", "typescript", "c++", "go", "rust", "sql",
+    "mongodb", "postgresql", "mysql", "redis", "flask", "django", "fastapi",
+    "react", "node.js", "angular", "vue", "tensorflow", "keras", "pytorch",
+    "scikit-learn", "pandas", "numpy", "aws", "gcp", "azure", "docker",
+    "kubernetes", "terraform", "git", "linux", "nlp", "computer vision",
+    "machine learning", "deep learning", "data visualization", "tableau",
+    "power bi", "spark", "hadoop", "kafka", "airflow", "graphql", "rest apis",
+]
+
+TITLES = [
+    "Data Scientist", "Backend Engineer", "Machine Learning Engineer",
+    "Frontend Developer", "DevOps Engineer", "Data Analyst", "Software Engineer",
+]
+
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+LOCATIONS = ["Bengaluru, India", "Pune, India", "Remote", "Hyderabad, India", "Delhi, India"]
+
+FILLER = [
+    "We are looking for a motivated engineer to join our growing team.",
+    "You will collaborate with product managers and designers on new features.",
+    "The role involves building scalable services and maintaining data pipelines.",
+    "Strong communication skills and ownership are expected.",
+    "Experience with agile development and code reviews is a plus.",
+    "You will mentor junior developers and contribute to architecture decisions.",
+    "Our stack is modern and we value clean, well-tested code.",
+]
+
+
+def make_job(rng: random.Random, n_skills: int = 8, filler_sentences: int = 6) -> Dict:
+    """A job document shaped like the ones job_fetcher stores."""
+    skills = rng.sample(SKILL_POOL, n_skills)
+    sentences = [rng.choice(FILLER) for _ in range(filler_sentences)]
+    sentences.insert(rng.randrange(len(sentences) + 1),
+                     "Required experience with " + ", ".join(skills[: n_skills // 2]) + ".")
+    return {
+        "title": rng.choice(TITLES),
+        "company": rng.choice(COMPANIES),
+        "location": rng.choice(LOCATIONS),
+        "via": "LinkedIn",
+        "description": " ".join(sentences),
+        "job_highlights": [
+            {"title": "Qualifications",
+             "items": [f"Hands-on knowledge of {s}" for s in skills[n_skills // 2:]]},
+        ],
+        "extensions": ["Full-time"],
+        "link": "https://example.com/job",
+        "source": "synthetic",
+    }
+
+
+def make_resume_text(rng: random.Random, n_skills: int = 12, projects: int = 3) -> str:
+    """Plain-text resume with a Skills section, experience and projects."""
+    skills = rng.sample(SKILL_POOL, n_skills)
+    lines = [
+        "Jane Doe",
+        "jane.doe@example.com | +91 98765 43210",
+        "",
+        "Technical Skills",
+        ", ".join(skills),
+        "",
+        "Experience",
+    ]
+    for i in range(projects):
+        used = rng.sample(skills, 3)
+        lines.append(f"- Built a {rng.choice(['recommendation', 'analytics', 'search', 'billing'])} "
+                     f"system using {used[0]}, {used[1]} and {used[2]} at {rng.choice(COMPANIES)}.")
+        lines.append(f"- {rng.choice(FILLER)}")
+    lines += ["", "Education", "B.Tech in Computer Science, 2022"]
+    return "\n".join(lines)
+
+
+def make_jobs(n: int, seed: int = 0) -> List[Dict]:
+    rng = random.Random(seed)
+    return [make_job(rng) for _ in range(n)]
+
+
+def make_resume_texts(n: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return [make_resume_text(rng) for _ in range(n)]
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf_bytes(pages: List[List[str]], padding: int = 0) -> bytes:
+    """
+    A minimal valid PDF with one Helvetica text line per list item, one list per page.
+    `padding` adds an unreferenced stream of that many bytes to reach a target file size.
+    """
+    objs = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: ("<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            " ".join(f"{4 + 2 * i} 0 R" for i in range(len(pages))), len(pages))).encode(),
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for i, lines in enumerate(pages):
+        page_no, content_no = 4 + 2 * i, 5 + 2 * i
+        stream = "\n".join(["BT /F1 10 Tf 12 TL 50 800 Td"]
+                           + [f"({_pdf_escape(line)}) Tj T*" for line in lines] + ["ET"])
+        data = stream.encode("latin-1", "replace")
+        objs[page_no] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_no} 0 R >>"
+        ).encode()
+        objs[content_no] = b"<< /Length %d >>\nstream\n" % len(data) + data + b"\nendstream"
+    if padding:
+        objs[len(objs) + 1] = b"<< /Length %d >>\nstream\n" % padding + b"0" * padding + b"\nendstream"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num in range(1, len(objs) + 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % num + objs[num] + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objs) + 1)
+    for off in offsets:
+        out += b"%010d 00000 n \n" % off
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objs) + 1, xref)
+    return bytes(out)
+
+
+def make_resume_pdf(rng: random.Random, pages: int = 2, lines_per_page: int = 60, tag: str = "",
+                    padding: int = 0) -> bytes:
+    """Resume PDF: the synthetic resume text on page 1, filler experience after."""
+    first = make_resume_text(rng).splitlines()
+    if tag:
+        first.append(f"Reference {tag}")  # makes otherwise identical resumes distinct
+    content = [first]
+    for _ in range(pages - 1):
+        content.append([rng.choice(FILLER) for _ in range(lines_per_page)])
+    return make_pdf_bytes(content, padding=padding)
+
+
+def make_resume_docx(rng: random.Random, tag: str = "", paragraphs: int = 20) -> bytes:
+    """Resume DOCX (python-docx): the synthetic resume text, then filler paragraphs."""
+    import io
+
+    from docx import Document
+
+    document = Document()
+    for line in make_resume_text(rng).splitlines():
+        document.add_paragraph(line)
+    if tag:
+        document.add_paragraph(f"Reference {tag}")
+    for _ in range(paragraphs):
+        document.add_paragraph(rng.choice(FILLER))
+    buf = io.BytesIO()
+    document.save(buf)
+    return buf.getvalue()
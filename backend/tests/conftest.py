@@ -0,0 +1,78 @@
+# backend/tests/conftest.py
+import os
+import sys
+import time
+
+import pytest
+
+# run from backend/ or the repo root alike
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import db, job_fetcher, llm_cache, news_service, roadmap_agent  # noqa: E402
+from app.services.cache import TTLCache  # noqa: E402
+from app.services.rate_limit import TokenBucket  # noqa: E402
+from benchmarks.stub_llm import StubLLM  # noqa: E402
+from benchmarks.stub_news import StubNews  # noqa: E402
+from benchmarks.stub_serpapi import StubSerpAPI  # noqa: E402
+
+
+@pytest.fixture
+def stub_llm(monkeypatch):
+    """The local stub LLM, with the roadmap agent pointed at it."""
+    stub = StubLLM(latency=0.3, first_token=0.05)
+    monkeypatch.setattr(roadmap_agent, "LLM_BASE_URL", stub.start())
+    monkeypatch.setattr(roadmap_agent, "LLM_API_KEY", "stub")
+    # a fresh client per test: its connection pool belongs to the test's event loop
+    monkeypatch.setattr(roadmap_agent, "_client", None)
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def stub_news(monkeypatch):
+    """The local stub news API behind an empty news cache."""
+    stub = StubNews(latency=0.05)
+    monkeypatch.setattr(news_service, "NEWS_API_URL", stub.start() + "/technology")
+    monkeypatch.setattr(news_service, "_cache", TTLCache(maxsize=news_service.NEWS_CACHE_SIZE, ttl=3600))
+    monkeypatch.setattr(news_service, "_requested", {})
+    monkeypatch.setattr(news_service, "_fetching", {})
+    monkeypatch.setattr(news_service, "_client", None)
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def stub_serpapi(monkeypatch):
+    """The local stub SerpAPI (3 pages of 10 jobs per search), no rate limit or backoff."""
+    stub = StubSerpAPI(latency=0.01, pages=3)
+    monkeypatch.setattr(job_fetcher, "SERPAPI_BASE_URL", stub.start())
+    monkeypatch.setattr(job_fetcher, "SERPAPI_BACKOFF", 0.0)
+    monkeypatch.setattr(job_fetcher, "rate_limiter", TokenBucket(0))
+    monkeypatch.setattr(job_fetcher, "_client", None)
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def llm_cache_store(monkeypatch):
+    """The LLM response cache with a dict in place of the memory and Mongo tiers."""
+    store = {}
+
+    async def lookup(key):
+        return store.get(key), "memory"
+
+    async def write(key, value, meta):
+        store[key] = {"value": value, "created_at": time.time()}
+
+    monkeypatch.setattr(llm_cache, "_lookup", lookup)
+    monkeypatch.setattr(llm_cache, "_store", write)
+    return store
+
+
+@pytest.fixture
+def mongo(monkeypatch):
+    """An in-memory mongomock-motor client behind the app's lazy `db`."""
+    from mongomock_motor import AsyncMongoMockClient
+
+    monkeypatch.setattr(db, "_client", AsyncMongoMockClient())
+    return db.get_db()
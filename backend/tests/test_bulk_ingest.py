@@ -0,0 +1,43 @@
+# backend/tests/test_bulk_ingest.py
+import asyncio
+
+from app.services import bulk_ingest, extraction_cache, match_store
+
+
+def test_batch_reports_one_resume_per_file(mongo, monkeypatch):
+    async def parse(files, max_pages):
+        return [(f"text of {f['filename']}", None) for f in files]
+
+    async def extract(texts, **kwargs):
+        return [["python"] for _ in texts]
+
+    async def put_many(entries):
+        pass
+
+    monkeypatch.setattr(bulk_ingest, "_parse_batch", parse)
+    monkeypatch.setattr(extraction_cache, "extract_skills_batch_cached", extract)
+    monkeypatch.setattr(extraction_cache, "put_many", put_many)
+    refreshed = []
+    monkeypatch.setattr(match_store, "schedule_resume_refresh", refreshed.extend)
+
+    # an older upload of the same file, stored twice before uploads upserted
+    asyncio.run(mongo.resumes.insert_many([{"content_hash": "a"}, {"content_hash": "a"}]))
+    first = asyncio.run(mongo.resumes.find_one({"content_hash": "a"}))
+
+    # the existing hash goes last: mongomock numbers upserted_ids by upsert, not by operation
+    files = [{"filename": f"{h}.pdf", "file_path": f"/tmp/{h}.pdf", "content_hash": h, "size": 1}
+             for h in ("b", "c", "a")]
+    job = bulk_ingest.new_job("test")
+    asyncio.run(bulk_ingest._ingest_batch(files, job, None))
+
+    ids = job["resume_ids"]
+    assert len(ids) == 3 and ids[2] == str(first["_id"])
+    assert len(set(ids)) == 3
+    assert [str(i) for i in refreshed] == ids
+    assert asyncio.run(mongo.resumes.count_documents({})) == 4
+    assert job["succeeded"] == 3
+
+    # re-ingesting the same files reports the same resumes
+    job = bulk_ingest.new_job("test")
+    asyncio.run(bulk_ingest._ingest_batch(files, job, None))
+    assert job["resume_ids"] == ids
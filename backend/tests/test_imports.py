@@ -0,0 +1,17 @@
+# backend/tests/test_imports.py
+import os
+import subprocess
+import sys
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# loaded on first use (get_nlp(), get_llm_client(), get_client(), the semantic encoder)
+LAZY = ("spacy", "openai", "motor", "sentence_transformers", "torch")
+
+
+def test_importing_the_app_loads_no_models_or_clients():
+    code = f"import sys, app.main; print(' '.join(m for m in {LAZY!r} if m in sys.modules))"
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONPATH"}
+    out = subprocess.run([sys.executable, "-c", code], cwd=BACKEND, env=env,
+                         capture_output=True, text=True, check=True)
+    assert out.stdout.split() == []
@@ -0,0 +1,80 @@
+# backend/tests/test_job_fetcher.py
+import asyncio
+import time
+
+import pytest
+
+from app.services import job_fetcher
+from app.services.rate_limit import TokenBucket
+
+
+def _run(coro):
+    async def run():
+        try:
+            return await coro
+        finally:
+            await job_fetcher.close()
+
+    return asyncio.run(run())
+
+
+async def _collect(searches, limit):
+    return [page async for page in job_fetcher.fetch_many(searches, limit)]
+
+
+def test_pages_until_the_limit(stub_serpapi):
+    jobs = _run(job_fetcher.fetch_jobs_serpapi("python", "Berlin", 25))
+
+    assert len(jobs) == 25
+    assert len({job["link"] for job in jobs}) == 25
+    assert stub_serpapi.requests == 3
+
+
+def test_stops_at_the_last_page(stub_serpapi):
+    jobs = _run(job_fetcher.fetch_jobs_serpapi("python", "Berlin", 100))
+
+    assert len(jobs) == 30
+    assert stub_serpapi.requests == 3
+
+
+def test_throttled_requests_are_retried(stub_serpapi):
+    stub_serpapi.throttle_every = 2
+
+    jobs = _run(job_fetcher.fetch_jobs_serpapi("python", "Berlin", 30))
+
+    assert len(jobs) == 30
+    assert stub_serpapi.throttled == 2
+    assert stub_serpapi.requests == 5
+
+
+def test_gives_up_after_max_retries(stub_serpapi):
+    stub_serpapi.throttle_every = 1
+
+    with pytest.raises(RuntimeError, match="429"):
+        _run(job_fetcher.fetch_jobs_serpapi("python", "Berlin", 10))
+    assert stub_serpapi.requests == job_fetcher.SERPAPI_MAX_RETRIES + 1
+
+
+def test_concurrent_searches_share_the_rate_limit(stub_serpapi, monkeypatch):
+    stub_serpapi.pages = 1
+    monkeypatch.setattr(job_fetcher, "rate_limiter", TokenBucket(rate=20, capacity=1))
+    searches = [(f"query {i}", "Berlin") for i in range(6)]
+
+    start = time.perf_counter()
+    pages = _run(_collect(searches + searches[:2], 10))
+    elapsed = time.perf_counter() - start
+
+    # duplicate searches run once; 6 requests at 20/s after a burst of 1
+    assert sorted(p["query"] for p in pages) == sorted(q for q, _ in searches)
+    assert stub_serpapi.requests == 6
+    assert elapsed >= 5 / 20
+
+
+def test_a_failing_search_is_reported_not_raised(stub_serpapi, monkeypatch):
+    monkeypatch.setattr(job_fetcher, "SERPAPI_MAX_RETRIES", 0)
+    stub_serpapi.pages, stub_serpapi.throttle_every = 1, 3   # one request per search, the third throttled
+
+    pages = _run(_collect([("a", "x"), ("b", "x"), ("c", "x")], 30))
+
+    assert len([p for p in pages if "error" in p]) == 1
+    assert [len(p["jobs"]) for p in pages if "jobs" in p] == [10, 10]
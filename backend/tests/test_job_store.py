@@ -0,0 +1,98 @@
+# backend/tests/test_job_store.py
+import asyncio
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from app.services import job_store, match_store
+from app.services.skill_index import SkillIndex
+
+
+def _jobs(n=24):
+    jobs = [{"title": f"Engineer {i}", "company": "Acme, Inc.", "location": "Berlin",
+             "description": f"Python and SQL, team {i}"} for i in range(n)]
+    # the first posting again, as another search returned it
+    jobs.append({"title": "engineer 0", "company": "ACME Inc", "location": " berlin ",
+                 "description": "Python and SQL, team 0"})
+    return jobs
+
+
+@pytest.fixture
+def store(mongo, monkeypatch):
+    """store_jobs against mongomock with extraction, the skill index and match refreshes stubbed."""
+    extracted = []
+
+    async def extract(texts, **kwargs):
+        extracted.extend(texts)
+        return [[w for w in ("python", "sql", "go") if w in text.lower()] for text in texts]
+
+    monkeypatch.setattr(job_store, "extract_skills_batch_cached", extract)
+    monkeypatch.setattr(job_store, "skill_index", SkillIndex())
+    monkeypatch.setattr(match_store, "schedule_job_refresh", lambda ids: None)
+    asyncio.run(job_store.ensure_indexes())
+    return extracted
+
+
+def test_fingerprint_dedupe_counts(mongo, store):
+    first = asyncio.run(job_store.store_jobs(_jobs()))
+    assert (first["inserted"], first["updated"], first["skipped"]) == (24, 0, 1)
+    assert len(store) == 24
+
+    again = asyncio.run(job_store.store_jobs(_jobs()))
+    assert (again["inserted"], again["updated"], again["skipped"]) == (0, 0, 25)
+    assert len(store) == 24   # nothing re-extracted
+    assert asyncio.run(mongo.jobs.count_documents({})) == 24
+
+
+def test_changed_description_is_reextracted(mongo, store):
+    asyncio.run(job_store.store_jobs(_jobs()))
+    store.clear()
+    jobs = _jobs()
+    jobs[3]["description"] = "Go now, team 3"
+
+    summary = asyncio.run(job_store.store_jobs(jobs))
+
+    assert (summary["inserted"], summary["updated"], summary["skipped"]) == (0, 1, 24)
+    assert store == [job_store.job_text(jobs[3])]
+    doc = asyncio.run(mongo.jobs.find_one({"fingerprint": job_store.job_fingerprint(jobs[3])}))
+    assert doc["skills"] == ["go"]
+    assert summary["updated_ids"] == [str(doc["_id"])]
+    assert job_store.skill_index.top_k(["go"]) == [(str(doc["_id"]), 1)]
+
+
+def test_lost_insert_race_is_retried_as_an_update(mongo, store, monkeypatch):
+    jobs = _jobs(3)[:-1]   # without the repeated posting
+    rival = dict(jobs[0], fingerprint=job_store.job_fingerprint(jobs[0]), skills=[])
+    real = job_store.db.jobs
+
+    class Racing:
+        """db.jobs whose first bulk_write loses op 0 to another fetcher's insert, like Mongo would."""
+        calls = 0
+
+        def __getattr__(self, name):
+            return getattr(real, name)
+
+        async def bulk_write(self, ops, ordered=True):
+            Racing.calls += 1
+            if Racing.calls > 1:
+                return await real.bulk_write(ops, ordered=ordered)
+            await real.insert_one(rival)
+            result = await real.bulk_write(ops[1:], ordered=ordered)
+            raise BulkWriteError({
+                "writeErrors": [{"index": 0, "code": job_store.DUPLICATE_KEY, "errmsg": "E11000"}],
+                "upserted": [{"index": i + 1, "_id": _id} for i, _id in sorted(result.upserted_ids.items())],
+            })
+
+    class Db:
+        jobs = Racing()
+
+    monkeypatch.setattr(job_store, "db", Db())
+
+    summary = asyncio.run(job_store.store_jobs(jobs))
+
+    assert (summary["inserted"], summary["updated"], summary["skipped"]) == (2, 1, 0)
+    assert Racing.calls == 2
+    assert asyncio.run(mongo.jobs.count_documents({})) == 3
+    doc = asyncio.run(mongo.jobs.find_one({"fingerprint": rival["fingerprint"]}))
+    assert doc["skills"] == ["python", "sql"]   # the retry overwrote the rival's copy
+    assert summary["updated_ids"] == [str(doc["_id"])]
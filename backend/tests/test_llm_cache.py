@@ -0,0 +1,109 @@
+# backend/tests/test_llm_cache.py
+import asyncio
+
+import pytest
+
+from app.services import llm_cache
+
+
+def _counter():
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return f"value {len(calls)}"
+
+    return compute, calls
+
+
+def _age(store, key, seconds):
+    store[key]["created_at"] -= seconds
+
+
+def test_fresh_hit_then_miss_after_ttl(llm_cache_store, monkeypatch):
+    monkeypatch.setattr(llm_cache, "LLM_CACHE_SWR", False)
+    compute, calls = _counter()
+
+    async def run():
+        first = await llm_cache.cached_call("k", compute)
+        again = await llm_cache.cached_call("k", compute)
+        _age(llm_cache_store, "k", llm_cache.LLM_CACHE_TTL + 1)
+        expired = await llm_cache.cached_call("k", compute)
+        return first, again, expired
+
+    assert asyncio.run(run()) == ("value 1", "value 1", "value 2")
+    assert len(calls) == 2
+
+
+def test_stale_entry_is_served_and_refreshed_once(llm_cache_store, monkeypatch):
+    monkeypatch.setattr(llm_cache, "LLM_CACHE_SWR", True)
+    compute, calls = _counter()
+
+    async def run():
+        await llm_cache.cached_call("k", compute)
+        _age(llm_cache_store, "k", llm_cache.LLM_CACHE_TTL + 1)
+        # every stale reader gets the old value at once; one refresh runs behind them
+        stale = await asyncio.gather(*(llm_cache.cached_call("k", compute) for _ in range(10)))
+        await asyncio.gather(*llm_cache._tasks)
+        return stale, await llm_cache.get("k")
+
+    stale, refreshed = asyncio.run(run())
+    assert stale == ["value 1"] * 10
+    assert refreshed == "value 2"
+    assert len(calls) == 2
+
+
+def test_stale_window_ends(llm_cache_store, monkeypatch):
+    monkeypatch.setattr(llm_cache, "LLM_CACHE_SWR", True)
+    compute, calls = _counter()
+
+    async def run():
+        await llm_cache.cached_call("k", compute)
+        _age(llm_cache_store, "k", llm_cache.LLM_CACHE_TTL + llm_cache.LLM_CACHE_STALE_TTL + 1)
+        assert await llm_cache.get("k", compute) is None
+        return await llm_cache.cached_call("k", compute)
+
+    assert asyncio.run(run()) == "value 2"
+    assert not llm_cache._tasks and len(calls) == 2
+
+
+def test_failed_refresh_keeps_the_stale_value(llm_cache_store, monkeypatch):
+    monkeypatch.setattr(llm_cache, "LLM_CACHE_SWR", True)
+
+    async def fail():
+        raise RuntimeError("upstream down")
+
+    async def run():
+        await llm_cache.put("k", "old")
+        _age(llm_cache_store, "k", llm_cache.LLM_CACHE_TTL + 1)
+        assert await llm_cache.get("k", fail) == "old"
+        await asyncio.gather(*llm_cache._tasks)
+        return await llm_cache.get("k")
+
+    assert asyncio.run(run()) == "old"
+    assert not llm_cache._refreshing
+
+
+def test_errors_are_not_cached(llm_cache_store):
+    async def fail():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(llm_cache.cached_call("k", fail))
+    assert "k" not in llm_cache_store
+
+
+def test_mongo_tier_survives_a_restart(mongo, monkeypatch):
+    from app.services.cache import TTLCache
+
+    monkeypatch.setattr(llm_cache, "_memory", TTLCache(maxsize=8, ttl=60))
+    compute, calls = _counter()
+
+    async def run():
+        await llm_cache.cached_call("k", compute, kind="test")
+        llm_cache._memory.clear()   # a new process: only Mongo has it
+        return await llm_cache.get("k"), await mongo[llm_cache.COLLECTION].find_one({"_id": "k"})
+
+    value, doc = asyncio.run(run())
+    assert value == "value 1" and len(calls) == 1
+    assert doc["kind"] == "test"
@@ -0,0 +1,64 @@
+# backend/tests/test_news.py
+import asyncio
+
+import pytest
+
+from app.services import news_service
+
+
+def _expire(key):
+    entry = news_service._cache.get(key)
+    entry["fetched_at"] -= news_service.NEWS_CACHE_TTL + 1
+
+
+def test_upstream_error_serves_stale_items(stub_news):
+    async def run():
+        items, meta = await news_service.get_news("Python jobs", 5)
+        assert meta["cache"] == "miss" and len(items) == 5
+        _expire("python jobs")
+        stub_news.stop()
+
+        stale, meta = await news_service.get_news("python  JOBS", 5)
+        await news_service.stop()
+        return items, stale, meta
+
+    items, stale, meta = asyncio.run(run())
+    assert meta["cache"] == "stale"
+    assert stale == items
+
+
+def test_upstream_error_serves_a_smaller_cached_page(stub_news, monkeypatch):
+    monkeypatch.setattr(news_service, "NEWS_PAGE_SIZE", 5)
+
+    async def run():
+        await news_service.get_news("rust", 5)
+        stub_news.stop()
+        # wants more than was fetched: the refetch fails, the 5 cached items still come back
+        items, meta = await news_service.get_news("rust", 10)
+        await news_service.stop()
+        return items, meta
+
+    items, meta = asyncio.run(run())
+    assert meta["cache"] == "stale"
+    assert len(items) == 5
+
+
+def test_upstream_error_without_cache_raises(stub_news):
+    stub_news.stop()
+
+    async def run():
+        try:
+            await news_service.get_news("go", 5)
+        finally:
+            await news_service.stop()
+
+    with pytest.raises(news_service.NewsUnavailable):
+        asyncio.run(run())
+
+
+def test_requested_queries_are_bounded(stub_news, monkeypatch):
+    monkeypatch.setattr(news_service, "NEWS_CACHE_SIZE", 3)
+    for key in ("a", "b", "c", "a", "d", "e"):
+        news_service._track(key)
+
+    assert news_service.hot_queries() == ["e", "d", "a"]
@@ -0,0 +1,30 @@
+# backend/tests/test_roadmap_batch.py
+import asyncio
+
+from app.services import roadmap_agent
+
+SKILLS = ["Docker", "docker", "Kafka", "Go", "Rust"]
+
+
+def test_timeout_applies_per_skill_not_per_batch(stub_llm, llm_cache_store):
+    # four one-at-a-time calls of 0.3s each: well past one timeout in total
+    results = asyncio.run(roadmap_agent.generate_skill_roadmaps(SKILLS, concurrency=1, timeout=0.6))
+
+    assert [r["skill"] for r in results] == ["Docker", "Kafka", "Go", "Rust"]
+    assert {r["status"] for r in results} == {"generated"}
+    assert stub_llm.calls == 4
+    assert len(llm_cache_store) == 4
+
+
+def test_timed_out_skills_finish_into_the_cache(stub_llm, llm_cache_store):
+    async def run():
+        first = await roadmap_agent.generate_skill_roadmaps(SKILLS, concurrency=2, timeout=0.05)
+        await asyncio.sleep(stub_llm.latency * 2)
+        return first, await roadmap_agent.generate_skill_roadmaps(SKILLS, concurrency=2, timeout=0.05)
+
+    first, second = asyncio.run(run())
+
+    assert {r["status"] for r in first} == {"timeout"}
+    assert all(r["detail"] is None for r in first)
+    assert {r["status"] for r in second} == {"cached"}
+    assert stub_llm.calls == 4
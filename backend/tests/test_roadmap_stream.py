@@ -0,0 +1,53 @@
+# backend/tests/test_roadmap_stream.py
+import asyncio
+import time
+
+import openai  # noqa: F401  imported up front so the SDK's import time isn't measured
+
+from app.services import roadmap_agent
+
+
+async def _events(skill):
+    start = time.perf_counter()
+    return [(event, data, time.perf_counter() - start)
+            async for event, data in roadmap_agent.stream_skill_roadmap(skill)]
+
+
+def test_first_section_arrives_before_done(stub_llm, llm_cache_store):
+    stub_llm.latency, stub_llm.first_token = 2.0, 0.05
+
+    events = asyncio.run(_events("Terraform"))
+
+    kinds = [event for event, _, _ in events]
+    assert kinds[-1] == "done" and kinds.count("done") == 1
+    first_section = next(at for event, _, at in events if event == "section")
+    done_at = events[-1][2]
+    assert first_section < done_at
+    # well before the whole completion has been generated
+    assert first_section < stub_llm.latency / 2 < done_at
+    assert events[0][1]["key"] == "summary"
+    assert set(events[-1][1]) == {data["key"] for event, data, _ in events if event == "section"}
+
+
+def test_concurrent_identical_streams_make_one_llm_call(stub_llm, llm_cache_store):
+    async def burst():
+        return await asyncio.gather(*(_events("Terraform") for _ in range(20)))
+
+    results = asyncio.run(burst())
+
+    assert stub_llm.calls == 1
+    details = [events[-1][1] for events in results]
+    assert all(d == details[0] for d in details)
+    # the complete stream was cached as the parsed roadmap
+    assert [entry["value"] for entry in llm_cache_store.values()] == [details[0]]
+
+
+def test_cached_text_roadmap_is_streamed_without_llm_call(stub_llm, llm_cache_store):
+    _, key = roadmap_agent.skill_roadmap_prompt("Terraform")
+    llm_cache_store[key] = {"value": "Learn HCL, then providers and modules.", "created_at": time.time()}
+
+    events = asyncio.run(_events("Terraform"))
+
+    assert stub_llm.calls == 0
+    assert events[0][:2] == ("section", {"key": "summary", "value": "Learn HCL, then providers and modules."})
+    assert events[-1][0] == "done"
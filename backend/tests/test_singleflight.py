@@ -0,0 +1,75 @@
+# backend/tests/test_singleflight.py
+import asyncio
+
+from bson import ObjectId
+
+from app.services import match_store, matcher, roadmap_agent
+
+BURST = 100
+
+
+def test_concurrent_skill_roadmaps_make_one_llm_call(stub_llm, llm_cache_store):
+    async def burst():
+        return await asyncio.gather(*(roadmap_agent.generate_skill_roadmap_agent("Kubernetes")
+                                      for _ in range(BURST)))
+
+    results = asyncio.run(burst())
+
+    assert stub_llm.calls == 1
+    assert results[0] != roadmap_agent.skill_roadmap_fallback()
+    assert all(r == results[0] for r in results)
+    assert len(llm_cache_store) == 1
+
+
+class _Collection:
+    def __init__(self, docs=()):
+        self.docs = {d["_id"]: d for d in docs}
+        self.lookups = 0
+        self.written = []
+
+    async def find_one(self, query, projection=None):
+        self.lookups += 1
+        await asyncio.sleep(0.01)   # a round trip, so the burst overlaps
+        return self.docs.get(query.get("_id"))
+
+    async def bulk_write(self, ops, ordered=True):
+        self.written.extend(ops)
+
+
+class _Database:
+    def __init__(self, **collections):
+        self.collections = collections
+
+    def __getattr__(self, name):
+        return self.collections[name]
+
+    def __getitem__(self, name):
+        return self.collections[name]
+
+
+def test_concurrent_get_match_computes_once(monkeypatch):
+    resume = {"_id": ObjectId(), "skills": ["python", "sql", "docker"]}
+    job = {"_id": ObjectId(), "skills": ["python", "kubernetes"], "title": "Backend Engineer"}
+    fake = _Database(matches=_Collection(), resumes=_Collection([resume]), jobs=_Collection([job]))
+    monkeypatch.setattr(match_store, "db", fake)
+
+    computed = []
+    compute_match = matcher.compute_match
+
+    def counting(resume_skills, job_skills):
+        computed.append(1)
+        return compute_match(resume_skills, job_skills)
+
+    monkeypatch.setattr(matcher, "compute_match", counting)
+
+    async def burst():
+        return await asyncio.gather(*(match_store.get_match(str(resume["_id"]), str(job["_id"]))
+                                      for _ in range(BURST)))
+
+    results = asyncio.run(burst())
+
+    assert len(computed) == 1
+    assert fake.matches.lookups == 1 and fake.resumes.lookups == 1 and fake.jobs.lookups == 1
+    assert len(fake.matches.written) == 1
+    assert all(r is results[0] for r in results)
+    assert results[0]["matched"] == ["python"]
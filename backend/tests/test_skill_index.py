@@ -0,0 +1,49 @@
+# backend/tests/test_skill_index.py
+import asyncio
+
+from app.services import skill_index as skill_index_module
+from app.services.skill_index import SkillIndex, sync_skill_index
+
+
+def test_compact_drops_tombstones_and_keeps_results():
+    index = SkillIndex()
+    index.add_jobs([(f"j{i}", ["python", "sql"] if i % 2 else ["go"]) for i in range(10)])
+    for i in range(0, 10, 3):
+        index.add_job(f"j{i}", ["python", "rust"])   # updated: old slot tombstoned
+    index.remove_job("j1")
+    before = index.top_k(["python", "rust", "go"], k=10)
+
+    assert index.needs_compaction()
+    index.compact()
+
+    assert not index.needs_compaction()
+    assert len(index._job_ids) == len(index) == 9
+    assert index.top_k(["python", "rust", "go"], k=10) == before
+
+
+def test_sync_compacts_past_the_ratio(mongo):
+    async def run():
+        await mongo.jobs.insert_many([{"_id": f"j{i}", "skills": ["python"]} for i in range(8)])
+        index = await sync_skill_index(SkillIndex())
+        for i in range(4):
+            index.remove_job(f"j{i}")
+        await sync_skill_index(index)
+        return index
+
+    index = asyncio.run(run())
+    assert index._dead == 0 and len(index._job_ids) == 4
+    assert [j for j, _ in index.top_k(["python"])] == ["j4", "j5", "j6", "j7"]
+
+
+def test_index_is_built_at_startup(mongo, monkeypatch):
+    index = SkillIndex()
+    monkeypatch.setattr(skill_index_module, "skill_index", index)
+
+    async def run():
+        await mongo.jobs.insert_one({"_id": "j1", "skills": ["python"]})
+        skill_index_module.start()
+        await skill_index_module._builder
+        await skill_index_module.stop()
+
+    asyncio.run(run())
+    assert index.ready and len(index) == 1
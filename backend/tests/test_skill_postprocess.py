@@ -0,0 +1,31 @@
+# backend/tests/test_skill_postprocess.py
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import skill_extractor
+
+GOLDEN = os.path.join(os.path.dirname(__file__), "data", "skill_postprocess_golden.json")
+
+with open(GOLDEN, encoding="utf-8") as f:
+    CASES = json.load(f)
+
+
+def _doc(case):
+    """The parts of a spaCy Doc the post-processing reads, as recorded in the fixture."""
+    return SimpleNamespace(
+        ents=[SimpleNamespace(text=text, label_=label) for text, label in case["ents"]],
+        noun_chunks=[SimpleNamespace(text=text) for text in case["noun_chunks"]],
+    )
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case["text"][:30] for case in CASES])
+def test_skills_match_golden(case):
+    skills = skill_extractor.skills_from_doc(case["text"], _doc(case))
+
+    assert skill_extractor.find_skills_section(case["text"])[2] == case["section"]
+    # output order follows set iteration (hash seeded), so compare as sorted lists
+    assert sorted(skills) == case["skills"]
+    assert len(skills) == len(set(skills))
@@ -0,0 +1,27 @@
+# backend/tests/test_skill_vocab.py
+import asyncio
+
+from app.services.skill_vocab import SkillVocab
+
+
+def test_encode_many_allocates_a_batch_in_one_pass(mongo, monkeypatch):
+    vocab = SkillVocab()
+    loads = []
+    load = vocab._load
+
+    async def counting_load(query):
+        loads.append(query)
+        await load(query)
+
+    monkeypatch.setattr(vocab, "_load", counting_load)
+
+    ids = asyncio.run(vocab.encode_many([["Python", "sql"], ["go", "python"], [], ["sql", ["Rust"]]]))
+
+    assert [vocab.decode(i) for i in ids] == [["python", "sql"], ["python", "go"], [], ["sql", "rust"]]
+    assert len(loads) == 1
+    assert asyncio.run(mongo.counters.find_one({"_id": "skill_vocab"}))["seq"] == 4
+
+    # another process sees the same ids without allocating
+    other = SkillVocab()
+    assert asyncio.run(other.encode_many([["rust", "python"]])) == [sorted([ids[3][1], ids[0][0]])]
+    assert asyncio.run(mongo.counters.find_one({"_id": "skill_vocab"}))["seq"] == 4
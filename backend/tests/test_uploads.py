@@ -0,0 +1,54 @@
+# backend/tests/test_uploads.py
+import asyncio
+
+import httpx
+
+from app.main import app
+from app.services import uploads
+
+LIMIT = uploads.MAX_UPLOAD_BYTES + uploads.MULTIPART_OVERHEAD
+CHUNK = 1024 * 1024
+
+
+def _post(content, headers):
+    async def post():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/resume/upload", content=content, headers=headers)
+
+    return asyncio.run(post())
+
+
+def _multipart(size):
+    """A multipart body of roughly `size` bytes, as a stream; records how much was sent."""
+    sent = []
+
+    async def body():
+        yield b'--x\r\nContent-Disposition: form-data; name="file"; filename="big.pdf"\r\n\r\n'
+        while sum(sent) < size:
+            sent.append(CHUNK)
+            yield b"\0" * CHUNK
+        yield b"\r\n--x--\r\n"
+
+    return body(), sent
+
+
+def test_declared_oversized_body_is_refused_unread():
+    body, sent = _multipart(LIMIT + CHUNK)
+    headers = {"content-type": "multipart/form-data; boundary=x", "content-length": str(LIMIT + CHUNK)}
+
+    r = _post(body, headers)
+
+    assert r.status_code == 413
+    assert sent == []
+
+
+def test_streamed_oversized_body_is_cut_off_at_the_limit():
+    body, sent = _multipart(2 * LIMIT)
+
+    r = _post(body, {"content-type": "multipart/form-data; boundary=x"})
+
+    assert r.status_code == 413
+    assert "limit" in r.json()["detail"]
+    # stopped reading within a chunk of the limit, not at the end of the body
+    assert sum(sent) <= LIMIT + CHUNK